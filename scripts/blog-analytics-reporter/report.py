@@ -42,6 +42,7 @@ if _dotenv_path.is_file():
 
 # ── Imports (after healthcheck setup) ────────────────────────
 import argparse
+import functools
 import logging
 from datetime import datetime, timedelta
 
@@ -114,8 +115,9 @@ SCOPES = [
 ]
 
 
+@functools.lru_cache(maxsize=1)
 def get_google_credentials() -> service_account.Credentials:
-    """Google 서비스 계정 인증 정보 로드."""
+    """Google 서비스 계정 인증 정보 로드 (GA4/GSC 공용, 프로세스당 1회)."""
     sa_path = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "")
     return service_account.Credentials.from_service_account_file(sa_path, scopes=SCOPES)
 
@@ -182,7 +184,10 @@ def fetch_gsc_data(start_date: str, end_date: str) -> dict[str, dict]:
         {slug: {clicks, impressions, ctr, position}}
     """
     credentials = get_google_credentials()
-    gsc_service = build("searchconsole", "v1", credentials=credentials)
+    gsc_service = build(
+        "searchconsole", "v1", credentials=credentials,
+        static_discovery=True, cache_discovery=False,
+    )
     site_url = os.getenv("GSC_SITE_URL", "")
 
     body = {
@@ -3,15 +3,39 @@ from __future__ import annotations
 
 import logging
 import os
-from datetime import datetime, timezone
-from typing import Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
 
 from apify_client import ApifyClient
+from apify_client.errors import ApifyApiError
 
-from config import APIFY_ACTOR_ID
+from identity import canonical_post_key
+from metrics_provider import ProviderUnavailableError
+from config import (
+    APIFY_ACTOR_ID,
+    APIFY_API_URL,
+    APIFY_BATCH_RETRIES,
+    APIFY_RETRY_BACKOFF_SECONDS,
+    METRICS_CACHE_MAX_AGE_HOURS,
+)
+
+if TYPE_CHECKING:
+    from batch_tuner import BatchTuner
+    from metrics_cache import MetricsCache
+    from metrics_provider import MetricsProvider
 
 logger = logging.getLogger(__name__)
 
+# collection_status 값
+STATUS_COLLECTED = "collected"  # 지표 수집 성공 (캐시 재사용 포함)
+STATUS_FAILED = "failed"        # 재시도/분할 후에도 Actor run 실패
+STATUS_MISSING = "missing"      # run 은 성공했으나 결과에 URL 없음 (삭제/비공개 등)
+
+# 입력 URL 과 무관한 계정 단위 오류 (인증 실패, 결제/사용량 한도, 권한, 요청 한도)
+_ACCOUNT_ERROR_STATUS_CODES = frozenset({401, 402, 403, 429})
+
 
 def parse_apify_result(raw: dict) -> dict:
     """Apify Instagram Post Scraper 결과에서 핵심 지표 추출.
@@ -36,74 +60,295 @@ def parse_apify_result(raw: dict) -> dict:
     }
 
 
-def _normalize_url(url: str) -> str:
-    """URL 끝 슬래시 제거 및 소문자 통일"""
-    return url.rstrip("/").lower()
-
-
 def _default_metrics() -> dict:
-    """실패/누락 시 기본값 딕셔너리"""
+    """지표 기본값 딕셔너리"""
     return {"views": 0, "likes": 0, "shares": 0, "comments": 0}
 
 
+def _unresolved_metrics() -> dict:
+    """수집 실패/누락 시 지표 — 실제 0과 구분되도록 None"""
+    return dict.fromkeys(_default_metrics())
+
+
+def _as_dict(run: Any) -> dict:
+    """Actor run 응답을 camelCase dict 로 통일 (apify-client 3.x 는 pydantic 모델 반환)"""
+    if isinstance(run, dict):
+        return run
+    return run.model_dump(by_alias=True, mode="json")
+
+
+def _run_batch(
+    client: ApifyClient, urls: list[str], parallel: bool
+) -> tuple[list[dict], dict]:
+    """URL 배치로 Actor를 1회 실행하고 (데이터셋 아이템, run 정보)를 반환합니다.
+
+    parallel=False 면 .call() 로 실행 완료까지 대기하고,
+    parallel=True 면 .start() 후 run 단위로 완료를 기다립니다
+    (다른 배치 run 들과 동시에 진행되도록).
+    """
+    run_input = {
+        "directUrls": urls,
+        "resultsLimit": len(urls),
+    }
+    actor = client.actor(APIFY_ACTOR_ID)
+    if parallel:
+        started = _as_dict(actor.start(run_input=run_input))
+        run = _as_dict(client.run(started["id"]).wait_for_finish())
+    else:
+        run = _as_dict(actor.call(run_input=run_input))
+
+    status = run.get("status")
+    if status and status != "SUCCEEDED":
+        raise RuntimeError(f"Apify run {run.get('id')} 종료 상태: {status}")
+
+    dataset_id = run["defaultDatasetId"]
+    return client.dataset(dataset_id).list_items().items, run
+
+
+class ApifyProvider:
+    """Apify Instagram Post Scraper 기반 MetricsProvider 구현
+
+    api_url 을 fake_apify_server 주소로 주면 토큰 없이 로컬에서 실행됩니다.
+    """
+
+    def __init__(
+        self,
+        parallel: bool = False,
+        api_token: str | None = None,
+        api_url: str | None = APIFY_API_URL,
+    ) -> None:
+        """
+        Args:
+            parallel: True 면 .start() + run 단위 대기 (다른 배치 run 과 동시 진행)
+            api_token: Apify API 토큰 (None이면 APIFY_API_TOKEN 환경 변수)
+            api_url: Apify API 주소 (None이면 기본 https://api.apify.com)
+        """
+        if api_token is None:
+            api_token = os.environ.get("APIFY_API_TOKEN", "")
+        kwargs = {"api_url": api_url} if api_url else {}
+        self._client = ApifyClient(api_token, **kwargs)
+        self._parallel = parallel
+
+    def fetch_batch(self, urls: list[str]) -> tuple[dict[str, dict], float | None]:
+        """Actor 를 1회 실행해 포스트 키 → 지표 매핑과 compute unit 을 반환합니다.
+
+        결과 url 이 입력과 다른 형태(/p/ ↔ /reel/)여도 매칭되도록 url 의 포스트 키와
+        shortCode 를 모두 키로 등록합니다.
+        """
+        try:
+            items, run = _run_batch(self._client, urls, self._parallel)
+        except ApifyApiError as exc:
+            if exc.status_code in _ACCOUNT_ERROR_STATUS_CODES:
+                raise ProviderUnavailableError(f"Apify API {exc.status_code}: {exc}") from exc
+            raise
+        key_to_metrics: dict[str, dict] = {}
+        for item in items:
+            metrics = parse_apify_result(item)
+            if item.get("url"):
+                key_to_metrics[canonical_post_key(item["url"])] = metrics
+            if item.get("shortCode"):
+                key_to_metrics.setdefault(item["shortCode"], metrics)
+        return key_to_metrics, (run.get("stats") or {}).get("computeUnits")
+
+
+def _apply_metrics(batch: list[dict], key_to_metrics: dict[str, dict]) -> list[dict]:
+    """포스트 키 → 지표 매핑을 배치 엔트리에 반영합니다.
+
+    Returns:
+        지표가 반영된 엔트리 리스트
+    """
+    collected_at = datetime.now(timezone.utc).isoformat()
+    matched: list[dict] = []
+    for entry in batch:
+        key = canonical_post_key(entry["post_url"])
+        if key in key_to_metrics:
+            entry.update(key_to_metrics[key])
+            entry["collected_at"] = collected_at
+            matched.append(entry)
+        else:
+            logger.warning("수집 결과에서 URL 미매칭: %s", entry["post_url"])
+    return matched
+
+
+def _collect_batch(
+    provider: "MetricsProvider",
+    batch: list[dict],
+    retries: int,
+    backoff_seconds: float,
+    tuner: "BatchTuner | None" = None,
+) -> tuple[list[dict], list[dict]]:
+    """배치를 수집하고, 실패하면 지수 백오프로 재시도한 뒤 반씩 나눠 다시 수집합니다.
+
+    일시 오류는 재시도로 복구하고, 계속 실패하는 배치는 이분할하여
+    문제 URL만 실패로 남깁니다 (정상 URL 24건을 함께 버리지 않도록).
+    분할된 하위 배치는 재시도 없이 1회씩만 실행합니다.
+    인증/사용량 한도 같은 계정 단위 오류(ProviderUnavailableError)는 재시도와
+    분할 없이 배치 전체를 실패 처리합니다.
+    tuner 가 주어지면 성공한 조회의 소요 시간/compute unit 을 기록합니다.
+
+    Returns:
+        (지표가 반영된 엔트리 리스트, 실패한 엔트리 리스트) 튜플
+    """
+    urls = [e["post_url"] for e in batch]
+    for attempt in range(retries + 1):
+        started = time.monotonic()
+        try:
+            key_to_metrics, compute_units = provider.fetch_batch(urls)
+        except ProviderUnavailableError as exc:
+            logger.error("Apify 배치 %d건 실패 (계정 오류 — 분할하지 않음): %s", len(batch), exc)
+            return [], batch
+        except Exception as exc:
+            if attempt < retries:
+                delay = backoff_seconds * 2 ** attempt
+                logger.warning(
+                    "Apify 배치 실패 (%d건, %d/%d회) — %.0f초 후 재시도: %s",
+                    len(batch), attempt + 1, retries + 1, delay, exc,
+                )
+                time.sleep(delay)
+            else:
+                last_exc = exc
+            continue
+        if tuner is not None:
+            tuner.record(len(urls), time.monotonic() - started, compute_units)
+        return _apply_metrics(batch, key_to_metrics), []
+
+    if len(batch) == 1:
+        logger.error("Apify 수집 실패: %s (%s)", urls[0], last_exc)
+        return [], batch
+
+    logger.warning("Apify 배치 %d건 반복 실패 — 분할 재수집: %s", len(batch), last_exc)
+    mid = len(batch) // 2
+    matched: list[dict] = []
+    failed: list[dict] = []
+    for half in (batch[:mid], batch[mid:]):
+        m, f = _collect_batch(provider, half, 0, backoff_seconds, tuner)
+        matched.extend(m)
+        failed.extend(f)
+    return matched, failed
+
+
+def _apply_cached_metrics(
+    entries: list[dict], metrics_cache: "MetricsCache", max_age: timedelta
+) -> list[dict]:
+    """캐시에 신선한 지표가 있는 엔트리는 캐시 값으로 채우고, 나머지를 반환합니다."""
+    fresh = metrics_cache.get_fresh(
+        (canonical_post_key(e["post_url"]) for e in entries), max_age
+    )
+    pending: list[dict] = []
+    for entry in entries:
+        cached = fresh.get(canonical_post_key(entry["post_url"]))
+        if cached is None:
+            pending.append(entry)
+            continue
+        metrics, collected_at = cached
+        entry.update(metrics)
+        entry["collected_at"] = collected_at
+    return pending
+
+
+def _finalize(entries: list[dict]) -> list[dict]:
+    """모든 엔트리에 collection_status 를 기록합니다."""
+    for entry in entries:
+        if "collected_at" in entry:
+            entry["collection_status"] = STATUS_COLLECTED
+        else:
+            # 실패/URL 미매칭 엔트리는 0 대신 None 으로 표시
+            entry.setdefault("collection_status", STATUS_MISSING)
+            entry.update(_unresolved_metrics())
+
+    return entries
+
+
 def collect_ig_metrics(
     entries: list[dict],
     batch_size: int = 25,
+    max_concurrent_runs: int = 1,
+    metrics_cache: "MetricsCache | None" = None,
+    max_age: timedelta = timedelta(hours=METRICS_CACHE_MAX_AGE_HOURS),
+    retries: int = APIFY_BATCH_RETRIES,
+    backoff_seconds: float = APIFY_RETRY_BACKOFF_SECONDS,
+    tuner: "BatchTuner | None" = None,
+    provider: "MetricsProvider | None" = None,
 ) -> list[dict]:
     """Sheet Scanner 엔트리 목록에서 Instagram 성과 지표를 Apify로 수집.
 
+    max_concurrent_runs > 1 이면 배치별 Actor run 을 동시에 시작하고
+    (최대 max_concurrent_runs 개), 끝나는 run 부터 데이터셋을 가져옵니다.
+    전체 소요 시간이 배치 수가 아니라 가장 긴 run 수준으로 줄어듭니다.
+
+    metrics_cache 가 주어지면 max_age 이내에 수집된 URL은 캐시 값을 쓰고
+    오래되었거나 없는 URL만 Apify로 보냅니다. 새로 수집한 지표는 캐시에 저장합니다.
+
+    실패한 배치는 retries 회 재시도 후 이분할로 원인 URL을 격리합니다.
+    모든 엔트리에 collection_status(collected/failed/missing)를 기록하며,
+    수집하지 못한 엔트리의 지표는 0이 아닌 None 으로 둡니다.
+
+    tuner 가 주어지면 batch_size 대신 tuner 가 run 기록으로 고른 크기를 쓰고,
+    이번 run 들의 소요 시간/compute unit 을 tuner 에 기록합니다.
+
     Args:
         entries: post_url 키를 포함한 엔트리 딕셔너리 목록
         batch_size: 한 번에 Apify에 전송할 URL 수
+        max_concurrent_runs: 동시에 실행할 Actor run 수 (1 = 순차 실행)
+        metrics_cache: URL별 지표 캐시 (None이면 캐시 미사용)
+        max_age: 캐시 지표 허용 최대 경과 시간
+        retries: 배치 실패 시 재시도 횟수
+        backoff_seconds: 첫 재시도 대기 시간 (재시도마다 2배)
+        tuner: 배치 크기 자동 조정기 (None이면 batch_size 고정)
+        provider: 지표 조회 공급자 (None이면 ApifyProvider)
 
     Returns:
-        views/likes/shares/comments/collected_at 이 업데이트된 entries
+        views/likes/shares/comments/collected_at/collection_status 가 업데이트된 entries
     """
-    api_token = os.environ.get("APIFY_API_TOKEN", "")
-    client = ApifyClient(api_token)
+    pending = entries
+    if metrics_cache is not None:
+        pending = _apply_cached_metrics(entries, metrics_cache, max_age)
+        logger.info(
+            "지표 캐시: %d건 재사용, %d건 Apify 수집 대상",
+            len(entries) - len(pending), len(pending),
+        )
 
-    for batch_start in range(0, len(entries), batch_size):
-        batch = entries[batch_start : batch_start + batch_size]
-        urls = [e["post_url"] for e in batch]
+    if not pending:
+        return _finalize(entries)
 
-        try:
-            run = client.actor(APIFY_ACTOR_ID).call(
-                run_input={
-                    "directUrls": urls,
-                    "resultsLimit": len(batch),
-                }
-            )
-            dataset_id = run["defaultDatasetId"]
-            items = client.dataset(dataset_id).list_items().items
-
-            # URL → 지표 매핑 (정규화 키 사용)
-            url_to_metrics: dict[str, dict] = {}
-            for item in items:
-                item_url = item.get("url", "")
-                if item_url:
-                    key = _normalize_url(item_url)
-                    url_to_metrics[key] = parse_apify_result(item)
-
-            # 각 엔트리에 매핑
-            collected_at = datetime.now(timezone.utc).isoformat()
-            for entry in batch:
-                key = _normalize_url(entry["post_url"])
-                if key in url_to_metrics:
-                    entry.update(url_to_metrics[key])
-                    entry["collected_at"] = collected_at
-                else:
-                    logger.warning("Apify 결과에서 URL 미매칭: %s", entry["post_url"])
+    if tuner is not None:
+        batch_size = tuner.choose(len(pending), max_concurrent_runs)
 
-        except Exception as exc:
-            logger.error(
-                "Apify 배치 실패 (batch_start=%d): %s", batch_start, exc, exc_info=True
+    parallel = max_concurrent_runs > 1
+    if provider is None:
+        provider = ApifyProvider(parallel=parallel)
+
+    def process(batch_start: int) -> None:
+        batch = pending[batch_start : batch_start + batch_size]
+        matched, failed = _collect_batch(
+            provider, batch, retries, backoff_seconds, tuner
+        )
+        for entry in failed:
+            entry["collection_status"] = STATUS_FAILED
+        if metrics_cache is not None and matched:
+            metrics_cache.put_many(
+                (
+                    canonical_post_key(e["post_url"]),
+                    {k: e[k] for k in _default_metrics()},
+                    e["collected_at"],
+                )
+                for e in matched
             )
-            for entry in batch:
-                entry.update(_default_metrics())
 
-    # collected_at 없는 엔트리(매칭 실패)에 기본값 설정
-    for entry in entries:
-        if "collected_at" not in entry:
-            entry.update(_default_metrics())
+    started = time.monotonic()
+    batch_starts = range(0, len(pending), batch_size)
+    if parallel and len(batch_starts) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_concurrent_runs, len(batch_starts))) as pool:
+            list(pool.map(process, batch_starts))
+    else:
+        for batch_start in batch_starts:
+            process(batch_start)
+
+    elapsed = time.monotonic() - started
+    logger.info(
+        "지표 수집: %d건, 배치 크기 %d × %d run, %.1f초 (%.0f URLs/분)",
+        len(pending), batch_size, len(batch_starts), elapsed,
+        len(pending) / elapsed * 60 if elapsed > 0 else 0,
+    )
+    return _finalize(entries)
 
-    return entries
@@ -0,0 +1,153 @@
+"""Apify 배치 크기 자동 조정
+
+Actor run 마다 배치 URL 수, 소요 시간, compute unit 을 로컬 JSON 파일에
+기록하고, 누적된 기록으로
+
+    소요 시간 ≈ a + b × URL 수      (run 기동 오버헤드 + URL당 처리 시간)
+    compute unit ≈ c + d × URL 수
+
+를 추정합니다. 다음 수집에서는 URL당 compute unit 이 상한 이내인 배치 크기 중
+전체 소요 시간(동시 실행 라운드 수 × run 소요 시간)이 가장 짧은 크기를 고릅니다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 보관할 최근 run 기록 수
+HISTORY_LIMIT = 50
+
+# 추정에 필요한 최소 run 수 (서로 다른 배치 크기 2종 이상)
+MIN_SAMPLES = 3
+
+
+def _fit_line(points: list[tuple[float, float]]) -> tuple[float, float] | None:
+    """(x, y) 최소제곱 직선의 (절편, 기울기). x 가 모두 같으면 None."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return None
+    slope = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+    # 오버헤드/URL당 비용은 음수일 수 없음
+    slope = max(slope, 0.0)
+    intercept = max(mean_y - slope * mean_x, 0.0)
+    return intercept, slope
+
+
+class BatchTuner:
+    """run 기록 기반 배치 크기 선택기 (record 는 스레드 안전)"""
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        batch_size: int = 25,
+        min_size: int = 5,
+        max_size: int = 100,
+        max_compute_units_per_url: float | None = None,
+        history: list[dict] | None = None,
+    ) -> None:
+        self.path = path
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_compute_units_per_url = max_compute_units_per_url
+        self.batch_size = min(max(batch_size, min_size), max_size)
+        self._history: list[dict] = history or []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: Path, **kwargs) -> "BatchTuner":
+        """상태 파일을 읽어 반환합니다. 없거나 손상되면 기본값으로 시작."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("batch_size"):
+                kwargs["batch_size"] = int(data["batch_size"])
+            kwargs["history"] = list(data.get("history", []))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as exc:
+            logger.warning("배치 크기 상태 로드 실패 — 기본값 사용: %s", exc)
+        return cls(path, **kwargs)
+
+    def save(self) -> None:
+        """상태를 파일에 원자적으로 저장합니다."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with self._lock:
+            data = {"batch_size": self.batch_size, "history": self._history}
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def record(self, urls: int, duration_seconds: float, compute_units: float | None) -> None:
+        """성공한 Actor run 1건의 결과를 기록합니다."""
+        with self._lock:
+            self._history.append({
+                "urls": urls,
+                "duration_seconds": round(duration_seconds, 3),
+                "compute_units": compute_units,
+                "at": datetime.now(timezone.utc).isoformat(),
+            })
+            del self._history[:-HISTORY_LIMIT]
+
+    def _estimate(self) -> tuple[tuple[float, float] | None, tuple[float, float] | None]:
+        """(소요 시간 직선, compute unit 직선) 추정 — 기록이 부족하면 None"""
+        with self._lock:
+            history = list(self._history)
+        if len(history) < MIN_SAMPLES:
+            return None, None
+        duration = _fit_line([(h["urls"], h["duration_seconds"]) for h in history])
+        cu_points = [
+            (h["urls"], h["compute_units"])
+            for h in history
+            if h.get("compute_units") is not None
+        ]
+        cost = _fit_line(cu_points) if len(cu_points) >= MIN_SAMPLES else None
+        return duration, cost
+
+    def choose(self, total_urls: int, concurrency: int = 1) -> int:
+        """이번 수집에 쓸 배치 크기를 고릅니다.
+
+        Args:
+            total_urls: 이번에 수집할 URL 수
+            concurrency: 동시에 실행할 Actor run 수
+
+        Returns:
+            배치 크기 (min_size ~ max_size). 기록이 부족하면 마지막 값 유지.
+        """
+        duration, cost = self._estimate()
+        if duration is None or total_urls <= 0:
+            return self.batch_size
+
+        overhead, per_url = duration
+        lower = self.min_size
+        if cost is not None and self.max_compute_units_per_url is not None:
+            cu_overhead, cu_per_url = cost
+            headroom = self.max_compute_units_per_url - cu_per_url
+            # c/n + d ≤ 상한 → n ≥ c / (상한 - d)
+            lower = (
+                max(lower, math.ceil(cu_overhead / headroom))
+                if headroom > 0
+                else self.max_size
+            )
+        lower = min(lower, self.max_size)
+
+        def wall_time(size: int) -> float:
+            rounds = math.ceil(total_urls / (size * max(concurrency, 1)))
+            return rounds * (overhead + per_url * min(size, total_urls))
+
+        # 소요 시간이 같으면 run 수가 적은(큰) 배치가 저렴
+        best = min(range(lower, self.max_size + 1), key=lambda n: (wall_time(n), -n))
+        self.batch_size = best
+        return best
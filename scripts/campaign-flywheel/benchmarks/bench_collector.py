@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""collect_ig_metrics 부하 벤치마크 — 로컬 fake Apify 서버 사용 (토큰 불필요)
+
+실제 apify-client 로 fake_apify_server 에 run 을 시작/대기/조회하며,
+동시 run 수별 전체 소요 시간, 처리량, run 수(재시도·분할 포함),
+수집 상태 분포를 비교합니다.
+
+Usage:
+    python benchmarks/bench_collector.py [--urls 500] [--concurrency 1,2,5,10]
+        [--batch-size 25] [--latency 1.0] [--per-url-latency 0.02]
+        [--failure-rate 0.1] [--missing-rate 0.02]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apify_collector import ApifyProvider, collect_ig_metrics
+from fake_apify_server import FakeApifyServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--urls", type=int, default=500)
+    parser.add_argument("--concurrency", default="1,2,5,10")
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--per-url-latency", type=float, default=0.02)
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--missing-rate", type=float, default=0.02)
+    parser.add_argument("--backoff", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # 배치 실패/분할 경고는 결과 표만 보이도록 숨김
+    logging.basicConfig(level=logging.CRITICAL)
+
+    print(
+        f"{'concurrency':>11} {'wall(s)':>8} {'URLs/min':>9} {'runs':>5} "
+        f"{'collected':>9} {'missing':>7} {'failed':>6}"
+    )
+    for concurrency in (int(c) for c in args.concurrency.split(",")):
+        server = FakeApifyServer(
+            run_latency=args.latency,
+            per_url_latency=args.per_url_latency,
+            failure_rate=args.failure_rate,
+            missing_rate=args.missing_rate,
+            seed=args.seed,
+        )
+        with server:
+            # start + wait_for_finish 경로 (운영 기본값과 동일, .call() 로그 스트리밍 제외)
+            provider = ApifyProvider(parallel=True, api_token="fake", api_url=server.url)
+            entries = [
+                {"post_url": f"https://www.instagram.com/reel/BENCH{i:06d}/"}
+                for i in range(args.urls)
+            ]
+            started = time.perf_counter()
+            collect_ig_metrics(
+                entries,
+                batch_size=args.batch_size,
+                max_concurrent_runs=concurrency,
+                backoff_seconds=args.backoff,
+                provider=provider,
+            )
+            elapsed = time.perf_counter() - started
+            runs = server.runs_started
+
+        status = Counter(e["collection_status"] for e in entries)
+        print(
+            f"{concurrency:>11} {elapsed:>8.2f} {args.urls / elapsed * 60:>9.0f} {runs:>5} "
+            f"{status['collected']:>9} {status['missing']:>7} {status['failed']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
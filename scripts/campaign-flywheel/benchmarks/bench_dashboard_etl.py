@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""parse_all_dashboard_rows 마이크로 벤치마크
+
+합성 100,000행 Dashboard 탭에서 기존(행마다 parse_dashboard_row, 셀마다
+re.sub/re.search) 구현과 칼럼 단위 구현을 비교합니다. 두 구현의 결과가
+같은지도 확인합니다. 필요한 칼럼만 UNFORMATTED_VALUE/SERIAL_NUMBER 로 받은
+경우(SheetsClient.read_columns)의 parse_dashboard_columns 도 함께 측정합니다.
+
+Usage:
+    python benchmarks/bench_dashboard_etl.py [--rows 100000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from config import DashboardCol
+from dashboard_etl import (
+    DASHBOARD_COLUMNS,
+    _SHEETS_EPOCH,
+    parse_all_dashboard_rows,
+    parse_dashboard_columns,
+    parse_date,
+)
+
+_COLS = 22
+
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준)
+# ---------------------------------------------------------------------------
+
+def _legacy_safe_get(row: list, idx: int) -> str:
+    try:
+        return str(row[idx]).strip()
+    except (IndexError, TypeError):
+        return ""
+
+
+def _legacy_money(raw: str | None) -> float:
+    if not raw:
+        return 0.0
+    cleaned = re.sub(r"[₩¥$,\s]", "", raw)
+    if not cleaned:
+        return 0.0
+    try:
+        return float(cleaned)
+    except ValueError:
+        return 0.0
+
+
+def _legacy_date(raw: str | None) -> str | None:
+    if not raw:
+        return None
+    m = re.search(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})", raw)
+    if not m:
+        return None
+    return f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"
+
+
+def legacy_parse(rows: list[list]) -> list[dict]:
+    records = []
+    for row in rows[1:]:
+        code = _legacy_safe_get(row, DashboardCol.CODE)
+        brand = _legacy_safe_get(row, DashboardCol.BRAND_NAME)
+        if not code or not brand:
+            continue
+        records.append({
+            "campaign_code":       code,
+            "company_name":        _legacy_safe_get(row, DashboardCol.COMPANY_NAME),
+            "brand_name":          brand,
+            "campaign_type":       _legacy_safe_get(row, DashboardCol.CAMPAIGN_TYPE),
+            "media":               _legacy_safe_get(row, DashboardCol.MEDIA),
+            "contract_amount_krw": _legacy_money(_legacy_safe_get(row, DashboardCol.CONTRACT_KRW)),
+            "contract_amount_jpy": _legacy_money(_legacy_safe_get(row, DashboardCol.CONTRACT_JPY)),
+            "contract_amount_usd": _legacy_money(_legacy_safe_get(row, DashboardCol.CONTRACT_USD)),
+            "cost_krw":            _legacy_money(_legacy_safe_get(row, DashboardCol.COST_KRW)),
+            "cost_jpy":            _legacy_money(_legacy_safe_get(row, DashboardCol.COST_JPY)),
+            "margin_krw":          _legacy_money(_legacy_safe_get(row, DashboardCol.MARGIN_KRW)),
+            "status":              _legacy_safe_get(row, DashboardCol.STATUS),
+            "start_date":          _legacy_date(_legacy_safe_get(row, DashboardCol.START_DATE)),
+            "end_date":            _legacy_date(_legacy_safe_get(row, DashboardCol.END_DATE)),
+            "pm_primary":          _legacy_safe_get(row, DashboardCol.PM_PRIMARY),
+            "pm_secondary":        _legacy_safe_get(row, DashboardCol.PM_SECONDARY),
+        })
+    return records
+
+
+# ---------------------------------------------------------------------------
+# 합성 시트
+# ---------------------------------------------------------------------------
+
+def _money(rng: random.Random, symbol: str) -> str:
+    roll = rng.random()
+    if roll < 0.4:
+        return ""
+    return f"{symbol}{rng.randint(10_000, 50_000_000):,}"
+
+
+def make_rows(n_rows: int, seed: int = 42) -> list[list[str]]:
+    rng = random.Random(seed)
+    rows: list[list[str]] = [[f"H{c}" for c in range(_COLS)]]
+    for i in range(n_rows):
+        if rng.random() < 0.05:
+            rows.append([""] * rng.randint(0, _COLS))  # 빈/짧은 행
+            continue
+        start = f"2026. {rng.randint(1, 12)}. {rng.randint(1, 28)}"
+        end = f"2026. {rng.randint(1, 12)}. {rng.randint(1, 28)}"
+        row = [
+            "2026-03-16 월", "2026-12W", f"2026-12W/방문건/회사{i % 500}/브랜드{i}",
+            f"회사{i % 500}", f"브랜드{i}", rng.choice(["진행 중", "진행 완료", "클라이언트 정산 중"]),
+            "방문건", "IG reels", "링크", "소희", "사야카", start, end, "", "",
+            _money(rng, "₩"), _money(rng, "¥"), _money(rng, "$"), "",
+            _money(rng, "₩"), _money(rng, "¥"), _money(rng, ""),
+        ]
+        # Sheets API 는 끝의 빈 셀을 잘라서 반환
+        while row and not row[-1]:
+            row.pop()
+        rows.append(row)
+    return rows
+
+
+_MONEY_COLS = {
+    DashboardCol.CONTRACT_KRW, DashboardCol.CONTRACT_JPY, DashboardCol.CONTRACT_USD,
+    DashboardCol.COST_KRW, DashboardCol.COST_JPY, DashboardCol.MARGIN_KRW,
+}
+_DATE_COLS = {DashboardCol.START_DATE, DashboardCol.END_DATE}
+
+
+def _unformatted(col: int, value: str):
+    """서식 문자열 → UNFORMATTED_VALUE/SERIAL_NUMBER 로 받았을 때의 값"""
+    if not value:
+        return ""
+    if col in _MONEY_COLS:
+        return float(_legacy_money(value))
+    if col in _DATE_COLS:
+        iso = _legacy_date(value)
+        y, m, d = map(int, iso.split("-"))
+        return (date(y, m, d) - _SHEETS_EPOCH).days
+    return value
+
+
+def make_columns(rows: list[list[str]]) -> dict[int, list]:
+    """read_columns(DASHBOARD_COLUMNS) 응답 형태 (칼럼별, 끝의 빈 셀 생략)"""
+    columns: dict[int, list] = {}
+    for col in DASHBOARD_COLUMNS:
+        values = [rows[0][col]] + [
+            _unformatted(col, row[col] if len(row) > col else "") for row in rows[1:]
+        ]
+        while values and values[-1] == "":
+            values.pop()
+        columns[col] = values
+    return columns
+
+
+def _best_of(fn, rows, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        parse_date.cache_clear()
+        start = time.perf_counter()
+        fn(rows)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    expected = legacy_parse(rows)
+    actual = parse_all_dashboard_rows(rows)
+    assert actual == expected, "칼럼 단위 구현 결과가 기존 구현과 다릅니다"
+
+    columns = make_columns(rows)
+    assert parse_dashboard_columns(columns) == expected, "칼럼 입력 결과가 기존 구현과 다릅니다"
+
+    legacy = _best_of(legacy_parse, rows, args.repeat)
+    columnar = _best_of(parse_all_dashboard_rows, rows, args.repeat)
+    unformatted = _best_of(parse_dashboard_columns, columns, args.repeat)
+    print(f"rows={args.rows:,} records={len(expected):,}")
+    print(f"legacy      : {legacy * 1000:8.1f} ms")
+    print(f"columnar    : {columnar * 1000:8.1f} ms  ({legacy / columnar:.2f}x)")
+    print(f"unformatted : {unformatted * 1000:8.1f} ms  ({legacy / unformatted:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""extract_ig_urls_from_rows 마이크로 벤치마크
+
+합성 50,000행 × 26열 시트에서 기존(셀마다 findall + URL마다 왼쪽 셀 재탐색)
+구현과 단일 패스 구현을 비교합니다. 두 구현의 결과가 같은지도 확인합니다.
+
+Usage:
+    python benchmarks/bench_sheet_scanner.py [--rows 50000] [--repeat 3]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from config import IG_URL_PATTERN
+from identity import canonical_post_key
+from sheet_scanner import _extract_post_type, extract_ig_urls_from_rows
+
+_COLS = 26
+
+
+# ---------------------------------------------------------------------------
+# 기존 구현 (비교 기준)
+# ---------------------------------------------------------------------------
+
+def _legacy_left_cells(row: list[str], url_col_idx: int) -> tuple[str, str]:
+    ig_handle = ""
+    creator_name = ""
+    for cell in row[:url_col_idx]:
+        cell = cell.strip()
+        if not cell:
+            continue
+        if cell.startswith("@") or "instagram.com/" in cell:
+            if not ig_handle:
+                ig_handle = cell
+            continue
+        is_file_name = bool(re.search(r"\.\w{2,4}$", cell))
+        if (
+            len(cell) < 20
+            and not cell.replace(",", "").replace(".", "").isdigit()
+            and not is_file_name
+        ):
+            if not creator_name:
+                creator_name = cell
+    return ig_handle, creator_name
+
+
+def legacy_extract(rows: list[list[str]], brand_name: str, sheet_id: str) -> list[dict]:
+    results: list[dict] = []
+    seen_urls: set[str] = set()
+    content_url_re = re.compile(IG_URL_PATTERN)
+    for row in rows:
+        for col_idx, cell in enumerate(row):
+            cell_str = str(cell).strip()
+            if not cell_str:
+                continue
+            for url in content_url_re.findall(cell_str):
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+                ig_handle, creator_name = _legacy_left_cells(row, col_idx)
+                results.append({
+                    "brand_name": brand_name,
+                    "creator_name": creator_name,
+                    "ig_handle": ig_handle,
+                    "post_url": url,
+                    "post_type": _extract_post_type(url),
+                    "source_sheet_id": sheet_id,
+                })
+    return results
+
+
+# ---------------------------------------------------------------------------
+# 합성 데이터
+# ---------------------------------------------------------------------------
+
+def make_rows(n_rows: int, seed: int = 42) -> list[list[str]]:
+    """PM 시트와 비슷한 분포의 합성 행 생성 — 대부분 텍스트/숫자, 일부 URL"""
+    rng = random.Random(seed)
+    header = [f"칼럼{i}" for i in range(_COLS)]
+    rows = [header]
+    for r in range(n_rows):
+        row = [
+            str(r),
+            "JP",
+            "",
+            f"크리에이터{r % 997}",
+            f"@creator_{r % 997}",
+            f"{rng.randint(1000, 900000):,}",
+            f"https://www.instagram.com/creator_{r % 997}/",
+            "사진.jpg",
+        ]
+        while len(row) < _COLS - 2:
+            row.append(rng.choice(["", "완료", "2026. 3. 12", "₩300,000", "체험", "릴스", "메모 텍스트가 조금 긴 셀입니다"]))
+        kind = rng.choice(["reel", "p", "reel", ""])
+        row.append(f"https://www.instagram.com/{kind}/C{r:08d}x/" if kind else "")
+        row.append(f"https://www.instagram.com/reel/C{r:08d}x/?igsh=abc" if r % 10 == 0 else "")
+        rows.append(row)
+    return rows
+
+
+def _dedup_by_post_key(entries: list[dict]) -> list[dict]:
+    """기존 구현 결과를 포스트 키 기준 중복 제거 형태로 변환 (결과 비교용)"""
+    seen: set[str] = set()
+    deduped: list[dict] = []
+    for entry in entries:
+        key = canonical_post_key(entry["post_url"])
+        if key in seen:
+            continue
+        seen.add(key)
+        deduped.append({**entry, "post_key": key})
+    return deduped
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    expected = _dedup_by_post_key(legacy_extract(rows, "브랜드", "sheet"))
+    actual = extract_ig_urls_from_rows(rows, "브랜드", "sheet")
+    assert actual == expected, "단일 패스 구현 결과가 기존 구현과 다릅니다"
+
+    legacy_s = _best_of(lambda: legacy_extract(rows, "브랜드", "sheet"), args.repeat)
+    single_s = _best_of(lambda: extract_ig_urls_from_rows(rows, "브랜드", "sheet"), args.repeat)
+
+    print(f"rows={args.rows:,} cols={_COLS} urls={len(actual):,}")
+    print(f"legacy      : {legacy_s * 1000:8.1f} ms")
+    print(f"single-pass : {single_s * 1000:8.1f} ms")
+    print(f"speedup     : {legacy_s / single_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
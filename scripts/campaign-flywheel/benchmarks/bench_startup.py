@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""run_collect 콜드 스타트 벤치마크 — 모듈 import + SheetsClient 초기화
+
+1) run_collect.main() 이 import 하는 모듈들을 새 프로세스에서 import 하는 시간
+2) SheetsClient 초기화: 기존 방식(서비스마다 인증 JSON 재로드 + discovery 캐시
+   탐색 포함 build)과 공유 팩토리(인증 1회 로드, 정적 discovery, 스레드별
+   HTTP 전송 재사용)를 비교합니다. 스캔 워커 스레드 수만큼 추가 초기화도 측정합니다.
+
+krns_automation(shared-env)은 이 저장소 밖에 있으므로 측정에서 제외합니다.
+네트워크 호출은 발생하지 않습니다(임시 서비스 계정 키 사용).
+
+Usage:
+    python benchmarks/bench_startup.py [--workers 4] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+SCRIPT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, SCRIPT_DIR)
+
+_PIPELINE_MODULES = [
+    "supabase",
+    "sheets_client",
+    "sheet_scanner",
+    "scan_manifest",
+    "rate_limiter",
+    "response_cache",
+    "apify_collector",
+    "dashboard_etl",
+    "insight_writer",
+    "review_generator",
+]
+
+
+def _write_fake_service_account(directory: str) -> str:
+    """서명 가능한 임시 서비스 계정 JSON 생성"""
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    path = os.path.join(directory, "service_account.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "type": "service_account",
+            "project_id": "bench",
+            "private_key_id": "bench",
+            "private_key": pem,
+            "client_email": "bench@bench.iam.gserviceaccount.com",
+            "client_id": "1",
+            "token_uri": "https://oauth2.googleapis.com/token",
+        }, f)
+    return path
+
+
+def measure_import() -> float:
+    """새 인터프리터에서 파이프라인 모듈 import 시간 (초)"""
+    code = (
+        "import sys, time; sys.path.insert(0, %r); t = time.perf_counter();\n"
+        "import %s\n"
+        "print(time.perf_counter() - t)"
+    ) % (SCRIPT_DIR, ", ".join(_PIPELINE_MODULES))
+    out = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+    return float(out.strip().splitlines()[-1])
+
+
+def legacy_init() -> None:
+    """기존 방식: 서비스마다 인증 JSON 재로드 + 기본 build"""
+    from google.oauth2 import service_account
+    from googleapiclient.discovery import build
+    from sheets_client import SCOPES
+
+    sa_json = os.environ["GOOGLE_SERVICE_ACCOUNT_JSON"]
+    for api, version in (("sheets", "v4"), ("drive", "v3")):
+        creds = service_account.Credentials.from_service_account_file(sa_json, scopes=SCOPES)
+        build(api, version, credentials=creds)
+
+
+def shared_init(workers: int) -> None:
+    """공유 팩토리: 메인 스레드 + 워커 스레드별 SheetsClient 서비스 준비"""
+    import sheets_client
+
+    client = sheets_client.SheetsClient()
+
+    def touch() -> None:
+        client._sheets_service
+        client._drive_service
+
+    threads = [threading.Thread(target=touch) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+def legacy_init_with_workers(workers: int) -> None:
+    for _ in range(workers + 1):
+        legacy_init()
+
+
+def _reset_shared_state() -> None:
+    import sheets_client
+
+    sheets_client._credentials_cache.clear()
+    sheets_client._thread_state = threading.local()
+
+
+def _best_of(fn, repeat: int, before=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if before:
+            before()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    import_s = min(measure_import() for _ in range(args.repeat))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["GOOGLE_SERVICE_ACCOUNT_JSON"] = _write_fake_service_account(tmp)
+        # 모듈 import 비용은 위에서 따로 측정 — 여기서는 미리 import
+        legacy_init()
+        _reset_shared_state()
+        shared_init(0)
+
+        legacy_s = _best_of(lambda: legacy_init_with_workers(args.workers), args.repeat)
+        shared_s = _best_of(lambda: shared_init(args.workers), args.repeat, before=_reset_shared_state)
+        warm_s = _best_of(lambda: shared_init(0), args.repeat)
+
+    print(f"module import (cold process)          : {import_s * 1000:8.1f} ms")
+    print(f"client init, legacy (1+{args.workers} threads)     : {legacy_s * 1000:8.1f} ms")
+    print(f"client init, shared (1+{args.workers} threads)     : {shared_s * 1000:8.1f} ms")
+    print(f"client init, shared (already built)   : {warm_s * 1000:8.1f} ms")
+    print(f"init speedup                          : {legacy_s / shared_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
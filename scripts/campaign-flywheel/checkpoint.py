@@ -0,0 +1,103 @@
+"""수집 파이프라인 체크포인트 저널 — 중단된 실행을 마지막 완료 단계부터 재개
+
+신규 포스트 청크마다 진행 단계(수집 완료 → Insight 탭 기록 → Supabase 기록)를
+append-only JSONL 파일에 한 줄씩 기록합니다 (기록마다 fsync). 실행이 중간에
+죽으면 다음 실행이 저널을 읽어 끝나지 않은 청크의 남은 단계만 이어서 처리하므로,
+이미 수집한 지표를 다시 조회하거나 Insight 탭에 같은 행을 두 번 추가하지 않습니다.
+
+Phase 1 이 정상 종료되면 저널을 비웁니다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import uuid
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# 청크 진행 단계 (이 순서로 기록)
+STAGE_COLLECTED = "collected"
+STAGE_INSIGHT_WRITTEN = "insight_written"
+STAGE_STORED = "stored"
+
+
+class CheckpointJournal:
+    """청크 ID → 진행 단계/수집 결과 저널"""
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._chunks: dict[str, dict] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> "CheckpointJournal":
+        """저널 파일을 읽어 반환합니다. 마지막 줄이 잘린 경우(기록 중 중단) 무시."""
+        journal = cls(path)
+        try:
+            with open(path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return journal
+        except OSError as exc:
+            logger.warning("체크포인트 저널 로드 실패 — 처음부터 진행: %s", exc)
+            return journal
+
+        for line_no, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("체크포인트 저널 %d번째 줄 손상 — 무시", line_no)
+                continue
+            journal._apply(record)
+        return journal
+
+    def _apply(self, record: dict) -> None:
+        chunk = self._chunks.setdefault(record["chunk"], {"stages": set(), "entries": []})
+        chunk["stages"].add(record["stage"])
+        if record.get("entries") is not None:
+            chunk["entries"] = record["entries"]
+
+    @staticmethod
+    def new_chunk_id() -> str:
+        return uuid.uuid4().hex
+
+    def record(self, chunk_id: str, stage: str, entries: list[dict] | None = None) -> None:
+        """청크의 단계 완료를 기록합니다 (디스크에 반영된 뒤 반환).
+
+        Args:
+            chunk_id: new_chunk_id() 로 만든 청크 ID
+            stage: STAGE_* 단계
+            entries: 이 단계의 결과 entries (재개 시 그대로 사용, 없으면 None)
+        """
+        record = {"chunk": chunk_id, "stage": stage}
+        if entries is not None:
+            record["entries"] = entries
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+        self._apply(record)
+
+    def pending(self) -> list[tuple[str, list[dict], set[str]]]:
+        """끝나지 않은(STAGE_STORED 전) 청크 목록 — 수집 결과가 있는 청크만
+
+        Returns:
+            (청크 ID, 수집된 entries, 완료 단계 집합) 리스트 (기록 순)
+        """
+        return [
+            (chunk_id, chunk["entries"], set(chunk["stages"]))
+            for chunk_id, chunk in self._chunks.items()
+            if STAGE_STORED not in chunk["stages"] and STAGE_COLLECTED in chunk["stages"]
+        ]
+
+    def clear(self) -> None:
+        """모든 청크가 끝났을 때 저널을 비웁니다."""
+        self._chunks.clear()
+        if self.path is not None:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
@@ -1,9 +1,13 @@
 """캠페인 플라이휠 설정"""
 from __future__ import annotations
+import os
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).parent
 
+# 로컬 상태 파일 디렉토리 (실행 간 유지되는 매니페스트/캐시)
+STATE_DIR = SCRIPT_DIR / ".state"
+
 # MKT Ops Master 시트
 MKT_OPS_MASTER_SHEET_ID = "1zVFBaBJ-5E9ieUkn5k7fL8ZGecenO1Af4vnDC-8_my4"
 DASHBOARD_TAB = "Dashboard"
@@ -12,6 +16,14 @@ INSIGHT_TAB = "insight"
 # PM 공유 드라이브 폴더
 PM_SHARED_DRIVE_FOLDER_ID = "156iQRzAbzaFD9XXRHqArImSDrYbYn8SK"
 
+# Google Sheets API 쿼터 — 사용자당 분당 읽기 요청 60회 (기본 할당량)
+SHEETS_READ_REQUESTS_PER_MINUTE = 60
+# 429/5xx 응답 시 googleapiclient 지수 백오프 재시도 횟수
+SHEETS_MAX_RETRIES = 5
+
+# 시트 스캔 동시 작업 수 (1 = 직렬 스캔, 디버깅용)
+SCAN_WORKERS = int(os.environ.get("FLYWHEEL_SCAN_WORKERS", "4"))
+
 # Dashboard 칼럼 인덱스 (0-based, Row 1 기준)
 class DashboardCol:
     DATE = 0
@@ -39,15 +51,70 @@ class DashboardCol:
 
 # Apify
 APIFY_ACTOR_ID = "apify/instagram-post-scraper"
+# Apify API 주소 재지정 (예: 로컬 fake_apify_server). 비우면 기본 주소
+APIFY_API_URL = os.environ.get("FLYWHEEL_APIFY_API_URL") or None
 APIFY_MAX_ITEMS = 1
+# Actor run 1회당 URL 수
+APIFY_BATCH_SIZE = 25
+# 동시에 실행할 Actor run 수 (Apify 계정 동시 실행 한도 이내로 설정)
+APIFY_MAX_CONCURRENT_RUNS = 5
+# 배치 실패 시 재시도 횟수와 첫 대기 시간(초, 재시도마다 2배) — 이후에도 실패하면 배치를 반씩 나눠 원인 URL 격리
+APIFY_BATCH_RETRIES = 2
+APIFY_RETRY_BACKOFF_SECONDS = 5.0
+# 배치 크기 자동 조정 — run 기록(소요 시간/compute unit)으로 이 범위 안에서 선택
+APIFY_BATCH_SIZE_MIN = 5
+APIFY_BATCH_SIZE_MAX = 100
+# URL당 compute unit 상한 (작은 배치가 run 기동 비용으로 비싸지지 않도록)
+APIFY_MAX_COMPUTE_UNITS_PER_URL = float(os.environ.get("FLYWHEEL_APIFY_MAX_CU_PER_URL", "0.01"))
+
+# URL별 지표 캐시 — 이 시간 이내 수집된 URL은 Apify 재수집 생략
+METRICS_CACHE_FILE = STATE_DIR / "metrics_cache.sqlite3"
+METRICS_CACHE_MAX_AGE_HOURS = 24
+
+# 기존 포스트 키 인덱스 캐시 — 실행마다 증분 조회, 이 주기마다 전체 재생성 (삭제 반영)
+POST_KEY_INDEX_FILE = STATE_DIR / "post_key_index.bin"
+POST_KEY_INDEX_FULL_REFRESH_DAYS = 7
+
+# 신규 포스트 수집 체크포인트 저널 (중단된 실행 재개용)
+COLLECT_CHECKPOINT_FILE = STATE_DIR / "collect_checkpoint.jsonl"
+
+# 배치 크기 조정 상태 (최근 run 기록)
+BATCH_TUNER_FILE = STATE_DIR / "apify_batch_tuner.json"
+
+# 지표 재수집 — 게시 후 경과일 구간마다 다시 수집 (실행당 최대 URL 수 제한)
+RECOLLECT_AGE_BUCKETS_DAYS = (1, 3, 7, 14, 30)
+RECOLLECT_MAX_URLS_PER_RUN = 200
+# 재수집 실패 포스트는 구간을 유지한 채 이 시간 뒤 다시 시도
+RECOLLECT_RETRY_DELAY_HOURS = 12
+
+# 스캔 결과를 이 개수씩 모아 수집/기록 (스캔과 Apify 수집을 겹쳐 실행)
+# 한 청크가 동시 실행 run 슬롯을 모두 채우도록 배치 크기 × 동시 run 수로 설정
+COLLECT_CHUNK_SIZE = APIFY_BATCH_SIZE * APIFY_MAX_CONCURRENT_RUNS
 
 # Instagram URL 패턴
-IG_URL_PATTERN = r"https?://(?:www\.)?instagram\.com/(?:reel|p|stories)/[\w\-/]+"
+# (사용자명 접두 경로, /reels/, /tv/ 변형 포함 — 같은 포스트는 identity.canonical_post_key 로 묶음)
+IG_URL_PATTERN = r"https?://(?:www\.)?instagram\.com/(?:[\w.]+/)?(?:reels?|p|tv|stories)/[\w\-/]+"
 
 # 리뷰
 COMPLETION_STATUS = "진행 완료"
 REVIEW_PERIODIC_DAYS = 14
 
+# 완료 회고 동시 생성 수와 Anthropic API 분당 요청 한도
+REVIEW_MAX_CONCURRENCY = int(os.environ.get("FLYWHEEL_REVIEW_CONCURRENCY", "4"))
+ANTHROPIC_REQUESTS_PER_MINUTE = 50
+
+# 로컬 상태 파일
+SCAN_MANIFEST_FILE = STATE_DIR / "scan_manifest.json"
+
+# Sheets/Drive 응답 디스크 캐시 (개발·재실행용, FLYWHEEL_SHEETS_CACHE=1 로 활성화)
+SHEETS_CACHE_ENABLED = os.environ.get("FLYWHEEL_SHEETS_CACHE", "") == "1"
+SHEETS_CACHE_FILE = STATE_DIR / "sheets_cache.sqlite3"
+SHEETS_CACHE_MAX_BYTES = 200 * 1024 * 1024
+# 시트 값/탭 목록은 Drive version 으로 검증되므로 TTL을 길게 둠
+SHEETS_CACHE_TTL_SECONDS = 7 * 24 * 3600
+# Drive 파일 목록은 버전 검증이 불가능하므로 짧은 TTL만 적용
+SHEETS_CACHE_LISTING_TTL_SECONDS = 10 * 60
+
 # 로그
 LOG_DIR = Path.home() / "logs"
 LOG_FILE = LOG_DIR / "campaign-flywheel.log"
@@ -2,7 +2,10 @@
 from __future__ import annotations
 
 import re
-from typing import Optional
+from datetime import date, timedelta
+from functools import lru_cache
+from itertools import compress, zip_longest
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 from config import DashboardCol, COMPLETION_STATUS
 
@@ -19,23 +22,42 @@ def _safe_get(row: list, idx: int) -> str:
         return ""
 
 
+def _cell_text(value: Any) -> str:
+    """셀 값 → 문자열 (UNFORMATTED_VALUE 로 받은 정수 값은 소수점 없이)"""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+# Google Sheets 날짜 일련번호 기준일 (SERIAL_NUMBER 0 = 1899-12-30)
+_SHEETS_EPOCH = date(1899, 12, 30)
+
+
+_DATE_PATTERN = re.compile(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})")
+
+
 # ---------------------------------------------------------------------------
 # 파서
 # ---------------------------------------------------------------------------
 
-def parse_money(raw: str | None) -> float:
-    """통화 문자열 → float 변환
+def parse_money(raw: str | float | None) -> float:
+    """통화 문자열(또는 UNFORMATTED_VALUE 숫자) → float 변환
 
     Examples:
         '₩17,878,863' → 17878863.0
         '¥460,000'    → 460000.0
+        17878863      → 17878863.0
         ''            → 0.0
         None          → 0.0
     """
+    if isinstance(raw, (int, float)):
+        return float(raw)
     if not raw:
         return 0.0
-    # ₩, ¥, $, 콤마, 공백 제거
-    cleaned = re.sub(r"[₩¥$,\s]", "", raw)
+    # ₩, ¥, $, 콤마, 공백 제거 (split() 은 re 의 \s 와 같은 유니코드 공백 기준)
+    cleaned = "".join(
+        raw.replace("₩", "").replace("¥", "").replace("$", "").replace(",", "").split()
+    )
     if not cleaned:
         return 0.0
     try:
@@ -44,18 +66,24 @@ def parse_money(raw: str | None) -> float:
         return 0.0
 
 
-def parse_date(raw: str | None) -> Optional[str]:
-    """한국식 날짜 문자열 → ISO 8601 변환
+@lru_cache(maxsize=4096)
+def parse_date(raw: str | float | None) -> Optional[str]:
+    """한국식 날짜 문자열(또는 SERIAL_NUMBER 날짜) → ISO 8601 변환
+
+    같은 날짜가 여러 행에 반복되므로 결과를 캐시합니다.
 
     Examples:
         '2026. 1. 12' → '2026-01-12'
         '2026. 3. 6'  → '2026-03-06'
+        46034         → '2026-01-12'
         ''            → None
         None          → None
     """
+    if isinstance(raw, (int, float)):
+        return (_SHEETS_EPOCH + timedelta(days=int(raw))).isoformat()
     if not raw:
         return None
-    m = re.search(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})", raw)
+    m = _DATE_PATTERN.search(raw)
     if not m:
         return None
     year, month, day = m.group(1), m.group(2).zfill(2), m.group(3).zfill(2)
@@ -66,6 +94,31 @@ def parse_date(raw: str | None) -> Optional[str]:
 # 행 파서
 # ---------------------------------------------------------------------------
 
+# (레코드 필드, Dashboard 칼럼, 변환 함수 — None 이면 문자열 그대로)
+_DASHBOARD_FIELDS: tuple[tuple[str, int, Callable[[str], Any] | None], ...] = (
+    ("campaign_code",       DashboardCol.CODE,          None),
+    ("company_name",        DashboardCol.COMPANY_NAME,  None),
+    ("brand_name",          DashboardCol.BRAND_NAME,    None),
+    ("campaign_type",       DashboardCol.CAMPAIGN_TYPE, None),
+    ("media",               DashboardCol.MEDIA,         None),
+    ("contract_amount_krw", DashboardCol.CONTRACT_KRW,  parse_money),
+    ("contract_amount_jpy", DashboardCol.CONTRACT_JPY,  parse_money),
+    ("contract_amount_usd", DashboardCol.CONTRACT_USD,  parse_money),
+    ("cost_krw",            DashboardCol.COST_KRW,      parse_money),
+    ("cost_jpy",            DashboardCol.COST_JPY,      parse_money),
+    ("margin_krw",          DashboardCol.MARGIN_KRW,    parse_money),
+    ("status",              DashboardCol.STATUS,        None),
+    ("start_date",          DashboardCol.START_DATE,    parse_date),
+    ("end_date",            DashboardCol.END_DATE,      parse_date),
+    ("pm_primary",          DashboardCol.PM_PRIMARY,    None),
+    ("pm_secondary",        DashboardCol.PM_SECONDARY,  None),
+)
+_FIELD_NAMES = tuple(name for name, _, _ in _DASHBOARD_FIELDS)
+
+# Dashboard 탭에서 읽어야 하는 칼럼 (SheetsClient.read_columns 용)
+DASHBOARD_COLUMNS: tuple[int, ...] = tuple(sorted({col for _, col, _ in _DASHBOARD_FIELDS}))
+
+
 def parse_dashboard_row(row: list) -> dict | None:
     """Dashboard 탭 단일 행 → dict 변환
 
@@ -77,41 +130,65 @@ def parse_dashboard_row(row: list) -> dict | None:
     if not campaign_code or not brand_name:
         return None
 
-    return {
-        "campaign_code":      campaign_code,
-        "company_name":       _safe_get(row, DashboardCol.COMPANY_NAME),
-        "brand_name":         brand_name,
-        "campaign_type":      _safe_get(row, DashboardCol.CAMPAIGN_TYPE),
-        "media":              _safe_get(row, DashboardCol.MEDIA),
-        "contract_amount_krw": parse_money(_safe_get(row, DashboardCol.CONTRACT_KRW)),
-        "contract_amount_jpy": parse_money(_safe_get(row, DashboardCol.CONTRACT_JPY)),
-        "contract_amount_usd": parse_money(_safe_get(row, DashboardCol.CONTRACT_USD)),
-        "cost_krw":           parse_money(_safe_get(row, DashboardCol.COST_KRW)),
-        "cost_jpy":           parse_money(_safe_get(row, DashboardCol.COST_JPY)),
-        "margin_krw":         parse_money(_safe_get(row, DashboardCol.MARGIN_KRW)),
-        "status":             _safe_get(row, DashboardCol.STATUS),
-        "start_date":         parse_date(_safe_get(row, DashboardCol.START_DATE)),
-        "end_date":           parse_date(_safe_get(row, DashboardCol.END_DATE)),
-        "pm_primary":         _safe_get(row, DashboardCol.PM_PRIMARY),
-        "pm_secondary":       _safe_get(row, DashboardCol.PM_SECONDARY),
-    }
+    record = {}
+    for name, col, convert in _DASHBOARD_FIELDS:
+        value = _safe_get(row, col)
+        record[name] = convert(value) if convert else value
+    return record
+
+
+def parse_dashboard_columns(columns: Mapping[int, Sequence]) -> list[dict]:
+    """칼럼 단위 Dashboard 값 → 레코드 리스트 (각 칼럼 첫 값 = 헤더, 스킵)
+
+    SheetsClient.read_columns(..., DASHBOARD_COLUMNS) 결과를 그대로 받습니다.
+    칼럼마다 길이가 달라도 (끝의 빈 셀 생략) 빈 문자열로 채워 행을 맞춥니다.
+    금액/날짜 칼럼은 숫자(UNFORMATTED_VALUE/SERIAL_NUMBER)와 문자열을 모두 받습니다.
+
+    Args:
+        columns: 칼럼 인덱스 → 위에서부터의 셀 값 리스트
+
+    Returns:
+        파싱된 레코드 리스트 (campaign_code 또는 brand_name 이 빈 행 제외)
+    """
+    n_rows = max((len(values) for values in columns.values()), default=1) - 1
+
+    def column(idx: int) -> list:
+        values = list(columns.get(idx, ())[1:])  # 헤더 스킵
+        values.extend([""] * (n_rows - len(values)))
+        return values
+
+    def texts(values: Iterable) -> list[str]:
+        return [v.strip() if v.__class__ is str else _cell_text(v) for v in values]
+
+    keep = [
+        bool(code and brand)
+        for code, brand in zip(texts(column(DashboardCol.CODE)), texts(column(DashboardCol.BRAND_NAME)))
+    ]
+
+    # 변환 함수는 앞뒤 공백이 있는 문자열도 같은 결과를 내므로 셀 값을 그대로 전달
+    fields = []
+    for _, col, convert in _DASHBOARD_FIELDS:
+        values = compress(column(col), keep)
+        fields.append(list(map(convert, values)) if convert else texts(values))
+
+    names = _FIELD_NAMES
+    return [dict(zip(names, values)) for values in zip(*fields)]
 
 
 def parse_all_dashboard_rows(rows: list[list]) -> list[dict]:
     """Dashboard 탭 전체 행 처리 (헤더 row[0] 스킵)
 
+    행마다 parse_dashboard_row 를 부르는 대신 한 번 전치해
+    parse_dashboard_columns 로 칼럼 단위로 변환합니다.
+    결과는 parse_dashboard_row 를 행마다 적용한 것과 같습니다.
+
     Args:
         rows: 시트에서 읽어온 2D 리스트 (첫 번째 행 = 헤더)
 
     Returns:
         파싱된 레코드 리스트 (None 제외)
     """
-    records = []
-    for row in rows[1:]:  # 헤더 스킵
-        record = parse_dashboard_row(row)
-        if record is not None:
-            records.append(record)
-    return records
+    return parse_dashboard_columns(dict(enumerate(zip_longest(*rows, fillvalue=""))))
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""로컬 Apify API 대역 — Actor run / dataset 엔드포인트 모사
+
+apify-client 가 사용하는 아래 엔드포인트만 구현합니다.
+
+  POST /v2/actors/{actorId}/runs         run 시작 (입력: directUrls, 구 경로 /v2/acts 도 허용)
+  GET  /v2/actor-runs/{runId}            run 상태 (waitForFinish 롱 폴링 지원)
+  GET  /v2/actor-runs/{runId}/log        run 로그 (.call() 의 로그 스트리밍용, 빈 텍스트)
+  GET  /v2/datasets/{datasetId}/items    결과 아이템
+
+run 은 run_latency + per_url_latency × URL 수 뒤에 끝나며, failure_rate 확률로
+FAILED 상태로 끝나고, missing_rate 확률로 URL별 결과가 빠집니다. 지표 값은
+URL 기준으로 결정적이므로 반복 실행 결과를 비교할 수 있습니다.
+
+Usage:
+  python fake_apify_server.py --port 8765 --latency 2 --failure-rate 0.1
+  FLYWHEEL_APIFY_API_URL=http://127.0.0.1:8765 python run_collect.py
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# waitForFinish 최대 대기 (실제 API 와 동일하게 60초)
+MAX_WAIT_FOR_FINISH_SECONDS = 60
+
+
+def _fake_item(url: str) -> dict:
+    """URL 로 결정되는 가짜 Instagram Post Scraper 결과 아이템"""
+    seed = int.from_bytes(hashlib.sha256(url.encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    views = rng.randint(1_000, 500_000)
+    return {
+        "url": url,
+        "shortCode": url.rstrip("/").rsplit("/", 1)[-1],
+        "videoPlayCount": views,
+        "likesCount": views // rng.randint(20, 80),
+        "sharesCount": views // rng.randint(200, 1000),
+        "commentsCount": views // rng.randint(300, 2000),
+    }
+
+
+class FakeApifyServer:
+    """스레드에서 도는 가짜 Apify API 서버 (with 문 또는 start/stop)"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        run_latency: float = 1.0,
+        per_url_latency: float = 0.02,
+        failure_rate: float = 0.0,
+        missing_rate: float = 0.0,
+        compute_units_per_run: float = 0.01,
+        compute_units_per_url: float = 0.002,
+        seed: int | None = None,
+    ) -> None:
+        self.run_latency = run_latency
+        self.per_url_latency = per_url_latency
+        self.failure_rate = failure_rate
+        self.missing_rate = missing_rate
+        self.compute_units_per_run = compute_units_per_run
+        self.compute_units_per_url = compute_units_per_url
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._runs: dict[str, dict] = {}
+        self._datasets: dict[str, list[dict]] = {}
+        self.runs_started = 0
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeApifyServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeApifyServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # ── run/dataset 상태 ──
+
+    def _start_run(self, actor_id: str, run_input: dict) -> dict:
+        urls = list(run_input.get("directUrls") or [])
+        with self._lock:
+            n = next(self._ids)
+            fails = self._rng.random() < self.failure_rate
+            items = [
+                _fake_item(u) for u in urls if self._rng.random() >= self.missing_rate
+            ]
+            self.runs_started += 1
+        run_id, dataset_id = f"run{n:06d}", f"ds{n:06d}"
+        now = datetime.now(timezone.utc)
+        run = {
+            "id": run_id,
+            "actId": actor_id,
+            "userId": "fake-user",
+            "startedAt": now.isoformat(),
+            "finishedAt": None,
+            "status": "RUNNING",
+            "meta": {"origin": "API"},
+            "stats": {"computeUnits": 0},
+            "options": {"build": "latest", "timeoutSecs": 3600, "memoryMbytes": 1024, "diskMbytes": 2048},
+            "buildId": "fake-build",
+            "defaultKeyValueStoreId": f"kv{n:06d}",
+            "defaultDatasetId": dataset_id,
+            "defaultRequestQueueId": f"rq{n:06d}",
+            "_finishes_at": time.monotonic() + self.run_latency + self.per_url_latency * len(urls),
+            "_final_status": "FAILED" if fails else "SUCCEEDED",
+            "_compute_units": self.compute_units_per_run + self.compute_units_per_url * len(urls),
+        }
+        with self._lock:
+            self._runs[run_id] = run
+            self._datasets[dataset_id] = [] if fails else items
+        return self._public_run(run)
+
+    def _public_run(self, run: dict) -> dict:
+        """끝난 run 은 최종 상태로 갱신하고 내부 필드를 뺀 사본을 반환"""
+        if run["status"] == "RUNNING" and time.monotonic() >= run["_finishes_at"]:
+            run["status"] = run["_final_status"]
+            run["finishedAt"] = datetime.now(timezone.utc).isoformat()
+            run["stats"] = {"computeUnits": run["_compute_units"]}
+        return {k: v for k, v in run.items() if not k.startswith("_")}
+
+    def _get_run(self, run_id: str, wait_seconds: float) -> dict | None:
+        with self._lock:
+            run = self._runs.get(run_id)
+        if run is None:
+            return None
+        remaining = run["_finishes_at"] - time.monotonic()
+        if run["status"] == "RUNNING" and remaining > 0 and wait_seconds > 0:
+            time.sleep(min(remaining, wait_seconds))
+        with self._lock:
+            return self._public_run(run)
+
+    # ── HTTP ──
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args) -> None:  # noqa: A002
+                pass
+
+            def _send_json(self, status: int, payload, headers: dict | None = None) -> None:
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_text(self, text: str) -> None:
+                body = text.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _not_found(self) -> None:
+                self._send_json(404, {"error": {"type": "record-not-found", "message": "Not found"}})
+
+            def _read_json(self):
+                raw = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    raw = gzip.decompress(raw)
+                return json.loads(raw) if raw else {}
+
+            def do_POST(self) -> None:
+                parts = urlparse(self.path).path.strip("/").split("/")
+                if len(parts) == 4 and parts[0] == "v2" and parts[1] in ("actors", "acts") and parts[3] == "runs":
+                    run = server._start_run(parts[2].replace("~", "/"), self._read_json())
+                    self._send_json(201, {"data": run})
+                else:
+                    self._not_found()
+
+            def do_GET(self) -> None:
+                parsed = urlparse(self.path)
+                parts = parsed.path.strip("/").split("/")
+                query = parse_qs(parsed.query)
+
+                if len(parts) == 3 and parts[:2] == ["v2", "actor-runs"]:
+                    wait = float(query.get("waitForFinish", ["0"])[0] or 0)
+                    run = server._get_run(parts[2], min(wait, MAX_WAIT_FOR_FINISH_SECONDS))
+                    if run is None:
+                        self._not_found()
+                    else:
+                        self._send_json(200, {"data": run})
+                elif len(parts) == 4 and parts[:2] == ["v2", "actor-runs"] and parts[3] == "log":
+                    self._send_text("")
+                elif len(parts) == 4 and parts[:2] == ["v2", "datasets"] and parts[3] == "items":
+                    with server._lock:
+                        items = server._datasets.get(parts[2])
+                    if items is None:
+                        self._not_found()
+                        return
+                    self._send_json(200, items, {
+                        "x-apify-pagination-total": str(len(items)),
+                        "x-apify-pagination-offset": "0",
+                        "x-apify-pagination-count": str(len(items)),
+                        "x-apify-pagination-limit": "999999999999",
+                        "x-apify-pagination-desc": "false",
+                    })
+                else:
+                    self._not_found()
+
+        return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 Apify API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=1.0, help="run 기본 소요 시간(초)")
+    parser.add_argument("--per-url-latency", type=float, default=0.02, help="URL당 추가 소요 시간(초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="run 실패 확률 (0~1)")
+    parser.add_argument("--missing-rate", type=float, default=0.0, help="URL 결과 누락 확률 (0~1)")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = FakeApifyServer(
+        host=args.host,
+        port=args.port,
+        run_latency=args.latency,
+        per_url_latency=args.per_url_latency,
+        failure_rate=args.failure_rate,
+        missing_rate=args.missing_rate,
+        seed=args.seed,
+    )
+    print(f"fake Apify API: {server.url}  (FLYWHEEL_APIFY_API_URL={server.url})")
+    try:
+        server._httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
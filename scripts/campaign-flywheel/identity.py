@@ -0,0 +1,72 @@
+"""Instagram 포스트 식별 키
+
+같은 포스트가 시트마다 다른 형태로 적혀 있어도 (/reel/ · /reels/ · /p/ · /tv/,
+?igsh= 등 쿼리, 끝 슬래시, 사용자명 접두 경로) 하나의 키로 묶기 위한 정규화입니다.
+스캐너 중복 제거, 지표 매핑/캐시, campaign_posts.post_key 에 공통으로 사용합니다.
+
+크리에이터 키(normalize_creator_key)는 같은 크리에이터의 핸들 표기 차이
+(@ 접두, 대소문자, 앞뒤 공백)를 묶어 KPI 집계와 creator_first_seen 에 사용합니다.
+"""
+from __future__ import annotations
+
+import re
+
+# 포스트/릴스: shortcode (대소문자 구분), 스토리: 사용자명 + 스토리 ID
+_POST_KEY_PATTERN = re.compile(
+    r"instagram\.com/(?:[\w.]+/)?(?:reels?|p|tv)/([\w-]+)", re.IGNORECASE
+)
+_STORY_KEY_PATTERN = re.compile(
+    r"instagram\.com/stories/([\w.]+)(?:/(\d+))?", re.IGNORECASE
+)
+
+# 크리에이터 키에서 제거할 앞뒤 공백 (SQL btrim 과 같은 문자 집합)
+_CREATOR_KEY_WHITESPACE = " \t\r\n"
+
+
+def canonical_post_key(url: str) -> str:
+    """포스트 URL → 정규 포스트 키
+
+    - 포스트/릴스/IGTV: shortcode (예: "C1a2B3c4D5e")
+    - 스토리: "stories/{사용자명 소문자}/{스토리 ID}"
+    - 그 외: 끝 슬래시 제거 + 소문자 URL
+
+    supabase/migrations/*_campaign_post_key.sql 의 백필 식과 같은 규칙입니다.
+
+    Args:
+        url: Instagram URL
+
+    Returns:
+        정규 포스트 키
+    """
+    m = _POST_KEY_PATTERN.search(url)
+    if m:
+        return m.group(1)
+
+    m = _STORY_KEY_PATTERN.search(url)
+    if m:
+        user, story_id = m.group(1).lower(), m.group(2)
+        return f"stories/{user}/{story_id}" if story_id else f"stories/{user}"
+
+    return url.rstrip("/").lower()
+
+
+def normalize_creator_key(ig_handle: str | None, creator_name: str | None) -> str | None:
+    """크리에이터 식별 키
+
+    ig_handle 을 우선 사용하고 (앞뒤 공백, @ 접두 제거 후 소문자),
+    없으면 creator_name (앞뒤 공백 제거 후 소문자) 을 사용합니다.
+
+    supabase/migrations/*_creator_first_seen.sql 의 creator_key 식과 같은 규칙입니다.
+
+    Args:
+        ig_handle: Instagram 핸들
+        creator_name: 크리에이터 이름
+
+    Returns:
+        크리에이터 키. 둘 다 비어 있으면 None
+    """
+    handle = (ig_handle or "").strip(_CREATOR_KEY_WHITESPACE).lstrip("@")
+    if handle:
+        return handle.lower()
+    name = (creator_name or "").strip(_CREATOR_KEY_WHITESPACE)
+    return name.lower() or None
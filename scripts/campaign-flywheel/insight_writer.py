@@ -4,10 +4,13 @@
 """
 from __future__ import annotations
 
+import hashlib
+import json
 from datetime import datetime, timezone
 from typing import Any
 
 from config import MKT_OPS_MASTER_SHEET_ID, INSIGHT_TAB
+from identity import canonical_post_key, normalize_creator_key
 from sheets_client import SheetsClient
 
 # Insight 탭 컬럼 순서
@@ -74,13 +77,69 @@ def write_to_insight_tab(client: SheetsClient, entries: list[dict]) -> int:
     return client.append_rows(MKT_OPS_MASTER_SHEET_ID, INSIGHT_TAB, rows)
 
 
+def _post_record(e: dict) -> dict:
+    """entry → campaign_posts 레코드 변환"""
+    return {
+        "brand_name": e.get("brand_name"),
+        "creator_name": e.get("creator_name"),
+        "ig_handle": e.get("ig_handle"),
+        "creator_key": normalize_creator_key(e.get("ig_handle"), e.get("creator_name")),
+        "post_url": e.get("post_url"),
+        "post_key": e.get("post_key") or canonical_post_key(e.get("post_url") or ""),
+        "post_type": e.get("post_type"),
+        "views": e.get("views"),
+        "likes": e.get("likes"),
+        "shares": e.get("shares"),
+        "comments": e.get("comments"),
+        "collected_at": e.get("collected_at"),
+        "last_collected_at": e.get("collected_at"),
+        "collection_status": e.get("collection_status"),
+        "source_sheet_id": e.get("source_sheet_id"),
+        "campaign_code": e.get("campaign_code"),
+    }
+
+
+def _first_seen_records(records: list[dict]) -> list[dict]:
+    """campaign_posts 레코드 → creator_first_seen 레코드 (키별 가장 이른 수집 시각)"""
+    first_seen: dict[str, dict] = {}
+    for r in records:
+        key, collected_at = r.get("creator_key"), r.get("collected_at")
+        if not key or not collected_at:
+            continue
+        seen = first_seen.get(key)
+        if seen is None or collected_at < seen["first_seen_at"]:
+            first_seen[key] = {
+                "creator_key": key,
+                "first_seen_at": collected_at,
+                "ig_handle": r.get("ig_handle"),
+                "creator_name": r.get("creator_name"),
+            }
+    return list(first_seen.values())
+
+
+def _record_creator_first_seen(supabase_client: Any, records: list[dict]) -> None:
+    """처음 보는 크리에이터를 creator_first_seen 에 추가합니다 (이미 있는 키는 무시).
+
+    first_seen_at 은 수집된 포스트 중 가장 이른 collected_at(최초 수집 시각)이며,
+    마이그레이션 백필과 같은 규칙입니다. 포스트는 수집 시각 순으로 기록되므로
+    먼저 들어간 행이 최초 수집 시각이 됩니다.
+    """
+    rows = _first_seen_records(records)
+    if rows:
+        supabase_client.table("creator_first_seen").upsert(
+            rows, on_conflict="creator_key", ignore_duplicates=True
+        ).execute()
+
+
 def write_to_supabase(
     supabase_client: Any, entries: list[dict], batch_size: int = 50
 ) -> int:
     """entry 리스트를 campaign_posts 테이블에 upsert합니다.
 
-    post_url을 UNIQUE constraint 기준으로 upsert 처리합니다.
+    post_key(정규 포스트 키)를 UNIQUE constraint 기준으로 upsert 처리하므로
+    같은 포스트의 URL 변형은 한 행으로 합쳐집니다.
     배치 단위로 처리하여 대용량 데이터에 대응합니다.
+    배치마다 처음 보는 크리에이터를 creator_first_seen 에도 추가합니다.
 
     Args:
         supabase_client: supabase-py 클라이언트 인스턴스
@@ -96,37 +155,181 @@ def write_to_supabase(
     total = 0
     for i in range(0, len(entries), batch_size):
         batch = entries[i : i + batch_size]
-        records = [
-            {
-                "brand_name": e.get("brand_name"),
-                "creator_name": e.get("creator_name"),
-                "ig_handle": e.get("ig_handle"),
-                "post_url": e.get("post_url"),
-                "post_type": e.get("post_type"),
-                "views": e.get("views", 0),
-                "likes": e.get("likes", 0),
-                "shares": e.get("shares", 0),
-                "comments": e.get("comments", 0),
-                "collected_at": e.get("collected_at"),
-                "source_sheet_id": e.get("source_sheet_id"),
-                "campaign_code": e.get("campaign_code"),
-            }
-            for e in batch
-        ]
+        records = [_post_record(e) for e in batch]
         supabase_client.table("campaign_posts").upsert(
-            records, on_conflict="post_url"
+            records, on_conflict="post_key"
         ).execute()
+        _record_creator_first_seen(supabase_client, records)
+        total += len(batch)
+
+    return total
+
+
+# 재수집 실패 시 기존 값을 유지할 칼럼 (이전 수집 결과와 그 상태)
+_UNRESOLVED_DROP_COLUMNS = (
+    "views", "likes", "shares", "comments", "collected_at", "last_collected_at",
+    "collection_status",
+)
+
+
+def write_recollected_to_supabase(
+    supabase_client: Any, entries: list[dict], batch_size: int = 50
+) -> int:
+    """재수집한 entry의 최신 지표와 다음 재수집 스케줄을 campaign_posts에 반영합니다.
+
+    entry에는 recollector.apply_schedule()/defer_failed()가 채운
+    recollect_stage/next_recollect_at 이 있어야 합니다. 수집에 실패한 entry는
+    지표와 collection_status 를 덮어쓰지 않고 스케줄만 갱신합니다 (이전 수집 결과가
+    유효한 채로 남도록). 이번 재수집 결과는 last_recollect_status 에 기록합니다.
+
+    재수집 시각은 last_collected_at 에 기록하고, collected_at 은 최초 수집 시각
+    (fetch_due_posts 의 first_collected_at)을 유지합니다. 기간별 집계가
+    collected_at 기준이므로 재수집된 과거 포스트가 당기 활동으로 잡히지 않습니다.
+    최초 수집이 실패했다가 재수집으로 처음 수집된 크리에이터는 creator_first_seen 에
+    추가합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        entries: 재수집된 entry 딕셔너리 리스트
+        batch_size: 배치당 처리 행 수 (기본값 50)
+
+    Returns:
+        총 upsert된 행 수
+    """
+    # 수집 실패 엔트리는 기존 지표를 NULL 로 덮어쓰지 않도록 지표 칼럼을 빼고 기록
+    # (PostgREST 일괄 upsert 는 레코드 칼럼이 같아야 하므로 그룹별로 요청)
+    collected = [e for e in entries if e.get("collected_at")]
+    unresolved = [e for e in entries if not e.get("collected_at")]
+
+    total = 0
+    for group, drop in ((collected, ()), (unresolved, _UNRESOLVED_DROP_COLUMNS)):
+        for i in range(0, len(group), batch_size):
+            batch = group[i : i + batch_size]
+            records = []
+            for e in batch:
+                record = {
+                    **_post_record(e),
+                    "recollect_stage": e.get("recollect_stage"),
+                    "next_recollect_at": e.get("next_recollect_at"),
+                    "last_recollect_status": e.get("collection_status"),
+                }
+                if not drop:
+                    # 최초 수집이 실패했던 포스트는 이번 재수집이 최초 수집
+                    record["collected_at"] = e.get("first_collected_at") or e["collected_at"]
+                for col in drop:
+                    record.pop(col)
+                records.append(record)
+            supabase_client.table("campaign_posts").upsert(
+                records, on_conflict="post_key"
+            ).execute()
+            if not drop:
+                _record_creator_first_seen(supabase_client, records)
+            total += len(batch)
+
+    return total
+
+
+# 스냅샷 대상 지표
+_SNAPSHOT_METRICS = ("views", "likes", "shares", "comments")
+
+
+def write_snapshots(
+    supabase_client: Any,
+    entries: list[dict],
+    previous: dict[str, dict] | None = None,
+    batch_size: int = 500,
+) -> int:
+    """지표가 바뀐 entry만 campaign_post_snapshots 테이블에 추가합니다.
+
+    previous 에 직전 지표가 있으면 그 값과 비교해 변화가 없는 entry는 건너뛰고,
+    변화가 있으면 *_delta 칼럼에 증감을 기록합니다. 직전 지표가 없으면 최초
+    스냅샷으로 보고 수집값 자체를 delta 로 기록합니다.
+    collected_at 이 없는(수집 실패) entry는 기록하지 않습니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        entries: 수집된 entry 딕셔너리 리스트
+        previous: post_url → 직전 지표 딕셔너리 (views/likes/shares/comments)
+        batch_size: 배치당 insert 행 수 (기본값 500)
+
+    Returns:
+        총 insert된 행 수
+    """
+    previous = previous or {}
+    records: list[dict] = []
+    for e in entries:
+        if not e.get("collected_at"):
+            continue
+        current = {m: e.get(m) or 0 for m in _SNAPSHOT_METRICS}
+        prev = previous.get(e.get("post_url"))
+        if prev is not None:
+            prev = {m: prev.get(m) or 0 for m in _SNAPSHOT_METRICS}
+            if prev == current:
+                continue
+        else:
+            prev = dict.fromkeys(_SNAPSHOT_METRICS, 0)
+
+        records.append({
+            "post_url": e.get("post_url"),
+            **current,
+            **{f"{m}_delta": current[m] - prev[m] for m in _SNAPSHOT_METRICS},
+            "collected_at": e["collected_at"],
+        })
+
+    total = 0
+    for i in range(0, len(records), batch_size):
+        batch = records[i : i + batch_size]
+        supabase_client.table("campaign_post_snapshots").insert(batch).execute()
         total += len(batch)
 
     return total
 
 
+# 변경 감지용 기존 해시 조회 페이지 크기 (PostgREST 기본 max-rows 이하)
+_FINANCIALS_PAGE_SIZE = 1000
+
+
+def financial_record_hash(record: dict) -> str:
+    """재무 레코드의 내용 해시 (키 순서와 무관, content_hash 필드 제외)
+
+    Args:
+        record: parse_all_dashboard_rows() 레코드
+
+    Returns:
+        SHA-256 hex 문자열
+    """
+    payload = {k: v for k, v in record.items() if k != "content_hash"}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _fetch_financial_hashes(supabase_client: Any, page_size: int = _FINANCIALS_PAGE_SIZE) -> dict[str, str | None]:
+    """campaign_financials 의 campaign_code → content_hash 를 페이지 단위로 조회합니다."""
+    hashes: dict[str, str | None] = {}
+    offset = 0
+    while True:
+        rows = (
+            supabase_client.table("campaign_financials")
+            .select("campaign_code, content_hash")
+            .order("campaign_code")
+            .range(offset, offset + page_size - 1)
+            .execute()
+            .data
+        ) or []
+        for r in rows:
+            hashes[r["campaign_code"]] = r.get("content_hash")
+        if len(rows) < page_size:
+            return hashes
+        offset += page_size
+
+
 def write_financials_to_supabase(
     supabase_client: Any, records: list[dict], batch_size: int = 50
-) -> int:
-    """재무 레코드를 campaign_financials 테이블에 upsert합니다.
+) -> dict[str, int]:
+    """재무 레코드 중 변경된 것만 campaign_financials 테이블에 upsert합니다.
 
-    campaign_code를 UNIQUE constraint 기준으로 upsert 처리합니다.
+    레코드마다 내용 해시(content_hash)를 계산해 테이블에 저장된 값과 비교하고,
+    새 campaign_code 이거나 해시가 달라진 레코드만 campaign_code 기준으로 upsert합니다.
 
     Args:
         supabase_client: supabase-py 클라이언트 인스턴스
@@ -134,10 +337,11 @@ def write_financials_to_supabase(
         batch_size: 배치당 처리 행 수 (기본값 50)
 
     Returns:
-        총 upsert된 행 수
+        {"inserted": 신규, "updated": 변경, "unchanged": 변경 없음} 건수
     """
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
     if not records:
-        return 0
+        return counts
 
     # campaign_code 중복 제거 (마지막 것 우선)
     deduped: dict[str, dict] = {}
@@ -145,14 +349,24 @@ def write_financials_to_supabase(
         code = r.get("campaign_code")
         if code:
             deduped[code] = r
-    records = list(deduped.values())
 
-    total = 0
-    for i in range(0, len(records), batch_size):
-        batch = records[i : i + batch_size]
+    stored = _fetch_financial_hashes(supabase_client)
+    changed: list[dict] = []
+    for code, record in deduped.items():
+        content_hash = financial_record_hash(record)
+        if code not in stored:
+            counts["inserted"] += 1
+        elif stored[code] != content_hash:
+            counts["updated"] += 1
+        else:
+            counts["unchanged"] += 1
+            continue
+        changed.append({**record, "content_hash": content_hash})
+
+    for i in range(0, len(changed), batch_size):
+        batch = changed[i : i + batch_size]
         supabase_client.table("campaign_financials").upsert(
             batch, on_conflict="campaign_code"
         ).execute()
-        total += len(batch)
 
-    return total
+    return counts
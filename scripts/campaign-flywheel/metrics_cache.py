@@ -0,0 +1,81 @@
+"""포스트별 Instagram 지표 로컬 캐시
+
+최근 수집한 지표를 포스트 키(identity.canonical_post_key)로 SQLite에 보관하여, 실패한 실행을
+재시도하거나 같은 URL이 다시 들어와도 max_age 이내면 Apify 스크레이프를
+생략합니다.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable
+
+
+class MetricsCache:
+    """포스트 키 → (지표, collected_at) 캐시 (스레드 안전)"""
+
+    def __init__(self, path: Path | str) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS metrics ("
+            " url_key TEXT PRIMARY KEY,"
+            " metrics TEXT NOT NULL,"
+            " collected_at TEXT NOT NULL)"
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def get_fresh(
+        self,
+        keys: Iterable[str],
+        max_age: timedelta,
+        now: datetime | None = None,
+    ) -> dict[str, tuple[dict, str]]:
+        """max_age 이내에 수집된 키의 지표를 반환합니다.
+
+        Args:
+            keys: 포스트 키 목록
+            max_age: 허용 최대 경과 시간
+            now: 기준 시각 (기본값: 현재 UTC)
+
+        Returns:
+            {키: (지표 dict, collected_at ISO 문자열)} — 오래되었거나 없는 키는 제외
+        """
+        cutoff = (now or datetime.now(timezone.utc)) - max_age
+        fresh: dict[str, tuple[dict, str]] = {}
+        with self._lock:
+            for key in set(keys):
+                row = self._conn.execute(
+                    "SELECT metrics, collected_at FROM metrics WHERE url_key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    continue
+                metrics, collected_at = row
+                if datetime.fromisoformat(collected_at) >= cutoff:
+                    fresh[key] = (json.loads(metrics), collected_at)
+        return fresh
+
+    def put_many(self, records: Iterable[tuple[str, dict, str]]) -> None:
+        """(키, 지표, collected_at) 목록을 저장합니다. 기존 값은 덮어씁니다."""
+        rows = [
+            (key, json.dumps(metrics), collected_at)
+            for key, metrics, collected_at in records
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metrics (url_key, metrics, collected_at)"
+                " VALUES (?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
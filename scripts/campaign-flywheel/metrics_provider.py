@@ -0,0 +1,37 @@
+"""Instagram 지표 수집 공급자 인터페이스
+
+collect_ig_metrics 는 배치 실행/재시도/분할/캐시만 담당하고, 실제 지표 조회는
+이 프로토콜을 구현한 공급자에 맡깁니다. 기본 구현은 apify_collector.ApifyProvider 이며,
+fake_apify_server 와 함께 쓰면 토큰 없이 로컬에서 부하/재시도 동작을 측정할 수 있습니다.
+"""
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class ProviderUnavailableError(Exception):
+    """입력 URL 과 무관한 공급자 오류 (인증 실패, 사용량 한도 초과 등)
+
+    fetch_batch 가 이 예외를 던지면 배치를 재시도하거나 나누지 않고
+    배치 전체를 실패 처리합니다 (나눠 보내도 같은 이유로 실패하므로).
+    """
+
+
+class MetricsProvider(Protocol):
+    """URL 배치 → 지표 조회 공급자"""
+
+    def fetch_batch(self, urls: list[str]) -> tuple[dict[str, dict], float | None]:
+        """URL 배치의 지표를 조회합니다.
+
+        배치 전체가 실패하면 예외를 던져야 합니다 (호출 측에서 재시도/분할).
+        입력과 무관하게 모든 요청이 실패할 오류면 ProviderUnavailableError 를 던집니다.
+        결과에 없는 URL은 수집 누락(missing)으로 처리됩니다.
+
+        Args:
+            urls: 조회할 포스트 URL 리스트
+
+        Returns:
+            (identity.canonical_post_key → views/likes/shares/comments 딕셔너리,
+             이번 조회의 compute unit 또는 알 수 없으면 None) 튜플
+        """
+        ...
@@ -0,0 +1,178 @@
+"""단계(phase) 의존 그래프 실행기
+
+각 단계는 의존하는 단계의 결과를 인자로 받는 함수입니다. 의존 단계가 모두
+끝난 단계부터 스레드 풀에서 동시에 실행하므로, 서로 독립인 단계(예: 콘텐츠 수집과
+재무 동기화)는 겹쳐서 돌고 전체 소요 시간은 가장 긴 의존 경로에 가까워집니다.
+
+한 단계가 실패하면 그 단계에 (직간접으로) 의존하는 단계만 건너뛰고, 나머지는
+끝까지 실행한 뒤 PipelineError 로 실패 단계를 알립니다.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class Phase:
+    """파이프라인 단계 — name, 실행 함수, 의존 단계 이름"""
+
+    def __init__(self, name: str, func: Callable[..., Any], depends_on: Iterable[str] = ()) -> None:
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+    def __repr__(self) -> str:
+        return f"Phase({self.name!r}, depends_on={self.depends_on!r})"
+
+
+class PipelineError(Exception):
+    """하나 이상의 단계가 실패함 (성공한 단계 결과/소요 시간 포함)"""
+
+    def __init__(
+        self,
+        errors: dict[str, BaseException],
+        skipped: list[str],
+        results: dict[str, Any],
+        timings: dict[str, float],
+    ) -> None:
+        self.errors = errors
+        self.skipped = skipped
+        self.results = results
+        self.timings = timings
+        detail = ", ".join(f"{name}: {exc}" for name, exc in errors.items())
+        if skipped:
+            detail += f" (건너뜀: {', '.join(skipped)})"
+        super().__init__(f"파이프라인 단계 실패 — {detail}")
+
+
+def _validate(phases: list[Phase]) -> None:
+    """이름 중복, 없는 의존 단계, 순환 의존을 검사합니다."""
+    names = [p.name for p in phases]
+    if len(set(names)) != len(names):
+        raise ValueError(f"단계 이름 중복: {names}")
+    by_name = {p.name: p for p in phases}
+    for phase in phases:
+        unknown = [d for d in phase.depends_on if d not in by_name]
+        if unknown:
+            raise ValueError(f"{phase.name}: 없는 의존 단계 {unknown}")
+
+    # 위상 정렬로 순환 검사
+    remaining = {p.name: set(p.depends_on) for p in phases}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"순환 의존: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+
+def run_pipeline(
+    phases: list[Phase], max_workers: int | None = None
+) -> tuple[dict[str, Any], dict[str, float]]:
+    """의존 관계를 지키며 단계를 동시에 실행합니다.
+
+    Args:
+        phases: 실행할 단계 리스트
+        max_workers: 동시에 실행할 최대 단계 수 (None이면 단계 수)
+
+    Returns:
+        (단계 이름 → 반환값, 단계 이름 → 소요 시간(초)) 튜플
+
+    Raises:
+        ValueError: 단계 정의가 잘못된 경우 (실행 전 검사)
+        PipelineError: 하나 이상의 단계가 예외를 던진 경우
+    """
+    _validate(phases)
+
+    results: dict[str, Any] = {}
+    timings: dict[str, float] = {}
+    errors: dict[str, BaseException] = {}
+    skipped: list[str] = []
+    pending = {p.name: p for p in phases}
+    running: dict[Future, Phase] = {}
+    started_at = time.monotonic()
+
+    def timed(phase: Phase, args: list[Any]) -> Any:
+        start = time.monotonic()
+        logger.info("[%s] 시작", phase.name)
+        try:
+            return phase.func(*args)
+        finally:
+            timings[phase.name] = time.monotonic() - start
+
+    with ThreadPoolExecutor(max_workers=max_workers or max(len(phases), 1)) as pool:
+        while pending or running:
+            # 의존 단계가 실패/스킵된 단계는 건너뜀 (연쇄)
+            blocked = True
+            while blocked:
+                blocked = False
+                for name, phase in list(pending.items()):
+                    if any(d in errors or d in skipped for d in phase.depends_on):
+                        logger.warning("[%s] 의존 단계 실패로 건너뜀", name)
+                        skipped.append(name)
+                        del pending[name]
+                        blocked = True
+
+            for name, phase in list(pending.items()):
+                if all(d in results for d in phase.depends_on):
+                    args = [results[d] for d in phase.depends_on]
+                    running[pool.submit(timed, phase, args)] = phase
+                    del pending[name]
+
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                phase = running.pop(future)
+                try:
+                    results[phase.name] = future.result()
+                    logger.info("[%s] 완료 (%.1f초)", phase.name, timings[phase.name])
+                except Exception as exc:
+                    errors[phase.name] = exc
+                    logger.error("[%s] 실패 (%.1f초): %s", phase.name, timings[phase.name], exc)
+
+    logger.info(
+        "파이프라인 소요 %.1f초 (단계 합계 %.1f초)",
+        time.monotonic() - started_at,
+        sum(timings.values()),
+    )
+    if errors:
+        raise PipelineError(errors, skipped, results, timings)
+    return results, timings
+
+
+def map_isolated(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> Iterator[tuple[T, R | None, Exception | None]]:
+    """items 를 최대 max_workers 개씩 동시에 처리하고 입력 순서대로 결과를 내보냅니다.
+
+    한 항목의 예외는 그 항목의 결과로만 전달되며 다른 항목 처리에 영향을 주지 않습니다.
+    앞 항목이 끝나는 대로 순서대로 yield 하므로 결과를 받는 쪽은 입력 순서를 유지합니다.
+
+    Args:
+        func: 항목 하나를 처리하는 함수
+        items: 처리할 항목
+        max_workers: 동시 처리 수
+
+    Yields:
+        (항목, 반환값 또는 None, 예외 또는 None) 튜플
+    """
+    items = list(items)
+    if not items:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        futures = [pool.submit(func, item) for item in items]
+        for item, future in zip(items, futures):
+            try:
+                yield item, future.result(), None
+            except Exception as exc:
+                yield item, None, exc
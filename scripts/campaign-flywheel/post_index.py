@@ -0,0 +1,190 @@
+"""기존 포스트 키 인덱스 — campaign_posts 전체 post_key 를 매 실행 조회하지 않도록
+
+포스트 키를 64비트 해시로 바꿔 정렬 배열(array('Q'))에 보관하고 이진 탐색으로
+멤버십을 확인합니다. 100만 건 기준 약 8MB (문자열 set 대비 1/10 이하),
+서로 다른 키의 해시 충돌 확률은 건당 약 n / 2^64 로 사실상 정확합니다.
+
+인덱스는 로컬 파일에 캐시하고, 다음 실행에서는 campaign_posts.seq(증가 ID)가
+마지막으로 본 값보다 큰 행만 keyset 페이지네이션으로 가져와 추가합니다.
+행 삭제는 반영되지 않으므로 일정 기간마다 전체를 다시 만듭니다.
+"""
+from __future__ import annotations
+
+import heapq
+import hashlib
+import json
+import logging
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+# 파일 형식 버전 (헤더 JSON 한 줄 + 리틀 엔디언 uint64 배열)
+_FORMAT_VERSION = 1
+
+# Supabase 페이지 크기 (PostgREST 기본 max-rows 이하)
+INDEX_PAGE_SIZE = 1000
+
+
+def _hash_key(key: str) -> int:
+    """포스트 키 → 64비트 해시"""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class PostKeyIndex:
+    """포스트 키 멤버십 인덱스 (정렬된 해시 배열 + 최근 추가분 set)"""
+
+    def __init__(
+        self,
+        hashes: array | None = None,
+        last_seq: int = 0,
+        built_at: str | None = None,
+    ) -> None:
+        self._sorted: array = hashes if hashes is not None else array("Q")
+        self._recent: set[int] = set()
+        self.last_seq = last_seq
+        self.built_at = built_at or datetime.now(timezone.utc).isoformat()
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        h = _hash_key(key)
+        if h in self._recent:
+            return True
+        i = bisect_left(self._sorted, h)
+        return i < len(self._sorted) and self._sorted[i] == h
+
+    def __len__(self) -> int:
+        self._compact()
+        return len(self._sorted)
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """키를 추가합니다 (이미 있는 키는 무시)."""
+        self._recent.update(_hash_key(k) for k in keys)
+        # 최근 추가분이 커지면 정렬 배열로 병합
+        if len(self._recent) > max(4096, len(self._sorted) // 8):
+            self._compact()
+
+    def _compact(self) -> None:
+        """최근 추가분을 정렬 배열에 병합합니다 (중복 제거)."""
+        if not self._recent:
+            return
+        merged = array("Q")
+        prev = None
+        for h in heapq.merge(self._sorted, sorted(self._recent)):
+            if h != prev:
+                merged.append(h)
+                prev = h
+        self._sorted = merged
+        self._recent.clear()
+
+    @classmethod
+    def load(cls, path: Path) -> "PostKeyIndex | None":
+        """인덱스 파일을 읽어 반환합니다. 없거나 손상되면 None."""
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                if header.get("version") != _FORMAT_VERSION:
+                    return None
+                hashes = array("Q")
+                hashes.frombytes(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, AttributeError) as exc:
+            logger.warning("포스트 키 인덱스 로드 실패 — 전체 재생성: %s", exc)
+            return None
+        if len(hashes) != header.get("count"):
+            logger.warning("포스트 키 인덱스 크기 불일치 — 전체 재생성")
+            return None
+        if sys.byteorder == "big":
+            hashes.byteswap()
+        return cls(hashes, last_seq=int(header.get("last_seq", 0)), built_at=header.get("built_at"))
+
+    def save(self, path: Path) -> None:
+        """인덱스를 파일에 원자적으로 저장합니다."""
+        self._compact()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        hashes = self._sorted
+        if sys.byteorder == "big":
+            hashes = array("Q", hashes)
+            hashes.byteswap()
+        header = {
+            "version": _FORMAT_VERSION,
+            "last_seq": self.last_seq,
+            "built_at": self.built_at,
+            "count": len(hashes),
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(hashes.tobytes())
+        os.replace(tmp_path, path)
+
+
+def _is_stale(index: PostKeyIndex, now: datetime, max_age: timedelta) -> bool:
+    try:
+        built_at = datetime.fromisoformat(index.built_at.replace("Z", "+00:00"))
+    except (AttributeError, ValueError):
+        return True
+    return now - built_at > max_age
+
+
+def load_post_key_index(
+    supabase_client: Any,
+    path: Path | None,
+    full_refresh_after: timedelta = timedelta(days=7),
+    page_size: int = INDEX_PAGE_SIZE,
+    now: datetime | None = None,
+) -> PostKeyIndex:
+    """로컬 캐시 + 증분 조회로 campaign_posts 포스트 키 인덱스를 만듭니다.
+
+    캐시가 없거나 full_refresh_after 보다 오래되었으면 처음부터 다시 만들고,
+    그렇지 않으면 캐시의 last_seq 이후 행만 가져옵니다. 결과는 path 에 저장합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        path: 인덱스 캐시 파일 경로 (None이면 캐시 미사용)
+        full_refresh_after: 전체 재생성 주기 (삭제된 행 반영용)
+        page_size: 페이지당 행 수
+        now: 기준 시각 (테스트용)
+
+    Returns:
+        PostKeyIndex
+    """
+    now = now or datetime.now(timezone.utc)
+    index = PostKeyIndex.load(path) if path is not None else None
+    if index is not None and _is_stale(index, now, full_refresh_after):
+        logger.info("포스트 키 인덱스 전체 재생성 (생성 시각 %s)", index.built_at)
+        index = None
+    if index is None:
+        index = PostKeyIndex(built_at=now.isoformat())
+
+    # seq keyset 페이지네이션 — OFFSET 없이 인덱스 범위 조회
+    fetched = 0
+    while True:
+        rows = (
+            supabase_client.table("campaign_posts")
+            .select("seq, post_key")
+            .gt("seq", index.last_seq)
+            .order("seq")
+            .limit(page_size)
+            .execute()
+            .data
+        ) or []
+        if not rows:
+            break
+        index.add_many(r["post_key"] for r in rows if r.get("post_key"))
+        index.last_seq = max(index.last_seq, max(int(r["seq"]) for r in rows))
+        fetched += len(rows)
+        if len(rows) < page_size:
+            break
+
+    if path is not None:
+        index.save(path)
+    logger.info("포스트 키 인덱스: %d건 (이번 조회 %d건)", len(index), fetched)
+    return index
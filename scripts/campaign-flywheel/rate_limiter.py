@@ -0,0 +1,45 @@
+"""토큰 버킷 레이트 리미터 — 외부 API 분당 쿼터 준수용"""
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷
+
+    분당 rate_per_minute 개의 토큰이 균등하게 채워지며, 최대 burst 개까지
+    누적됩니다. acquire() 는 토큰이 생길 때까지 호출 스레드를 대기시킵니다.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute 는 0보다 커야 합니다.")
+        self._rate_per_sec = rate_per_minute / 60.0
+        self._capacity = float(burst if burst is not None else max(1, int(rate_per_minute // 6)))
+        self._tokens = self._capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 소비합니다. 부족하면 채워질 때까지 대기합니다."""
+        with self._lock:
+            now = self._clock()
+            elapsed = now - self._updated_at
+            self._updated_at = now
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate_per_sec)
+            # 토큰을 미리 예약(음수 허용)하고 락 밖에서 대기 — 대기 순서대로 배분
+            self._tokens -= 1
+            wait = -self._tokens / self._rate_per_sec if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            self._sleep(wait)
@@ -0,0 +1,127 @@
+"""포스트 지표 재수집 스케줄러
+
+최초 수집 이후 게시 경과일 구간(기본 1/3/7/14/30일)마다 지표를 다시
+수집하도록 campaign_posts.next_recollect_at 기준으로 대상 포스트를 고릅니다.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Any, Sequence
+
+# 재수집 대상 조회 시 가져올 칼럼 (write_recollected_to_supabase 에 필요한 값 포함)
+# collected_at 은 재수집 시각으로 덮이므로 최초 수집 시각을 first_collected_at 으로 받아 둠
+_RECOLLECT_COLUMNS = (
+    "post_url, post_key, brand_name, creator_name, ig_handle, post_type, "
+    "source_sheet_id, campaign_code, created_at, recollect_stage, "
+    "first_collected_at:collected_at, views, likes, shares, comments"
+)
+
+# 스냅샷 비교용 지표
+_METRIC_KEYS = ("views", "likes", "shares", "comments")
+
+
+def _parse_ts(raw: str) -> datetime:
+    """Supabase ISO 8601 타임스탬프 파싱 (Z suffix 대응)"""
+    return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+
+
+def schedule_after_refresh(
+    created_at: datetime,
+    now: datetime,
+    buckets_days: Sequence[int],
+) -> tuple[int, datetime | None]:
+    """재수집 후 다음 스케줄을 계산합니다.
+
+    이미 지난 구간은 모두 완료 처리하여, 밀린 포스트도 구간을 하나씩
+    따라잡지 않고 현재 경과일 다음 구간으로 바로 넘어갑니다.
+
+    Args:
+        created_at: 포스트 최초 등록 시각
+        now: 재수집 시각
+        buckets_days: 재수집 경과일 구간 (오름차순)
+
+    Returns:
+        (완료한 구간 수, 다음 재수집 시각 또는 스케줄 종료 시 None) 튜플
+    """
+    age = now - created_at
+    stage = sum(1 for days in buckets_days if age >= timedelta(days=days))
+    if stage >= len(buckets_days):
+        return stage, None
+    return stage, created_at + timedelta(days=buckets_days[stage])
+
+
+def fetch_due_posts(supabase_client: Any, now: datetime, limit: int) -> list[dict]:
+    """재수집 예정 시각이 지난 포스트를 오래 밀린 순으로 최대 limit 건 반환합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        now: 기준 시각
+        limit: 이번 실행에서 재수집할 최대 포스트 수
+
+    Returns:
+        campaign_posts 레코드 딕셔너리 리스트
+    """
+    res = (
+        supabase_client.table("campaign_posts")
+        .select(_RECOLLECT_COLUMNS)
+        .lte("next_recollect_at", now.isoformat())
+        .order("next_recollect_at")
+        .limit(limit)
+        .execute()
+    )
+    return res.data or []
+
+
+def snapshot_baseline(posts: list[dict]) -> dict[str, dict]:
+    """재수집 전 지표를 post_url → 지표 딕셔너리로 보관합니다 (스냅샷 증감 계산용).
+
+    collect_ig_metrics 가 엔트리를 제자리에서 갱신하므로 수집 전에 호출해야 합니다.
+    """
+    return {
+        p["post_url"]: {k: p.get(k) for k in _METRIC_KEYS}
+        for p in posts
+        if p.get("post_url")
+    }
+
+
+def apply_schedule(
+    entries: list[dict],
+    now: datetime,
+    buckets_days: Sequence[int],
+) -> list[dict]:
+    """재수집에 성공한 엔트리에 다음 스케줄(recollect_stage, next_recollect_at)을 기록합니다.
+
+    collected_at 이 없는(수집 실패) 엔트리는 제외하여 다음 실행에서 재시도합니다.
+
+    Returns:
+        스케줄이 갱신된 엔트리 리스트
+    """
+    refreshed: list[dict] = []
+    for entry in entries:
+        if not entry.get("collected_at"):
+            continue
+        stage, next_at = schedule_after_refresh(
+            _parse_ts(entry["created_at"]), now, buckets_days
+        )
+        entry["recollect_stage"] = stage
+        entry["next_recollect_at"] = next_at.isoformat() if next_at else None
+        refreshed.append(entry)
+    return refreshed
+
+
+def defer_failed(entries: list[dict], now: datetime, delay: timedelta) -> list[dict]:
+    """재수집에 실패한 엔트리는 구간을 유지한 채 delay 뒤로 다음 시도를 미룹니다.
+
+    실패 포스트가 조회 순서 맨 앞에 계속 남아 다른 포스트의 재수집을
+    막지 않도록 next_recollect_at 을 뒤로 옮깁니다.
+
+    Returns:
+        스케줄이 미뤄진 엔트리 리스트
+    """
+    deferred: list[dict] = []
+    for entry in entries:
+        if entry.get("collected_at"):
+            continue
+        entry["next_recollect_at"] = (now + delay).isoformat()
+        deferred.append(entry)
+    return deferred
@@ -0,0 +1,125 @@
+"""로컬 디스크 응답 캐시 — SQLite + zlib 압축 JSON
+
+개발/장애 후 재실행 시 동일한 시트 데이터를 다시 내려받지 않도록
+API 응답을 키별로 저장합니다. 전체 크기 상한을 넘으면 가장 오래 전에
+조회된 항목부터 제거(LRU)하고, TTL이 지난 항목은 미스로 처리합니다.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Callable
+
+# 캐시 미스 표식 (빈 리스트 등 falsy 값도 정상 캐시 값이므로 None 대신 사용)
+MISS = object()
+
+
+class ResponseCache:
+    """크기 제한 LRU + TTL 디스크 캐시 (스레드 안전)"""
+
+    def __init__(
+        self,
+        path: Path | str,
+        max_bytes: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY,"
+            " value BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at ON responses(accessed_at)"
+        )
+        self._conn.commit()
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, max_age: float | None = None) -> Any:
+        """캐시 값을 반환합니다. 없거나 만료되면 MISS.
+
+        Args:
+            key: 캐시 키
+            max_age: 이 항목에만 적용할 TTL(초). None이면 기본 TTL.
+        """
+        ttl = self._ttl_seconds if max_age is None else max_age
+        now = self._clock()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[1] > ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return MISS
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, value: Any) -> None:
+        """값을 저장하고 크기 상한을 넘으면 LRU 순으로 제거합니다."""
+        blob = zlib.compress(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+        if len(blob) > self._max_bytes:
+            return
+        now = self._clock()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """총 크기가 상한 이하가 될 때까지 가장 오래 조회되지 않은 항목 삭제"""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self._max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self._max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def stats(self) -> dict:
+        """히트/미스 카운터와 현재 저장 크기를 반환합니다."""
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "entries": entries,
+            "bytes": size,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
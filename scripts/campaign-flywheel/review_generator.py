@@ -8,7 +8,13 @@ from __future__ import annotations
 import json
 import os
 import sys
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any, Iterable
+
+from identity import normalize_creator_key
+
+if TYPE_CHECKING:
+    from rate_limiter import TokenBucket
 
 # shared-env 경로 추가 (krns_automation 모듈 접근)
 _shared_env_path = os.path.join(os.path.dirname(__file__), "..", "..", "shared-env")
@@ -19,6 +25,55 @@ sys.path.insert(0, _shared_env_path)
 # KPI 계산
 # ---------------------------------------------------------------------------
 
+# calculate_campaign_kpis 가 쓰는 campaign_posts 칼럼 (+ 그룹 기준 campaign_code)
+KPI_POST_COLUMNS = "id, campaign_code, ig_handle, creator_name, views, likes, shares, comments"
+
+# 캠페인 코드 in.(...) 필터 한 번에 넣을 최대 코드 수 (요청 URL 길이 제한)
+_CODES_PER_QUERY = 100
+
+# 페이지당 행 수 (PostgREST 기본 max-rows 이하)
+_POSTS_PAGE_SIZE = 1000
+
+
+def fetch_posts_by_campaign(
+    supabase_client: Any, codes: list[str], page_size: int = _POSTS_PAGE_SIZE
+) -> dict[str, list[dict]]:
+    """여러 캠페인의 포스트를 in_ 쿼리로 한꺼번에 조회해 캠페인 코드별로 묶습니다.
+
+    KPI 계산에 필요한 칼럼(KPI_POST_COLUMNS)만 가져오며, 결과는 id 순으로
+    페이지 단위 조회합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        codes: 캠페인 코드 리스트
+        page_size: 페이지당 행 수
+
+    Returns:
+        캠페인 코드 → 포스트 딕셔너리 리스트 (포스트가 없는 코드는 빈 리스트)
+    """
+    posts_by_code: dict[str, list[dict]] = {code: [] for code in codes}
+    unique_codes = list(posts_by_code)
+    for i in range(0, len(unique_codes), _CODES_PER_QUERY):
+        code_batch = unique_codes[i : i + _CODES_PER_QUERY]
+        offset = 0
+        while True:
+            rows = (
+                supabase_client.table("campaign_posts")
+                .select(KPI_POST_COLUMNS)
+                .in_("campaign_code", code_batch)
+                .order("id")
+                .range(offset, offset + page_size - 1)
+                .execute()
+                .data
+            ) or []
+            for row in rows:
+                posts_by_code.setdefault(row["campaign_code"], []).append(row)
+            if len(rows) < page_size:
+                break
+            offset += page_size
+    return posts_by_code
+
+
 def calculate_campaign_kpis(posts: list[dict], financials: dict) -> dict:
     """캠페인 포스트 목록과 재무 데이터로 KPI를 집계합니다.
 
@@ -31,10 +86,10 @@ def calculate_campaign_kpis(posts: list[dict], financials: dict) -> dict:
     Returns:
         집계된 KPI 딕셔너리
     """
-    total_views = sum(p.get("views", 0) for p in posts)
-    total_likes = sum(p.get("likes", 0) for p in posts)
-    total_shares = sum(p.get("shares", 0) for p in posts)
-    total_comments = sum(p.get("comments", 0) for p in posts)
+    total_views = sum(p.get("views") or 0 for p in posts)
+    total_likes = sum(p.get("likes") or 0 for p in posts)
+    total_shares = sum(p.get("shares") or 0 for p in posts)
+    total_comments = sum(p.get("comments") or 0 for p in posts)
     total_engagement = total_likes + total_shares + total_comments
 
     contract_amount = financials.get("contract_amount_krw", 0) or 0
@@ -46,10 +101,10 @@ def calculate_campaign_kpis(posts: list[dict], financials: dict) -> dict:
     cpe = (contract_amount / total_engagement) if total_engagement > 0 else 0
     margin_rate = (margin_krw / contract_amount * 100) if contract_amount > 0 else 0
 
-    # 크리에이터별 집계 (ig_handle 기준, 없으면 creator_name)
+    # 크리에이터별 집계 (identity.normalize_creator_key — creator_first_seen 과 같은 키)
     creator_map: dict[str, dict] = {}
     for p in posts:
-        key = p.get("ig_handle") or p.get("creator_name", "unknown")
+        key = normalize_creator_key(p.get("ig_handle"), p.get("creator_name")) or "unknown"
         if key not in creator_map:
             creator_map[key] = {
                 "ig_handle": p.get("ig_handle"),
@@ -61,12 +116,12 @@ def calculate_campaign_kpis(posts: list[dict], financials: dict) -> dict:
                 "total_engagement": 0,
             }
         entry = creator_map[key]
-        entry["views"] += p.get("views", 0)
-        entry["likes"] += p.get("likes", 0)
-        entry["shares"] += p.get("shares", 0)
-        entry["comments"] += p.get("comments", 0)
+        entry["views"] += p.get("views") or 0
+        entry["likes"] += p.get("likes") or 0
+        entry["shares"] += p.get("shares") or 0
+        entry["comments"] += p.get("comments") or 0
         entry["total_engagement"] += (
-            p.get("likes", 0) + p.get("shares", 0) + p.get("comments", 0)
+            (p.get("likes") or 0) + (p.get("shares") or 0) + (p.get("comments") or 0)
         )
 
     creators_sorted = sorted(creator_map.values(), key=lambda c: c["views"], reverse=True)
@@ -95,6 +150,49 @@ def calculate_campaign_kpis(posts: list[dict], financials: dict) -> dict:
     }
 
 
+def fetch_periodic_summary(
+    supabase_client: Any,
+    period_start: str,
+    period_end: str,
+    prev_period_start: str,
+    active_statuses: Iterable[str],
+) -> dict:
+    """정기 리뷰 요약을 campaign_periodic_summary RPC 한 번으로 조회합니다.
+
+    집계(합계, 활성 캠페인 수, 신규/재참여 크리에이터·브랜드 수)는 DB 안에서
+    계산되므로 기간이나 누적 이력이 커져도 내려받는 데이터 크기는 일정합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        period_start: 당기 시작일 (YYYY-MM-DD)
+        period_end: 당기 종료일 (YYYY-MM-DD, 요약에 그대로 기록)
+        prev_period_start: 전기 시작일 (YYYY-MM-DD, 전기 종료 = 당기 시작)
+        active_statuses: 진행 중으로 간주할 status 값
+
+    Returns:
+        build_periodic_review_prompt 에 넘길 요약 딕셔너리
+    """
+    data = supabase_client.rpc(
+        "campaign_periodic_summary",
+        {
+            "p_period_start": period_start,
+            "p_prev_period_start": prev_period_start,
+            "p_active_statuses": sorted(active_statuses),
+        },
+    ).execute().data or {}
+    return {
+        "period_start": period_start,
+        "period_end": period_end,
+        "total_campaigns": data.get("total_campaigns", 0),
+        "active_campaigns": data.get("active_campaigns", 0),
+        "total_contract_krw": data.get("total_contract_krw", 0),
+        "total_margin_krw": data.get("total_margin_krw", 0),
+        "prev_period": data.get("prev_period", {}),
+        "creator_pool_stats": data.get("creator_pool_stats", {}),
+        "brand_stats": data.get("brand_stats", {}),
+    }
+
+
 # ---------------------------------------------------------------------------
 # 프롬프트 빌더
 # ---------------------------------------------------------------------------
@@ -237,18 +335,37 @@ def build_periodic_review_prompt(summary: dict) -> str:
 # Claude API 호출
 # ---------------------------------------------------------------------------
 
-def generate_review(prompt: str) -> str:
+# 스레드 간 공유하는 Anthropic 클라이언트 (커넥션 풀 재사용, 스레드 안전)
+_anthropic_client: Any = None
+_anthropic_lock = threading.Lock()
+
+
+def _get_anthropic_client() -> Any:
+    global _anthropic_client
+    with _anthropic_lock:
+        if _anthropic_client is None:
+            import anthropic
+
+            _anthropic_client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+        return _anthropic_client
+
+
+def generate_review(prompt: str, rate_limiter: "TokenBucket | None" = None) -> str:
     """Claude API를 호출하여 리뷰 텍스트를 생성합니다.
 
+    여러 스레드에서 동시에 호출할 수 있으며, rate_limiter 가 주어지면
+    요청 전에 토큰을 확보해 분당 요청 수를 제한합니다.
+
     Args:
         prompt: Claude에 전달할 프롬프트 문자열
+        rate_limiter: Anthropic API 요청 레이트 리미터 (None이면 제한 없음)
 
     Returns:
         생성된 리뷰 텍스트
     """
-    import anthropic
-
-    client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+    client = _get_anthropic_client()
+    if rate_limiter is not None:
+        rate_limiter.acquire()
     message = client.messages.create(
         model="claude-sonnet-4-20250514",
         max_tokens=2000,
@@ -3,16 +3,22 @@
 
 Flow:
   Phase 1: 콘텐츠 성과 수집 (PM 드라이브 시트 스캔 → Apify → Supabase)
+           + 기존 포스트 지표 재수집 (게시 후 1/3/7/14/30일 구간)
   Phase 2: 재무 데이터 동기화 (Dashboard 탭 → campaign_financials)
   Phase 3: 캠페인 완료 회고 감지 (신규 완료 → KPI → 리뷰 → Notion + Slack)
+
+Phase 1 과 Phase 2 는 동시에 실행되고, Phase 3 은 Phase 2 의 Dashboard 레코드와
+Phase 1 의 신규 포스트 기록이 끝난 뒤 (재수집과 겹쳐서) 실행됩니다 (pipeline.py).
 """
 
 from __future__ import annotations
 
 import logging
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from itertools import islice
 from pathlib import Path
+from typing import Iterable, Iterator
 
 # ── shared-env 경로 주입 ──
 sys.path.insert(0, str(Path.home() / ".config" / "shared-env"))
@@ -37,21 +43,76 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _chunked(items: Iterable[dict], size: int) -> Iterator[list[dict]]:
+    """iterable 을 size 개씩 끊어 리스트로 내보냅니다."""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
 def main() -> None:
     import os
     import supabase as supabase_lib
     from sheets_client import SheetsClient
-    from sheet_scanner import scan_all_sheets
+    from sheet_scanner import iter_new_entries
+    from scan_manifest import ScanManifest
+    from post_index import load_post_key_index
+    from rate_limiter import TokenBucket
+    from response_cache import ResponseCache
+    from metrics_cache import MetricsCache
+    from batch_tuner import BatchTuner
+    from pipeline import Phase, map_isolated, run_pipeline
+    from checkpoint import (
+        CheckpointJournal,
+        STAGE_COLLECTED,
+        STAGE_INSIGHT_WRITTEN,
+        STAGE_STORED,
+    )
     from apify_collector import collect_ig_metrics
-    from dashboard_etl import parse_all_dashboard_rows, detect_newly_completed
-    from insight_writer import write_to_insight_tab, write_to_supabase, write_financials_to_supabase
+    from dashboard_etl import DASHBOARD_COLUMNS, parse_dashboard_columns, detect_newly_completed
+    from insight_writer import (
+        write_to_insight_tab,
+        write_to_supabase,
+        write_recollected_to_supabase,
+        write_snapshots,
+        write_financials_to_supabase,
+    )
+    from recollector import fetch_due_posts, snapshot_baseline, apply_schedule, defer_failed
     from review_generator import (
         calculate_campaign_kpis,
+        fetch_posts_by_campaign,
         build_completion_review_prompt,
         generate_review,
         notify_slack_review,
     )
-    from config import MKT_OPS_MASTER_SHEET_ID, DASHBOARD_TAB
+    from config import (
+        MKT_OPS_MASTER_SHEET_ID,
+        DASHBOARD_TAB,
+        SCAN_MANIFEST_FILE,
+        COLLECT_CHUNK_SIZE,
+        APIFY_BATCH_SIZE,
+        APIFY_MAX_CONCURRENT_RUNS,
+        APIFY_BATCH_SIZE_MIN,
+        APIFY_BATCH_SIZE_MAX,
+        APIFY_MAX_COMPUTE_UNITS_PER_URL,
+        BATCH_TUNER_FILE,
+        COLLECT_CHECKPOINT_FILE,
+        POST_KEY_INDEX_FILE,
+        POST_KEY_INDEX_FULL_REFRESH_DAYS,
+        SCAN_WORKERS,
+        SHEETS_READ_REQUESTS_PER_MINUTE,
+        SHEETS_CACHE_ENABLED,
+        SHEETS_CACHE_FILE,
+        SHEETS_CACHE_MAX_BYTES,
+        SHEETS_CACHE_TTL_SECONDS,
+        METRICS_CACHE_FILE,
+        METRICS_CACHE_MAX_AGE_HOURS,
+        RECOLLECT_AGE_BUCKETS_DAYS,
+        RECOLLECT_MAX_URLS_PER_RUN,
+        RECOLLECT_RETRY_DELAY_HOURS,
+        REVIEW_MAX_CONCURRENCY,
+        ANTHROPIC_REQUESTS_PER_MINUTE,
+    )
 
     logger.info("=" * 60)
     logger.info("캠페인 플라이휠 수집 파이프라인 시작")
@@ -63,85 +124,232 @@ def main() -> None:
         os.environ["SUPABASE_URL"],
         os.environ["SUPABASE_SERVICE_ROLE_KEY"],
     )
-    sheets = SheetsClient()
+    sheets_cache = (
+        ResponseCache(SHEETS_CACHE_FILE, SHEETS_CACHE_MAX_BYTES, SHEETS_CACHE_TTL_SECONDS)
+        if SHEETS_CACHE_ENABLED
+        else None
+    )
+    sheets = SheetsClient(
+        rate_limiter=TokenBucket(SHEETS_READ_REQUESTS_PER_MINUTE),
+        cache=sheets_cache,
+    )
+
+    metrics_cache = MetricsCache(METRICS_CACHE_FILE)
+    anthropic_limiter = TokenBucket(ANTHROPIC_REQUESTS_PER_MINUTE)
+    batch_tuner = BatchTuner.load(
+        BATCH_TUNER_FILE,
+        batch_size=APIFY_BATCH_SIZE,
+        min_size=APIFY_BATCH_SIZE_MIN,
+        max_size=APIFY_BATCH_SIZE_MAX,
+        max_compute_units_per_url=APIFY_MAX_COMPUTE_UNITS_PER_URL,
+    )
 
     # ── Phase 1: 콘텐츠 성과 수집 ──
-    logger.info("[Phase 1] 콘텐츠 성과 수집 시작")
+    journal = CheckpointJournal.open(COLLECT_CHECKPOINT_FILE)
 
-    existing_res = sb.table("campaign_posts").select("post_url").execute()
-    existing_urls: set[str] = {r["post_url"] for r in (existing_res.data or []) if r.get("post_url")}
-    logger.info("기존 수집 URL: %d건", len(existing_urls))
+    def store_chunk(chunk_id: str, entries: list[dict], done: set[str]) -> None:
+        """청크를 수집/기록합니다 — 저널에 완료로 기록된 단계는 건너뜀."""
+        if STAGE_COLLECTED in done:
+            enriched = entries
+        else:
+            enriched = collect_ig_metrics(
+                entries,
+                batch_size=APIFY_BATCH_SIZE,
+                max_concurrent_runs=APIFY_MAX_CONCURRENT_RUNS,
+                metrics_cache=metrics_cache,
+                max_age=timedelta(hours=METRICS_CACHE_MAX_AGE_HOURS),
+                tuner=batch_tuner,
+            )
+            journal.record(chunk_id, STAGE_COLLECTED, enriched)
 
-    new_entries = scan_all_sheets(sheets, existing_urls)
-    logger.info("신규 URL 발견: %d건", len(new_entries))
+        written_sheets = 0
+        if STAGE_INSIGHT_WRITTEN not in done:
+            written_sheets = write_to_insight_tab(sheets, enriched)
+            journal.record(chunk_id, STAGE_INSIGHT_WRITTEN)
 
-    if new_entries:
-        enriched = collect_ig_metrics(new_entries)
-        written_sheets = write_to_insight_tab(sheets, enriched)
         written_sb = write_to_supabase(sb, enriched)
-        logger.info("Insight 탭 기록: %d행, Supabase 업로드: %d건", written_sheets, written_sb)
-    else:
-        logger.info("신규 콘텐츠 없음 — Phase 1 스킵")
+        write_snapshots(sb, enriched)
+        journal.record(chunk_id, STAGE_STORED)
+
+        failed = sum(1 for e in enriched if e.get("collection_status") != "collected")
+        logger.info(
+            "Insight 탭 기록: %d행, Supabase 업로드: %d건 (미수집 %d건)",
+            written_sheets, written_sb, failed,
+        )
+
+    def collect_new_posts() -> int:
+        # 지난 실행에서 수집 후 기록 전에 중단된 청크부터 마무리 (재수집 없이)
+        # 포스트 키 인덱스보다 먼저 기록해야 아래 스캔에서 신규로 다시 잡히지 않음
+        resumed = journal.pending()
+        for chunk_id, entries, done in resumed:
+            logger.info(
+                "체크포인트 재개: %d건 (완료 단계: %s)",
+                len(entries), ", ".join(sorted(done)),
+            )
+            store_chunk(chunk_id, entries, done)
+
+        existing_keys = load_post_key_index(
+            sb,
+            POST_KEY_INDEX_FILE,
+            full_refresh_after=timedelta(days=POST_KEY_INDEX_FULL_REFRESH_DAYS),
+        )
+        logger.info("기존 수집 포스트: %d건", len(existing_keys))
+
+        manifest = ScanManifest.load(SCAN_MANIFEST_FILE)
+        new_entries_iter = iter_new_entries(
+            sheets, existing_keys, manifest=manifest, workers=SCAN_WORKERS
+        )
+
+        # 시트를 읽는 동안 앞서 발견된 URL부터 청크 단위로 수집/기록
+        new_count = 0
+        for chunk in _chunked(new_entries_iter, COLLECT_CHUNK_SIZE):
+            new_count += len(chunk)
+            logger.info("신규 URL %d건 수집 시작 (누적 %d건)", len(chunk), new_count)
+            store_chunk(journal.new_chunk_id(), chunk, set())
+
+        manifest.save()
+        journal.clear()
+        logger.info("신규 URL 발견: %d건", new_count)
+        if not new_count:
+            logger.info("신규 콘텐츠 없음 — Phase 1 스킵")
+        return new_count + sum(len(entries) for _, entries, _ in resumed)
+
+    # ── Phase 1b: 기존 포스트 지표 재수집 ──
+    # 신규 수집과 같은 Apify 동시 실행 한도/배치 조정 상태를 쓰므로 그 뒤에 실행
+    def recollect_posts(_new_count: int) -> int:
+        now = datetime.now(timezone.utc)
+        due_posts = fetch_due_posts(sb, now, RECOLLECT_MAX_URLS_PER_RUN)
+        logger.info("재수집 대상 포스트: %d건 (최대 %d건)", len(due_posts), RECOLLECT_MAX_URLS_PER_RUN)
+        written_re = 0
+        if due_posts:
+            baseline = snapshot_baseline(due_posts)
+            collect_ig_metrics(
+                due_posts,
+                batch_size=APIFY_BATCH_SIZE,
+                max_concurrent_runs=APIFY_MAX_CONCURRENT_RUNS,
+                metrics_cache=metrics_cache,
+                max_age=timedelta(hours=METRICS_CACHE_MAX_AGE_HOURS),
+                tuner=batch_tuner,
+            )
+            refreshed = apply_schedule(due_posts, now, RECOLLECT_AGE_BUCKETS_DAYS)
+            deferred = defer_failed(
+                due_posts, now, timedelta(hours=RECOLLECT_RETRY_DELAY_HOURS)
+            )
+            written_re = write_recollected_to_supabase(sb, refreshed + deferred)
+            written_snap = write_snapshots(sb, refreshed, previous=baseline)
+            logger.info(
+                "재수집 반영: %d건 (실패 %d건은 재시도 예약), 변경 스냅샷: %d건",
+                written_re, len(deferred), written_snap,
+            )
+
+        batch_tuner.save()
+        logger.info("Apify 배치 크기 (다음 실행 기준): %d", batch_tuner.batch_size)
+        return written_re
 
     # ── Phase 2: 재무 데이터 동기화 ──
-    logger.info("[Phase 2] 재무 데이터 동기화 시작")
+    fin_stats: dict[str, int] = {}
 
-    dashboard_rows = sheets.read_tab(MKT_OPS_MASTER_SHEET_ID, DASHBOARD_TAB)
-    records = parse_all_dashboard_rows(dashboard_rows)
-    written_fin = write_financials_to_supabase(sb, records)
-    logger.info("campaign_financials upsert: %d건", written_fin)
+    def sync_financials() -> list[dict]:
+        dashboard_columns = sheets.read_columns(MKT_OPS_MASTER_SHEET_ID, DASHBOARD_TAB, DASHBOARD_COLUMNS)
+        records = parse_dashboard_columns(dashboard_columns)
+        fin_counts = write_financials_to_supabase(sb, records)
+        logger.info(
+            "campaign_financials upsert: 신규 %d건, 변경 %d건 (변경 없음 %d건 스킵)",
+            fin_counts["inserted"],
+            fin_counts["updated"],
+            fin_counts["unchanged"],
+        )
+        fin_stats.update(fin_counts)
+        return records
 
     # ── Phase 3: 캠페인 완료 회고 감지 ──
-    logger.info("[Phase 3] 캠페인 완료 회고 감지 시작")
-
-    reviewed_res = sb.table("campaign_reviews").select("campaign_code").execute()
-    already_reviewed: set[str] = {
-        r["campaign_code"] for r in (reviewed_res.data or []) if r.get("campaign_code")
-    }
-
-    newly_completed = detect_newly_completed(records, already_reviewed)
-    logger.info("미리뷰 완료 캠페인: %d건", len(newly_completed))
-
-    for campaign in newly_completed:
-        code = campaign["campaign_code"]
-        brand = campaign.get("brand_name", "")
-        logger.info("리뷰 생성 중: %s (%s)", code, brand)
-
-        try:
-            posts_res = (
-                sb.table("campaign_posts")
-                .select("*")
-                .eq("campaign_code", code)
-                .execute()
-            )
-            posts = posts_res.data or []
+    # Dashboard 레코드(Phase 2)와, KPI 계산에 쓰는 신규 포스트(Phase 1) 기록 이후에 실행
+    def review_completed(records: list[dict], _new_count: int) -> int:
+        reviewed_res = sb.table("campaign_reviews").select("campaign_code").execute()
+        already_reviewed: set[str] = {
+            r["campaign_code"] for r in (reviewed_res.data or []) if r.get("campaign_code")
+        }
+
+        newly_completed = detect_newly_completed(records, already_reviewed)
+        logger.info("미리뷰 완료 캠페인: %d건", len(newly_completed))
+
+        # 완료 캠페인 전체의 포스트를 한 번에 조회 (KPI 칼럼만)
+        posts_by_code = fetch_posts_by_campaign(
+            sb, [c["campaign_code"] for c in newly_completed]
+        ) if newly_completed else {}
+
+        def draft_review(campaign: dict) -> tuple[dict, str]:
+            """KPI → Claude 리뷰 생성 (워커 스레드에서 실행)"""
+            code = campaign["campaign_code"]
+            logger.info("리뷰 생성 중: %s (%s)", code, campaign.get("brand_name", ""))
+            posts = posts_by_code.get(code, [])
 
             kpis = calculate_campaign_kpis(posts, campaign)
             prompt = build_completion_review_prompt(kpis, campaign)
-            review_text = generate_review(prompt)
+            return kpis, generate_review(prompt, rate_limiter=anthropic_limiter)
 
-            title = f"[완료 리뷰] {brand} — {code}"
+        # 리뷰 생성은 동시에, Slack 알림/저장은 입력 순서대로 (캠페인별로 실패 격리)
+        drafts = map_isolated(draft_review, newly_completed, REVIEW_MAX_CONCURRENCY)
+        for campaign, draft, error in drafts:
+            code = campaign["campaign_code"]
+            brand = campaign.get("brand_name", "")
+            try:
+                if error is not None:
+                    raise error
+                kpis, review_text = draft
 
-            # Slack 알림
-            notify_slack_review(
-                title=title,
-                summary=review_text[:500],
-                review_type="completion",
-            )
+                title = f"[완료 리뷰] {brand} — {code}"
+
+                # Slack 알림
+                notify_slack_review(
+                    title=title,
+                    summary=review_text[:500],
+                    review_type="completion",
+                )
+
+                # Supabase 저장
+                sb.table("campaign_reviews").insert({
+                    "campaign_code": code,
+                    "review_type": "completion",
+                    "insights_json": {"text": review_text, "kpis": kpis},
+                }).execute()
+                logger.info("캠페인 회고 완료: %s", code)
 
-            # Supabase 저장
-            sb.table("campaign_reviews").insert({
-                "campaign_code": code,
-                "review_type": "completion",
-                "insights_json": {"text": review_text, "kpis": kpis},
-            }).execute()
-            logger.info("캠페인 회고 완료: %s", code)
+            except Exception as exc:
+                logger.error("리뷰 생성 실패 (%s): %s", code, exc)
 
-        except Exception as exc:
-            logger.error("리뷰 생성 실패 (%s): %s", code, exc)
+        return len(newly_completed)
+
+    # Phase 1 과 Phase 2 는 서로 독립이므로 동시에 실행
+    results, timings = run_pipeline([
+        Phase("collect", collect_new_posts),
+        Phase("recollect", recollect_posts, depends_on=("collect",)),
+        Phase("financials", sync_financials),
+        Phase("reviews", review_completed, depends_on=("financials", "collect")),
+    ])
+    logger.info(
+        "단계별 소요: %s",
+        ", ".join(f"{name} {seconds:.1f}초" for name, seconds in timings.items()),
+    )
+
+    cache_stats = sheets.cache_stats()
+    if cache_stats:
+        logger.info(
+            "Sheets 캐시: 히트 %d / 미스 %d (%.0f%%), %d건 %.1fMB",
+            cache_stats["hits"],
+            cache_stats["misses"],
+            cache_stats["hit_rate"] * 100,
+            cache_stats["entries"],
+            cache_stats["bytes"] / 1024 / 1024,
+        )
 
     logger.info("수집 파이프라인 완료")
-    notify_slack("캠페인 플라이휠 수집", "success", f"신규 {len(new_entries)}건, 재무 {written_fin}건, 회고 {len(newly_completed)}건")
+    written_fin = fin_stats.get("inserted", 0) + fin_stats.get("updated", 0)
+    notify_slack(
+        "캠페인 플라이휠 수집",
+        "success",
+        f"신규 {results['collect']}건, 재무 {written_fin}건, 회고 {results['reviews']}건",
+    )
 
 
 if __name__ == "__main__":
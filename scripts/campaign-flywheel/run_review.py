@@ -3,7 +3,7 @@
 
 Flow:
   1. 격주 가드: 마지막 periodic 리뷰 < 14일이면 스킵
-  2. 당기(14일) + 전기(이전 14일) 데이터 집계
+  2. 당기(14일) + 전기(이전 14일) 데이터 집계 (campaign_periodic_summary RPC)
   3. 요약 dict 구성 → Claude 리뷰 생성 → Notion 페이지 → Slack 알림
 """
 
@@ -48,6 +48,7 @@ def main() -> None:
     import os
     import supabase as supabase_lib
     from review_generator import (
+        fetch_periodic_summary,
         build_periodic_review_prompt,
         generate_review,
         notify_slack_review,
@@ -103,97 +104,21 @@ def main() -> None:
     logger.info("당기: %s ~ %s", period_start_str, period_end_str)
     logger.info("전기: %s ~ %s", prev_start_str, period_start_str)
 
-    # ── 당기 재무 데이터 ──
-    fin_res = (
-        sb.table("campaign_financials")
-        .select("campaign_code, status, brand_name, contract_amount_krw, margin_krw, start_date")
-        .gte("start_date", period_start_str)
-        .execute()
-    )
-    fin_records = fin_res.data or []
-
-    total_campaigns = len(fin_records)
-    active_campaigns = sum(1 for r in fin_records if r.get("status") in ACTIVE_STATUSES)
-    total_contract_krw = sum((r.get("contract_amount_krw") or 0) for r in fin_records)
-    total_margin_krw = sum((r.get("margin_krw") or 0) for r in fin_records)
-
-    # ── 전기 재무 데이터 ──
-    prev_fin_res = (
-        sb.table("campaign_financials")
-        .select("campaign_code, contract_amount_krw, margin_krw, start_date")
-        .gte("start_date", prev_start_str)
-        .lt("start_date", period_start_str)
-        .execute()
+    # ── 당기/전기 요약 (DB 집계 RPC) ──
+    summary = fetch_periodic_summary(
+        sb,
+        period_start=period_start_str,
+        period_end=period_end_str,
+        prev_period_start=prev_start_str,
+        active_statuses=ACTIVE_STATUSES,
     )
-    prev_records = prev_fin_res.data or []
-    prev_total_campaigns = len(prev_records)
-    prev_total_contract = sum((r.get("contract_amount_krw") or 0) for r in prev_records)
-    prev_total_margin = sum((r.get("margin_krw") or 0) for r in prev_records)
-
-    # ── 크리에이터 통계 ──
-    posts_res = (
-        sb.table("campaign_posts")
-        .select("ig_handle, creator_name, collected_at")
-        .gte("collected_at", period_start_str)
-        .execute()
-    )
-    posts = posts_res.data or []
-
-    current_creators: set[str] = {
-        p.get("ig_handle") or p.get("creator_name", "") for p in posts if p.get("ig_handle") or p.get("creator_name")
-    }
-
-    prev_posts_res = (
-        sb.table("campaign_posts")
-        .select("ig_handle, creator_name")
-        .lt("collected_at", period_start_str)
-        .execute()
-    )
-    prev_creators: set[str] = {
-        p.get("ig_handle") or p.get("creator_name", "")
-        for p in (prev_posts_res.data or [])
-        if p.get("ig_handle") or p.get("creator_name")
-    }
-
-    new_creators = current_creators - prev_creators
-    returning_creators = current_creators & prev_creators
-
-    # ── 브랜드 통계 ──
-    current_brands: set[str] = {r.get("brand_name", "") for r in fin_records if r.get("brand_name")}
-    prev_brands: set[str] = {r.get("brand_name", "") for r in prev_records if r.get("brand_name")}
-    returning_brands = current_brands & prev_brands
-
-    # ── 요약 dict 구성 ──
-    summary = {
-        "period_start": period_start_str,
-        "period_end": period_end_str,
-        "total_campaigns": total_campaigns,
-        "active_campaigns": active_campaigns,
-        "total_contract_krw": total_contract_krw,
-        "total_margin_krw": total_margin_krw,
-        "prev_period": {
-            "total_campaigns": prev_total_campaigns,
-            "total_contract_krw": prev_total_contract,
-            "total_margin_krw": prev_total_margin,
-        },
-        "creator_pool_stats": {
-            "total": len(current_creators),
-            "new": len(new_creators),
-            "returning": len(returning_creators),
-        },
-        "brand_stats": {
-            "total": len(current_brands),
-            "new": len(current_brands - prev_brands),
-            "returning": len(returning_brands),
-        },
-    }
 
     logger.info(
         "요약: 캠페인 %d건(활성 %d), 계약 %s원, 마진 %s원",
-        total_campaigns,
-        active_campaigns,
-        f"{total_contract_krw:,}",
-        f"{total_margin_krw:,}",
+        summary["total_campaigns"],
+        summary["active_campaigns"],
+        f"{summary['total_contract_krw']:,}",
+        f"{summary['total_margin_krw']:,}",
     )
 
     # ── 리뷰 생성 ──
@@ -0,0 +1,95 @@
+"""시트 스캔 매니페스트 — 변경 없는 스프레드시트 재스캔 방지
+
+시트 ID별로 마지막 스캔 시점의 Drive modifiedTime/version 과
+추출된 포스트 키 집합을 로컬 JSON 파일에 보관합니다.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Container, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class ScanManifest:
+    """시트 ID → {modified_time, version, keys} 매니페스트"""
+
+    def __init__(self, path: Path | None = None, sheets: dict[str, dict] | None = None) -> None:
+        self.path = path
+        self._sheets: dict[str, dict] = sheets or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ScanManifest":
+        """매니페스트 파일을 읽어 반환합니다. 없거나 손상되면 빈 매니페스트."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            sheets = data.get("sheets", {})
+        except FileNotFoundError:
+            sheets = {}
+        except (OSError, ValueError, AttributeError) as exc:
+            logger.warning("스캔 매니페스트 로드 실패 — 전체 스캔으로 진행: %s", exc)
+            sheets = {}
+        return cls(path, sheets)
+
+    def save(self) -> None:
+        """매니페스트를 파일에 원자적으로 저장합니다."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"sheets": self._sheets}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+    def is_unchanged(self, sheet: dict, existing_keys: Container[str]) -> bool:
+        """시트가 마지막 스캔 이후 변경되지 않았는지 확인합니다.
+
+        Drive modifiedTime(및 version)이 동일하고, 지난 스캔에서 추출한 포스트 키가
+        모두 existing_keys 에 반영된 경우에만 True.
+        (스캔 후 수집/기록 전에 실패한 실행의 URL은 다시 파싱되도록)
+        포스트 키 도입 전 형식(urls)의 기록은 변경된 것으로 보고 한 번 다시 읽습니다.
+
+        Args:
+            sheet: list_drive_sheets() 파일 정보 딕셔너리
+            existing_keys: 이미 수집된 포스트의 정규 포스트 키 집합
+
+        Returns:
+            스킵 가능 여부
+        """
+        modified_time = sheet.get("modifiedTime")
+        if not modified_time:
+            return False
+
+        record = self._sheets.get(sheet["id"])
+        if not record or record.get("modified_time") != modified_time:
+            return False
+        if sheet.get("version") and record.get("version") != sheet.get("version"):
+            return False
+
+        if "keys" not in record:
+            return False
+        return all(key in existing_keys for key in record["keys"])
+
+    def update(self, sheet: dict, keys: Iterable[str]) -> None:
+        """시트의 현재 modifiedTime/version 과 추출 포스트 키 집합을 기록합니다."""
+        if not sheet.get("modifiedTime"):
+            return
+        self._sheets[sheet["id"]] = {
+            "modified_time": sheet["modifiedTime"],
+            "version": sheet.get("version"),
+            "keys": sorted(set(keys)),
+        }
+
+    def prune(self, sheet_ids: Iterable[str]) -> None:
+        """드라이브에서 사라진 시트 기록을 제거합니다."""
+        keep = set(sheet_ids)
+        for sheet_id in list(self._sheets):
+            if sheet_id not in keep:
+                del self._sheets[sheet_id]
@@ -1,27 +1,37 @@
 """PM 공유 드라이브 시트에서 Instagram 콘텐츠 URL을 추출하는 스캐너"""
 from __future__ import annotations
 
+import logging
 import re
-from typing import TYPE_CHECKING
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Container, Iterator
 
 from config import PM_SHARED_DRIVE_FOLDER_ID, IG_URL_PATTERN
+from identity import canonical_post_key
 
 if TYPE_CHECKING:
+    from scan_manifest import ScanManifest
     from sheets_client import SheetsClient
 
+logger = logging.getLogger(__name__)
+
 # 브랜드명 추출 정규식 — [KOREANERS] 브랜드명 키워드 패턴
 _BRAND_PATTERN = re.compile(
     r"\[KOREANERS\]\s*(.+?)(?:\s+(?:진행|인플루언서|리스트|마케팅|매장|방문|체험|오프닝|클리닉))"
 )
 
-# Instagram 프로필 URL (콘텐츠 URL 아닌 것) 감지 — /reel/, /p/, /stories/ 없으면 프로필
+# Instagram 프로필 URL (콘텐츠 URL 아닌 것) 감지 — /reel(s)/, /p/, /tv/, /stories/ 없으면 프로필
 _PROFILE_ONLY_PATTERN = re.compile(
-    r"https?://(?:www\.)?instagram\.com/(?!(?:reel|p|stories)/)"
+    r"https?://(?:www\.)?instagram\.com/(?!(?:reels?|p|tv|stories)/)"
 )
 
 # post_type 판별
 _POST_TYPE_MAP = {
     "/reel/": "reels",
+    "/reels/": "reels",
+    "/tv/": "reels",
     "/p/": "feed",
     "/stories/": "story",
 }
@@ -32,6 +42,13 @@ _IG_HANDLE_PATTERN = re.compile(r"^@\w+$|instagram\.com/[\w.]+")
 # 크리에이터 이름 — 짧은 텍스트(20자 미만), 숫자만인 값 제외
 _NAME_MAX_LEN = 20
 
+# 콘텐츠 URL / 파일명(확장자) 패턴 — 셀마다 재컴파일하지 않도록 모듈 레벨에서 컴파일
+_CONTENT_URL_PATTERN = re.compile(IG_URL_PATTERN)
+_FILE_EXT_PATTERN = re.compile(r"\.\w{2,4}$")
+
+# 콘텐츠 URL 사전 필터 — 이 문자열이 없는 셀은 정규식 탐색 생략
+_IG_HOST = "instagram.com"
+
 
 def _extract_post_type(url: str) -> str:
     """URL에서 post_type을 판별합니다."""
@@ -42,42 +59,20 @@ def _extract_post_type(url: str) -> str:
 
 
 def _is_content_url(url: str) -> bool:
-    """콘텐츠 URL (reel/p/stories)인지 확인합니다. 프로필 URL은 False."""
-    return bool(re.search(IG_URL_PATTERN, url))
+    """콘텐츠 URL (reel(s)/p/tv/stories)인지 확인합니다. 프로필 URL은 False."""
+    return bool(_CONTENT_URL_PATTERN.search(url))
 
 
-def _extract_creator_from_left_cells(row: list[str], url_col_idx: int) -> tuple[str, str]:
-    """URL 칼럼 왼쪽 셀들에서 ig_handle과 creator_name을 추출합니다.
+def _is_creator_name(cell: str) -> bool:
+    """크리에이터 이름 후보인지 확인합니다.
 
-    Returns:
-        (ig_handle, creator_name) 튜플
+    20자 미만, 숫자만은 아님, 파일 확장자 패턴 제외.
     """
-    ig_handle = ""
-    creator_name = ""
-
-    left_cells = row[:url_col_idx]
-    for cell in left_cells:
-        cell = cell.strip()
-        if not cell:
-            continue
-
-        # IG 핸들: @로 시작하거나 instagram.com/ 포함
-        if cell.startswith("@") or "instagram.com/" in cell:
-            if not ig_handle:
-                ig_handle = cell
-            continue
-
-        # 크리에이터 이름: 20자 미만, 숫자만은 아님, 파일 확장자 패턴 제외
-        is_file_name = bool(re.search(r"\.\w{2,4}$", cell))
-        if (
-            len(cell) < _NAME_MAX_LEN
-            and not cell.replace(",", "").replace(".", "").isdigit()
-            and not is_file_name
-        ):
-            if not creator_name:
-                creator_name = cell
-
-    return ig_handle, creator_name
+    return (
+        len(cell) < _NAME_MAX_LEN
+        and not cell.replace(",", "").replace(".", "").isdigit()
+        and not _FILE_EXT_PATTERN.search(cell)
+    )
 
 
 def extract_ig_urls_from_rows(
@@ -87,42 +82,60 @@ def extract_ig_urls_from_rows(
 ) -> list[dict]:
     """시트 rows에서 Instagram 콘텐츠 URL을 추출합니다.
 
+    각 행을 왼쪽에서 오른쪽으로 한 번만 훑으며, 지금까지 본 셀 중 첫 IG 핸들
+    (@로 시작하거나 instagram.com/ 포함)과 첫 크리에이터 이름 후보를 누적합니다.
+    URL이 발견되면 그 시점의 누적값이 곧 URL 왼쪽 셀들에서 찾은 값입니다.
+
     Args:
         rows: 시트의 원시 행 데이터 (헤더 포함)
         brand_name: 브랜드명
         sheet_id: 소스 시트 ID
 
+    같은 포스트의 URL 변형(/reel/ · /p/ · 쿼리 등)은 정규 포스트 키로 한 번만 추출합니다.
+
     Returns:
-        추출된 URL 정보 딕셔너리 리스트
+        추출된 URL 정보 딕셔너리 리스트 (post_key 포함)
     """
     results: list[dict] = []
-    seen_urls: set[str] = set()
-    content_url_re = re.compile(IG_URL_PATTERN)
+    seen_keys: set[str] = set()
 
     for row in rows:
-        for col_idx, cell in enumerate(row):
+        ig_handle = ""
+        creator_name = ""
+
+        for cell in row:
+            if not cell:
+                continue
             cell_str = str(cell).strip()
             if not cell_str:
                 continue
 
-            # 콘텐츠 URL 탐색
-            matches = content_url_re.findall(cell_str)
-            for url in matches:
-                if url in seen_urls:
-                    continue
-                seen_urls.add(url)
-
-                post_type = _extract_post_type(url)
-                ig_handle, creator_name = _extract_creator_from_left_cells(row, col_idx)
-
-                results.append({
-                    "brand_name": brand_name,
-                    "creator_name": creator_name,
-                    "ig_handle": ig_handle,
-                    "post_url": url,
-                    "post_type": post_type,
-                    "source_sheet_id": sheet_id,
-                })
+            # 콘텐츠 URL 탐색 (instagram.com 포함 셀만)
+            has_ig_host = _IG_HOST in cell_str
+            if has_ig_host:
+                for url in _CONTENT_URL_PATTERN.findall(cell_str):
+                    post_key = canonical_post_key(url)
+                    if post_key in seen_keys:
+                        continue
+                    seen_keys.add(post_key)
+
+                    results.append({
+                        "post_key": post_key,
+                        "brand_name": brand_name,
+                        "creator_name": creator_name,
+                        "ig_handle": ig_handle,
+                        "post_url": url,
+                        "post_type": _extract_post_type(url),
+                        "source_sheet_id": sheet_id,
+                    })
+
+            # 이 셀을 오른쪽 셀들의 '왼쪽 셀'로 누적
+            # IG 핸들: @로 시작하거나 instagram.com/ 포함 (이름 후보에서 제외)
+            if cell_str.startswith("@") or (has_ig_host and "instagram.com/" in cell_str):
+                if not ig_handle:
+                    ig_handle = cell_str
+            elif not creator_name and _is_creator_name(cell_str):
+                creator_name = cell_str
 
     return results
 
@@ -151,50 +164,166 @@ def _extract_brand_from_filename(filename: str) -> str:
     return filename
 
 
-def scan_all_sheets(
+def _tab_range(tab_name: str) -> str:
+    """탭 이름 → A:Z 읽기 범위 (빈 이름은 기본 탭)"""
+    return f"'{tab_name}'!A:Z" if tab_name else "A:Z"
+
+
+def _read_sheet_tabs(
+    client: "SheetsClient", sheet_id: str
+) -> tuple[list[list[list[str]]], bool]:
+    """스프레드시트의 모든 탭 데이터를 읽어 탭별 rows 리스트로 반환합니다.
+
+    탭 목록 조회 1회 + values.batchGet 1회로 시트 전체를 읽습니다.
+    batchGet 실패 시(일부 탭 범위 오류 등) 탭별 read_tab 으로 폴백하여
+    문제 있는 탭만 건너뜁니다.
+
+    Returns:
+        (탭별 rows 리스트, 모든 탭을 빠짐없이 읽었는지 여부) 튜플
+    """
+    complete = True
+    try:
+        tab_names = client.get_sheet_tabs(sheet_id)
+    except Exception:
+        tab_names = [""]  # 폴백: 기본 탭
+        complete = False
+
+    ranges = [_tab_range(tab_name) for tab_name in tab_names]
+
+    try:
+        return client.read_tabs(sheet_id, ranges), complete
+    except Exception:
+        pass
+
+    tabs: list[list[list[str]]] = []
+    for range_name in ranges:
+        try:
+            tabs.append(client.read_tab(sheet_id, range_name))
+        except Exception:
+            complete = False
+            continue
+    return tabs, complete
+
+
+def _scan_sheet(client: "SheetsClient", sheet: dict) -> tuple[list[dict], bool]:
+    """단일 스프레드시트의 모든 탭에서 URL을 추출합니다 (시트 간 중복 제거 전).
+
+    Returns:
+        (탭 순서대로 추출된 URL 정보 리스트, 모든 탭을 읽었는지 여부) 튜플
+    """
+    sheet_id = sheet["id"]
+    brand_name = _extract_brand_from_filename(sheet.get("name", ""))
+
+    tabs, complete = _read_sheet_tabs(client, sheet_id)
+    results: list[dict] = []
+    for rows in tabs:
+        results.extend(extract_ig_urls_from_rows(rows, brand_name, sheet_id))
+    return results, complete
+
+
+def _ordered_map(
+    fn: Callable[[dict], tuple[list[dict], bool]],
+    items: list[dict],
+    workers: int,
+) -> Iterator[tuple[list[dict], bool]]:
+    """items 순서대로 fn 결과를 내보냅니다.
+
+    workers > 1 이면 스레드 풀에서 최대 workers * 2 개까지만 미리 읽어
+    소비자가 느려도 메모리에 쌓이는 시트 수가 제한됩니다.
+    """
+    if workers <= 1:
+        yield from map(fn, items)
+        return
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        remaining = iter(items)
+        pending = deque(pool.submit(fn, item) for item in islice(remaining, workers * 2))
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(remaining, 1):
+                    pending.append(pool.submit(fn, item))
+                yield result
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작 안 한 시트는 취소
+            for future in pending:
+                future.cancel()
+
+
+def iter_new_entries(
     client: "SheetsClient",
-    existing_urls: set[str],
-) -> list[dict]:
-    """PM 공유 드라이브 전체 시트를 스캔하여 신규 Instagram URL을 수집합니다.
+    existing_keys: Container[str],
+    manifest: "ScanManifest | None" = None,
+    workers: int = 1,
+) -> Iterator[dict]:
+    """PM 공유 드라이브 시트를 순서대로 스캔하며 신규 URL 엔트리를 하나씩 내보냅니다.
+
+    시트 하나를 읽을 때마다 그 시트의 신규 엔트리를 바로 내보내므로,
+    소비자는 드라이브 전체 스캔을 기다리지 않고 수집을 시작할 수 있습니다.
+    workers > 1 이면 스레드 풀로 다음 시트들을 미리 읽습니다. 결과는
+    드라이브 목록 순서대로 병합하므로 중복 제거 결과는 직렬 스캔과 동일합니다.
 
     Args:
         client: SheetsClient 인스턴스
-        existing_urls: 이미 수집된 URL 집합 (중복 방지)
-
-    Returns:
-        신규 URL 정보 딕셔너리 리스트
+        existing_keys: 이미 수집된 포스트의 정규 포스트 키 집합 (중복 방지)
+        manifest: 스캔 매니페스트. 주어지면 마지막 스캔 이후 변경되지 않은
+            시트는 읽지 않고 건너뛰며, 읽은 시트의 결과로 매니페스트를 갱신합니다.
+            prune 및 스킵 로그는 제너레이터를 끝까지 소비했을 때 수행됩니다.
+        workers: 동시 스캔 시트 수 (1 = 직렬 스캔)
+
+    Yields:
+        신규 URL 정보 딕셔너리
     """
     sheets = client.list_drive_sheets(PM_SHARED_DRIVE_FOLDER_ID)
 
-    all_results: list[dict] = []
-    global_seen: set[str] = set(existing_urls)
+    to_scan = [
+        sheet for sheet in sheets
+        if manifest is None or not manifest.is_unchanged(sheet, existing_keys)
+    ]
 
-    for sheet in sheets:
-        sheet_id = sheet["id"]
-        filename = sheet.get("name", "")
+    # 이번 실행에서 내보낸 키 (existing_keys 는 복사하지 않고 조회만)
+    emitted: set[str] = set()
 
-        brand_name = _extract_brand_from_filename(filename)
+    def scan(sheet: dict) -> tuple[list[dict], bool]:
+        return _scan_sheet(client, sheet)
 
-        # 모든 탭 순회
-        try:
-            tab_names = client.get_sheet_tabs(sheet_id)
-        except Exception:
-            tab_names = [""]  # 폴백: 기본 탭
+    for sheet, (sheet_results, complete) in zip(to_scan, _ordered_map(scan, to_scan, workers)):
+        # 일부 탭을 못 읽은 시트는 다음 실행에서 다시 읽도록 기록하지 않음
+        if manifest is not None and complete:
+            manifest.update(sheet, [item["post_key"] for item in sheet_results])
 
-        for tab_name in tab_names:
-            try:
-                range_name = f"'{tab_name}'!A:Z" if tab_name else "A:Z"
-                rows = client.read_tab(sheet_id, range_name)
-            except Exception:
+        for item in sheet_results:
+            post_key = item["post_key"]
+            if post_key in emitted or post_key in existing_keys:
                 continue
+            emitted.add(post_key)
+            yield item
+
+    if manifest is not None:
+        manifest.prune(sheet["id"] for sheet in sheets)
+        logger.info(
+            "시트 스캔: 전체 %d개 중 변경 없음 %d개 스킵",
+            len(sheets), len(sheets) - len(to_scan),
+        )
+
+
+def scan_all_sheets(
+    client: "SheetsClient",
+    existing_keys: Container[str],
+    manifest: "ScanManifest | None" = None,
+    workers: int = 1,
+) -> list[dict]:
+    """PM 공유 드라이브 전체 시트를 스캔하여 신규 Instagram URL을 수집합니다.
 
-            sheet_results = extract_ig_urls_from_rows(rows, brand_name, sheet_id)
+    iter_new_entries() 결과를 리스트로 모아 반환합니다.
 
-            for item in sheet_results:
-                url = item["post_url"]
-                if url in global_seen:
-                    continue
-                global_seen.add(url)
-                all_results.append(item)
+    Args:
+        client: SheetsClient 인스턴스
+        existing_keys: 이미 수집된 포스트의 정규 포스트 키 집합 (중복 방지)
+        manifest: 스캔 매니페스트 (iter_new_entries 참고)
+        workers: 동시 스캔 시트 수 (1 = 직렬 스캔)
 
-    return all_results
+    Returns:
+        신규 URL 정보 딕셔너리 리스트
+    """
+    return list(iter_new_entries(client, existing_keys, manifest=manifest, workers=workers))
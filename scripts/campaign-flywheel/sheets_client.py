@@ -2,11 +2,21 @@
 from __future__ import annotations
 
 import os
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any, Iterable
 
+import httplib2
 from google.oauth2 import service_account
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 
+from config import SHEETS_CACHE_LISTING_TTL_SECONDS, SHEETS_MAX_RETRIES
+from response_cache import MISS
+
+if TYPE_CHECKING:
+    from rate_limiter import TokenBucket
+    from response_cache import ResponseCache
+
 # Google API 스코프
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets",
@@ -16,37 +26,160 @@ SCOPES = [
 # Drive 파일 목록 페이지 크기
 DRIVE_PAGE_SIZE = 100
 
+# HTTP 요청 타임아웃 (초)
+HTTP_TIMEOUT_SECONDS = 60
+
+
+# 서비스 계정 JSON 경로 → 인증 정보 (프로세스 전체에서 1회만 로드)
+_credentials_cache: dict[str, service_account.Credentials] = {}
+_credentials_lock = threading.Lock()
+
+# 스레드별 HTTP 전송/서비스 객체 (httplib2 는 스레드 안전하지 않음)
+_thread_state = threading.local()
+
 
 def _get_credentials() -> service_account.Credentials:
-    """환경 변수에서 서비스 계정 JSON 경로를 읽어 인증 정보를 반환합니다."""
+    """환경 변수에서 서비스 계정 JSON 경로를 읽어 인증 정보를 반환합니다.
+
+    같은 경로의 인증 정보는 프로세스 내에서 한 번만 읽어 재사용합니다.
+    """
     sa_json = os.environ.get("GOOGLE_SERVICE_ACCOUNT_JSON")
     if not sa_json:
         raise EnvironmentError(
             "GOOGLE_SERVICE_ACCOUNT_JSON 환경 변수가 설정되어 있지 않습니다."
         )
-    return service_account.Credentials.from_service_account_file(
-        sa_json, scopes=SCOPES
-    )
+    with _credentials_lock:
+        creds = _credentials_cache.get(sa_json)
+        if creds is None:
+            creds = _credentials_cache[sa_json] = (
+                service_account.Credentials.from_service_account_file(
+                    sa_json, scopes=SCOPES
+                )
+            )
+    return creds
+
+
+def _get_authorized_http() -> AuthorizedHttp:
+    """현재 스레드의 인증 HTTP 전송을 반환합니다.
+
+    Sheets/Drive 서비스가 같은 httplib2 커넥션(keep-alive)을 공유합니다.
+    """
+    http = getattr(_thread_state, "http", None)
+    if http is None:
+        http = _thread_state.http = AuthorizedHttp(
+            _get_credentials(), http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS)
+        )
+    return http
+
+
+def _get_service(api: str, version: str) -> Any:
+    """현재 스레드의 API 서비스 객체를 반환합니다 (스레드당 1회 빌드).
+
+    패키지에 포함된 정적 discovery 문서를 사용하므로 네트워크 조회나
+    discovery 파일 캐시 탐색 없이 빌드됩니다.
+    """
+    services = getattr(_thread_state, "services", None)
+    if services is None:
+        services = _thread_state.services = {}
+    service = services.get((api, version))
+    if service is None:
+        service = services[(api, version)] = build(
+            api,
+            version,
+            http=_get_authorized_http(),
+            static_discovery=True,
+            cache_discovery=False,
+        )
+    return service
+
+
+def _column_letter(idx: int) -> str:
+    """0-based 칼럼 인덱스 → A1 표기 칼럼 문자 (0 → "A", 26 → "AA")"""
+    letters = ""
+    idx += 1
+    while idx:
+        idx, rem = divmod(idx - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def _group_consecutive(indexes: list[int]) -> list[tuple[int, int]]:
+    """정렬된 인덱스 → 연속 구간 (처음, 끝) 리스트"""
+    groups: list[tuple[int, int]] = []
+    for idx in indexes:
+        if groups and groups[-1][1] == idx - 1:
+            groups[-1] = (groups[-1][0], idx)
+        else:
+            groups.append((idx, idx))
+    return groups
 
 
 def build_sheets_service() -> Any:
-    """Google Sheets v4 서비스를 빌드하여 반환합니다."""
-    creds = _get_credentials()
-    return build("sheets", "v4", credentials=creds)
+    """Google Sheets v4 서비스를 반환합니다."""
+    return _get_service("sheets", "v4")
 
 
 def build_drive_service() -> Any:
-    """Google Drive v3 서비스를 빌드하여 반환합니다."""
-    creds = _get_credentials()
-    return build("drive", "v3", credentials=creds)
+    """Google Drive v3 서비스를 반환합니다."""
+    return _get_service("drive", "v3")
 
 
 class SheetsClient:
-    """Google Sheets/Drive API 클라이언트"""
+    """Google Sheets/Drive API 클라이언트
+
+    googleapiclient 서비스 객체(httplib2)는 스레드 안전하지 않으므로
+    스레드마다 별도 서비스를 지연 생성합니다. 여러 스레드가 하나의
+    SheetsClient 를 공유해도 rate_limiter 로 Sheets 읽기 쿼터를 함께 지킵니다.
+
+    cache 가 주어지면 시트 값/탭 목록을 스프레드시트 ID + 범위 + Drive version
+    키로 캐시합니다. version 은 list_drive_sheets() 결과에서 얻으므로, 목록에
+    없는 시트(예: MKT Ops Master)는 캐시하지 않고 항상 API에서 읽습니다.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: "TokenBucket | None" = None,
+        cache: "ResponseCache | None" = None,
+    ) -> None:
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._versions: dict[str, str] = {}
+        self._local = threading.local()
+        self._local.sheets_service = build_sheets_service()
+        self._local.drive_service = build_drive_service()
+
+    @property
+    def _sheets_service(self) -> Any:
+        service = getattr(self._local, "sheets_service", None)
+        if service is None:
+            service = self._local.sheets_service = build_sheets_service()
+        return service
+
+    @property
+    def _drive_service(self) -> Any:
+        service = getattr(self._local, "drive_service", None)
+        if service is None:
+            service = self._local.drive_service = build_drive_service()
+        return service
+
+    def _execute_read(self, request: Any) -> dict:
+        """Sheets 읽기 요청 실행 — 쿼터 토큰 확보 후 429/5xx 시 지수 백오프 재시도"""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+        return request.execute(num_retries=SHEETS_MAX_RETRIES)
 
-    def __init__(self) -> None:
-        self._sheets_service = build_sheets_service()
-        self._drive_service = build_drive_service()
+    def _cache_key(self, kind: str, spreadsheet_id: str, range_name: str = "") -> str | None:
+        """캐시 키 — Drive version 을 모르는 시트는 검증할 수 없으므로 None"""
+        if self._cache is None:
+            return None
+        version = self._versions.get(spreadsheet_id)
+        if not version:
+            return None
+        return f"{kind}:{spreadsheet_id}:{version}:{range_name}"
+
+    def cache_stats(self) -> dict | None:
+        """캐시 히트/미스 통계 (캐시 미사용 시 None)"""
+        return self._cache.stats() if self._cache is not None else None
 
     def read_tab(self, spreadsheet_id: str, range_name: str) -> list[list[str]]:
         """시트 탭의 모든 데이터를 읽어 반환합니다.
@@ -58,7 +191,13 @@ class SheetsClient:
         Returns:
             2차원 문자열 리스트. 빈 시트면 빈 리스트 반환.
         """
-        result = (
+        key = self._cache_key("values", spreadsheet_id, range_name)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not MISS:
+                return cached
+
+        result = self._execute_read(
             self._sheets_service.spreadsheets()
             .values()
             .get(
@@ -66,9 +205,114 @@ class SheetsClient:
                 range=range_name,
                 valueRenderOption="FORMATTED_VALUE",
             )
-            .execute()
         )
-        return result.get("values", [])
+        values = result.get("values", [])
+        if key is not None:
+            self._cache.put(key, values)
+        return values
+
+    def read_tabs(
+        self, spreadsheet_id: str, ranges: list[str]
+    ) -> list[list[list[str]]]:
+        """여러 범위를 values.batchGet 한 번으로 읽어 반환합니다.
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            ranges: 읽을 범위 리스트 (예: ["'Sheet1'!A:Z", "'Sheet2'!A:Z"])
+
+        Returns:
+            ranges 순서와 동일한 2차원 문자열 리스트의 리스트.
+            빈 범위는 빈 리스트로 채웁니다.
+        """
+        if not ranges:
+            return []
+        return self._batch_get(
+            spreadsheet_id, ranges, "values", valueRenderOption="FORMATTED_VALUE"
+        )
+
+    def read_columns(
+        self, spreadsheet_id: str, tab_name: str, columns: Iterable[int]
+    ) -> dict[int, list]:
+        """탭의 지정 칼럼만 values.batchGet 한 번으로 읽어 칼럼 단위로 반환합니다.
+
+        연속된 칼럼은 한 범위로 묶어 요청하며, 서식 없는 값(UNFORMATTED_VALUE)과
+        날짜 일련번호(SERIAL_NUMBER)로 받으므로 금액/날짜 셀은 숫자로 옵니다.
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            tab_name: 탭 이름 (예: "Dashboard")
+            columns: 읽을 칼럼 인덱스 (0-based, A=0)
+
+        Returns:
+            칼럼 인덱스 → 위에서부터의 셀 값 리스트 (첫 값 = 헤더 행).
+            끝의 빈 셀은 API 응답처럼 잘려 있을 수 있습니다.
+        """
+        groups = _group_consecutive(sorted(set(columns)))
+        if not groups:
+            return {}
+
+        quoted_tab = "'" + tab_name.replace("'", "''") + "'"
+        ranges = [
+            f"{quoted_tab}!{_column_letter(first)}:{_column_letter(last)}"
+            for first, last in groups
+        ]
+        fetched = self._batch_get(
+            spreadsheet_id,
+            ranges,
+            "columns",
+            majorDimension="COLUMNS",
+            valueRenderOption="UNFORMATTED_VALUE",
+            dateTimeRenderOption="SERIAL_NUMBER",
+        )
+
+        result: dict[int, list] = {}
+        for (first, last), group_columns in zip(groups, fetched):
+            for idx in range(first, last + 1):
+                offset = idx - first
+                result[idx] = group_columns[offset] if offset < len(group_columns) else []
+        return result
+
+    def _batch_get(
+        self, spreadsheet_id: str, ranges: list[str], kind: str, **params: str
+    ) -> list[list]:
+        """values.batchGet — 캐시 히트 범위는 제외하고 나머지만 요청합니다.
+
+        Args:
+            spreadsheet_id: 스프레드시트 ID
+            ranges: 읽을 범위 리스트
+            kind: 캐시 키 구분자 (렌더 옵션이 다르면 다른 값)
+            **params: batchGet 렌더 옵션 (valueRenderOption 등)
+
+        Returns:
+            ranges 순서와 동일한 values 리스트의 리스트 (빈 범위는 빈 리스트)
+        """
+        keys = [self._cache_key(kind, spreadsheet_id, r) for r in ranges]
+        values: list = [MISS] * len(ranges)
+        for i, key in enumerate(keys):
+            if key is not None:
+                values[i] = self._cache.get(key)
+        missing = [i for i, v in enumerate(values) if v is MISS]
+        if not missing:
+            return values
+
+        result = self._execute_read(
+            self._sheets_service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=[ranges[i] for i in missing],
+                **params,
+            )
+        )
+        value_ranges = result.get("valueRanges", [])
+        # 응답은 요청 순서를 유지하지만, 누락 대비 길이를 요청 범위 수에 맞춤
+        fetched = [vr.get("values", []) for vr in value_ranges]
+        fetched.extend([] for _ in range(len(missing) - len(fetched)))
+        for i, rows in zip(missing, fetched):
+            values[i] = rows
+            if keys[i] is not None:
+                self._cache.put(keys[i], rows)
+        return values
 
     def append_rows(
         self, spreadsheet_id: str, tab_name: str, rows: list[list[Any]]
@@ -99,25 +343,41 @@ class SheetsClient:
 
     def get_sheet_tabs(self, spreadsheet_id: str) -> list[str]:
         """스프레드시트의 모든 탭(시트) 이름을 반환합니다."""
-        result = (
+        key = self._cache_key("tabs", spreadsheet_id)
+        if key is not None:
+            cached = self._cache.get(key)
+            if cached is not MISS:
+                return cached
+
+        result = self._execute_read(
             self._sheets_service.spreadsheets()
             .get(spreadsheetId=spreadsheet_id, fields="sheets.properties.title")
-            .execute()
         )
-        return [s["properties"]["title"] for s in result.get("sheets", [])]
+        titles = [s["properties"]["title"] for s in result.get("sheets", [])]
+        if key is not None:
+            self._cache.put(key, titles)
+        return titles
 
     def list_drive_sheets(self, folder_id: str) -> list[dict]:
         """Drive 폴더 내 Google Sheets 파일 목록을 반환합니다.
 
         페이지네이션을 통해 전체 목록을 수집하며,
-        공유 드라이브(Shared Drive)도 지원합니다.
+        공유 드라이브(Shared Drive)도 지원합니다. 결과의 version 은 이후
+        시트 값 캐시 키에 사용되며, 목록 자체는 짧은 TTL로만 캐시합니다.
 
         Args:
             folder_id: Drive 폴더 ID
 
         Returns:
-            파일 정보 딕셔너리 리스트 (id, name 등 포함)
+            파일 정보 딕셔너리 리스트 (id, name, modifiedTime, version 포함)
         """
+        cache_key = f"drive:{folder_id}"
+        if self._cache is not None:
+            cached = self._cache.get(cache_key, max_age=SHEETS_CACHE_LISTING_TTL_SECONDS)
+            if cached is not MISS:
+                self._remember_versions(cached)
+                return cached
+
         query = (
             f"'{folder_id}' in parents "
             f"and mimeType='application/vnd.google-apps.spreadsheet' "
@@ -130,18 +390,31 @@ class SheetsClient:
             kwargs: dict[str, Any] = {
                 "q": query,
                 "pageSize": DRIVE_PAGE_SIZE,
-                "fields": "nextPageToken, files(id, name)",
+                "fields": "nextPageToken, files(id, name, modifiedTime, version)",
                 "supportsAllDrives": True,
                 "includeItemsFromAllDrives": True,
             }
             if page_token:
                 kwargs["pageToken"] = page_token
 
-            response = self._drive_service.files().list(**kwargs).execute()
+            response = (
+                self._drive_service.files()
+                .list(**kwargs)
+                .execute(num_retries=SHEETS_MAX_RETRIES)
+            )
             files.extend(response.get("files", []))
 
             page_token = response.get("nextPageToken")
             if not page_token:
                 break
 
+        self._remember_versions(files)
+        if self._cache is not None:
+            self._cache.put(cache_key, files)
         return files
+
+    def _remember_versions(self, files: list[dict]) -> None:
+        """Drive 파일 목록의 version 을 시트 값 캐시 키용으로 기억합니다."""
+        for f in files:
+            if f.get("version"):
+                self._versions[f["id"]] = str(f["version"])
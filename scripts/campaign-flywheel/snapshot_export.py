@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""campaign_post_snapshots → 로컬 컬럼형 파일 내보내기 (분석용)
+
+pyarrow 가 설치되어 있으면 Parquet(zstd)로, 없으면 CSV로 저장합니다.
+
+Usage:
+  python snapshot_export.py --out snapshots.parquet [--since 2026-10-01]
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import logging
+import os
+from pathlib import Path
+from typing import Any, Iterator
+
+# Parquet 지원 (선택적)
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 내보낼 칼럼 (순서 유지)
+SNAPSHOT_COLUMNS = (
+    "post_url",
+    "collected_at",
+    "views",
+    "likes",
+    "shares",
+    "comments",
+    "views_delta",
+    "likes_delta",
+    "shares_delta",
+    "comments_delta",
+)
+
+# Supabase 페이지 크기 (PostgREST 기본 max-rows 이하)
+EXPORT_PAGE_SIZE = 1000
+
+
+def iter_snapshots(
+    supabase_client: Any, since: str | None = None, page_size: int = EXPORT_PAGE_SIZE
+) -> Iterator[dict]:
+    """스냅샷 행을 collected_at 순으로 페이지 단위 조회합니다.
+
+    Args:
+        supabase_client: supabase-py 클라이언트 인스턴스
+        since: 이 시각(ISO 8601) 이후 수집된 행만 조회 (None이면 전체)
+        page_size: 페이지당 행 수
+
+    Yields:
+        스냅샷 행 딕셔너리
+    """
+    offset = 0
+    while True:
+        query = (
+            supabase_client.table("campaign_post_snapshots")
+            .select(", ".join(SNAPSHOT_COLUMNS))
+        )
+        if since:
+            query = query.gte("collected_at", since)
+        rows = (
+            query.order("collected_at").order("id")
+            .range(offset, offset + page_size - 1)
+            .execute()
+            .data
+        ) or []
+        yield from rows
+        if len(rows) < page_size:
+            return
+        offset += page_size
+
+
+def _to_columns(rows: list[dict]) -> dict[str, list]:
+    """행 리스트를 칼럼별 리스트로 변환합니다."""
+    return {col: [r.get(col) for r in rows] for col in SNAPSHOT_COLUMNS}
+
+
+def write_columnar(rows: list[dict], out_path: Path) -> Path:
+    """스냅샷 행을 Parquet(가능하면) 또는 CSV로 저장합니다.
+
+    Args:
+        rows: 스냅샷 행 딕셔너리 리스트
+        out_path: 저장 경로. pyarrow 미설치 시 확장자를 .csv 로 바꿔 저장
+
+    Returns:
+        실제 저장된 파일 경로
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if PARQUET_AVAILABLE:
+        columns = _to_columns(rows)
+        schema = pa.schema(
+            [("post_url", pa.string()), ("collected_at", pa.string())]
+            + [(col, pa.int64()) for col in SNAPSHOT_COLUMNS[2:]]
+        )
+        table = pa.table(columns, schema=schema)
+        pq.write_table(table, out_path, compression="zstd")
+        return out_path
+
+    logger.warning("pyarrow 미설치 — CSV로 저장합니다 (pip install pyarrow)")
+    out_path = out_path.with_suffix(".csv")
+    with open(out_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=SNAPSHOT_COLUMNS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+    return out_path
+
+
+def export_snapshots(
+    supabase_client: Any, out_path: Path, since: str | None = None
+) -> tuple[Path, int]:
+    """스냅샷 테이블을 로컬 파일로 내보냅니다.
+
+    Returns:
+        (저장된 파일 경로, 행 수)
+    """
+    rows = list(iter_snapshots(supabase_client, since=since))
+    return write_columnar(rows, out_path), len(rows)
+
+
+def main() -> None:
+    import sys
+
+    # shared-env 의 load_env 로 .env 로드 (run_collect / run_review 와 동일)
+    sys.path.insert(0, str(Path.home() / ".config" / "shared-env"))
+    from krns_automation import load_env
+    import supabase as supabase_lib
+
+    load_env(Path(__file__).parent)
+
+    parser = argparse.ArgumentParser(description="campaign_post_snapshots 내보내기")
+    parser.add_argument("--out", type=Path, default=Path("campaign_post_snapshots.parquet"))
+    parser.add_argument("--since", help="이 시각(ISO 8601) 이후 수집분만 내보내기")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s")
+    sb = supabase_lib.create_client(
+        os.environ["SUPABASE_URL"],
+        os.environ["SUPABASE_SERVICE_ROLE_KEY"],
+    )
+    path, count = export_snapshots(sb, args.out, since=args.since)
+    logger.info("스냅샷 %d행 → %s", count, path)
+
+
+if __name__ == "__main__":
+    main()
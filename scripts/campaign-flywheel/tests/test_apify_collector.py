@@ -4,12 +4,14 @@ from __future__ import annotations
 import sys
 import os
 import unittest
-from unittest.mock import MagicMock, patch, call
-from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+from datetime import datetime, timedelta, timezone
 
 # campaign-flywheel 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+from apify_client.errors import ApifyApiError
+
 from apify_collector import parse_apify_result, collect_ig_metrics
 
 
@@ -119,5 +121,245 @@ class TestCollectIgMetricsBatchesUrls(unittest.TestCase):
         self.assertEqual(result[4]["likes"], 50)
 
 
+def _make_parallel_client(items_by_dataset, status="SUCCEEDED", barrier=None):
+    """start/wait_for_finish 기반 ApifyClient mock 생성 헬퍼"""
+    import itertools
+
+    run_ids = itertools.count()
+    mock_client_instance = MagicMock()
+
+    def start(run_input):
+        run_id = f"run-{next(run_ids)}"
+        start.inputs[run_id] = run_input
+        return {"id": run_id, "status": "RUNNING"}
+
+    start.inputs = {}
+    mock_client_instance.actor.return_value.start.side_effect = start
+
+    def run(run_id):
+        run_client = MagicMock()
+
+        def wait_for_finish():
+            if barrier is not None:
+                barrier.wait()
+            return {"id": run_id, "status": status, "defaultDatasetId": f"ds-{run_id}"}
+
+        run_client.wait_for_finish.side_effect = wait_for_finish
+        return run_client
+
+    mock_client_instance.run.side_effect = run
+
+    def dataset(dataset_id):
+        run_id = dataset_id[len("ds-"):]
+        urls = start.inputs[run_id]["directUrls"]
+        ds = MagicMock()
+        ds.list_items.return_value.items = [
+            {"url": url, "videoPlayCount": 100, "likesCount": 1} for url in urls
+        ]
+        return ds
+
+    mock_client_instance.dataset.side_effect = dataset
+    return mock_client_instance
+
+
+class TestCollectIgMetricsParallelRuns(unittest.TestCase):
+    """max_concurrent_runs > 1 이면 배치 run 을 동시에 시작/대기하는지 확인"""
+
+    def test_collect_ig_metrics_runs_batches_concurrently(self):
+        import threading
+
+        entries = [{"post_url": f"https://www.instagram.com/reel/P{i:03d}/"} for i in range(60)]
+        # 3개 배치가 모두 동시에 대기 중이어야 barrier 통과
+        barrier = threading.Barrier(3, timeout=5)
+        mock_client_instance = _make_parallel_client({}, barrier=barrier)
+
+        with patch("apify_collector.ApifyClient", return_value=mock_client_instance):
+            result = collect_ig_metrics(entries, batch_size=25, max_concurrent_runs=3)
+
+        mock_client_instance.actor.return_value.call.assert_not_called()
+        self.assertEqual(mock_client_instance.actor.return_value.start.call_count, 3)
+        self.assertTrue(all(e["views"] == 100 for e in result))
+        self.assertTrue(all("collected_at" in e for e in result))
+
+    def test_collect_ig_metrics_failed_run_status(self):
+        """run 이 계속 SUCCEEDED 가 아니면 0 대신 None + failed 상태"""
+        entries = [{"post_url": f"https://www.instagram.com/reel/F{i:03d}/"} for i in range(30)]
+        mock_client_instance = _make_parallel_client({}, status="FAILED")
+
+        with patch("apify_collector.ApifyClient", return_value=mock_client_instance):
+            result = collect_ig_metrics(
+                entries, batch_size=25, max_concurrent_runs=2, backoff_seconds=0
+            )
+
+        self.assertTrue(all(e["views"] is None for e in result))
+        self.assertTrue(all(e["collection_status"] == "failed" for e in result))
+        self.assertTrue(all("collected_at" not in e for e in result))
+
+
+class TestCollectIgMetricsFailureIsolation(unittest.TestCase):
+    """배치 실패 시 재시도 후 이분할로 문제 URL만 실패 처리"""
+
+    BAD_URL = "https://www.instagram.com/reel/B003/"
+
+    def _client(self, fail_times_for_all=0):
+        """BAD_URL 이 포함된 run 은 항상 실패, 처음 fail_times_for_all 회는 전부 실패"""
+        client = MagicMock()
+        calls = {"n": 0}
+
+        def fake_call(run_input):
+            calls["n"] += 1
+            urls = run_input["directUrls"]
+            if calls["n"] <= fail_times_for_all or self.BAD_URL in urls:
+                raise RuntimeError("actor crashed")
+            fake_call.inputs[f"ds-{calls['n']}"] = urls
+            return {"status": "SUCCEEDED", "defaultDatasetId": f"ds-{calls['n']}"}
+
+        fake_call.inputs = {}
+        client.actor.return_value.call.side_effect = fake_call
+
+        def dataset(dataset_id):
+            ds = MagicMock()
+            ds.list_items.return_value.items = [
+                {"url": u, "videoPlayCount": 10} for u in fake_call.inputs[dataset_id]
+            ]
+            return ds
+
+        client.dataset.side_effect = dataset
+        return client, calls
+
+    def test_bisects_to_bad_url(self):
+        entries = [{"post_url": f"https://www.instagram.com/reel/B{i:03d}/"} for i in range(8)]
+        client, calls = self._client()
+
+        with patch("apify_collector.ApifyClient", return_value=client), \
+                patch("apify_collector.time.sleep") as sleep:
+            result = collect_ig_metrics(entries, batch_size=25, retries=2, backoff_seconds=1)
+
+        failed = [e["post_url"] for e in result if e["collection_status"] == "failed"]
+        self.assertEqual(failed, [self.BAD_URL])
+        self.assertIsNone(result[3]["views"])
+        self.assertTrue(all(e["views"] == 10 for i, e in enumerate(result) if i != 3))
+        # 전체 배치 지수 백오프: 1초, 2초
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [1, 2])
+        # 3회 + 분할(8→4→2→1): 4+4 → 2+2 → 1+1
+        self.assertEqual(calls["n"], 3 + 6)
+
+    def test_transient_failure_recovers_by_retry(self):
+        entries = [{"post_url": f"https://www.instagram.com/reel/T{i:03d}/"} for i in range(3)]
+        client, calls = self._client(fail_times_for_all=1)
+
+        with patch("apify_collector.ApifyClient", return_value=client), \
+                patch("apify_collector.time.sleep"):
+            result = collect_ig_metrics(entries, batch_size=25)
+
+        self.assertEqual(calls["n"], 2)
+        self.assertTrue(all(e["collection_status"] == "collected" for e in result))
+
+    def test_account_error_fails_batch_without_split(self):
+        """인증/사용량 한도 오류는 재시도·분할 없이 배치 전체 실패"""
+        entries = [{"post_url": f"https://www.instagram.com/reel/Q{i:03d}/"} for i in range(8)]
+        response = MagicMock(status_code=402, text="quota")
+        response.json.return_value = {
+            "error": {"type": "not-enough-usage-to-run-paid-actor", "message": "quota"}
+        }
+        client = MagicMock()
+        client.actor.return_value.call.side_effect = ApifyApiError(response, 1)
+
+        with patch("apify_collector.ApifyClient", return_value=client), \
+                patch("apify_collector.time.sleep") as sleep:
+            result = collect_ig_metrics(entries, batch_size=25, retries=2, backoff_seconds=1)
+
+        self.assertEqual(client.actor.return_value.call.call_count, 1)
+        sleep.assert_not_called()
+        self.assertTrue(all(e["collection_status"] == "failed" for e in result))
+
+    def test_unmatched_url_is_missing(self):
+        entries = [{"post_url": "https://www.instagram.com/reel/GONE/"}]
+        client = MagicMock()
+        client.actor.return_value.call.return_value = {"defaultDatasetId": "ds"}
+        client.dataset.return_value.list_items.return_value.items = []
+
+        with patch("apify_collector.ApifyClient", return_value=client):
+            result = collect_ig_metrics(entries)
+
+        self.assertEqual(result[0]["collection_status"], "missing")
+        self.assertIsNone(result[0]["views"])
+
+
+class TestCollectIgMetricsMatchesByPostKey(unittest.TestCase):
+    """Apify 결과 url 형태가 입력과 달라도 포스트 키(shortCode)로 매칭"""
+
+    def test_matches_reel_input_to_p_result(self):
+        entries = [{"post_url": "https://www.instagram.com/reel/KEY001/?igsh=abc"}]
+        client = MagicMock()
+        client.actor.return_value.call.return_value = {"defaultDatasetId": "ds"}
+        client.dataset.return_value.list_items.return_value.items = [
+            {"url": "https://www.instagram.com/p/KEY001/", "shortCode": "KEY001", "videoPlayCount": 42},
+        ]
+
+        with patch("apify_collector.ApifyClient", return_value=client):
+            result = collect_ig_metrics(entries)
+
+        self.assertEqual(result[0]["collection_status"], "collected")
+        self.assertEqual(result[0]["views"], 42)
+
+
+class TestCollectIgMetricsBatchTuner(unittest.TestCase):
+    """tuner 가 고른 배치 크기를 쓰고 run 결과를 기록"""
+
+    def test_uses_tuner_size_and_records_runs(self):
+        from batch_tuner import BatchTuner
+
+        entries = [{"post_url": f"https://www.instagram.com/reel/U{i:03d}/"} for i in range(10)]
+        tuner = BatchTuner(batch_size=4, min_size=1)
+        client = MagicMock()
+        client.actor.return_value.call.return_value = {
+            "defaultDatasetId": "ds", "stats": {"computeUnits": 0.05},
+        }
+        client.dataset.return_value.list_items.return_value.items = []
+
+        with patch("apify_collector.ApifyClient", return_value=client):
+            collect_ig_metrics(entries, batch_size=25, tuner=tuner)
+
+        sent = [c.kwargs["run_input"]["directUrls"] for c in client.actor.return_value.call.call_args_list]
+        self.assertEqual([len(urls) for urls in sent], [4, 4, 2])
+        self.assertEqual(tuner._history[0]["urls"], 4)
+        self.assertEqual(tuner._history[0]["compute_units"], 0.05)
+
+
+class TestCollectIgMetricsUsesMetricsCache(unittest.TestCase):
+    """캐시에 신선한 지표가 있는 URL은 Apify로 보내지 않는지 확인"""
+
+    def test_collect_ig_metrics_skips_fresh_cached_urls(self):
+        from metrics_cache import MetricsCache
+
+        cache = MetricsCache(":memory:")
+        cached_at = datetime.now(timezone.utc).isoformat()
+        cache.put_many([(
+            "CACHED1",
+            {"views": 777, "likes": 7, "shares": 0, "comments": 1},
+            cached_at,
+        )])
+        entries = [
+            {"post_url": "https://www.instagram.com/p/CACHED1/?igsh=abc"},
+            {"post_url": "https://www.instagram.com/reel/NEW0001/"},
+        ]
+        mock_client_instance = _make_parallel_client({})
+
+        with patch("apify_collector.ApifyClient", return_value=mock_client_instance):
+            result = collect_ig_metrics(entries, max_concurrent_runs=2, metrics_cache=cache)
+
+        sent = mock_client_instance.actor.return_value.start.call_args[1]["run_input"]["directUrls"]
+        self.assertEqual(sent, ["https://www.instagram.com/reel/NEW0001/"])
+        self.assertEqual(result[0]["views"], 777)
+        self.assertEqual(result[0]["collected_at"], cached_at)
+        self.assertEqual(result[1]["views"], 100)
+
+        # 새로 수집한 URL은 캐시에 저장되어 재실행 시 재사용
+        fresh = cache.get_fresh(["NEW0001"], timedelta(hours=1))
+        self.assertEqual(fresh["NEW0001"][0]["views"], 100)
+        cache.close()
+
+
 if __name__ == "__main__":
     unittest.main()
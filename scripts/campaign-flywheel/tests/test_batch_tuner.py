@@ -0,0 +1,83 @@
+"""batch_tuner 테스트"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from batch_tuner import BatchTuner
+
+
+def _tuner_with_runs(overhead, per_url, cu_overhead=None, cu_per_url=None, **kwargs):
+    """소요 시간 = overhead + per_url × n 인 run 기록을 가진 tuner"""
+    tuner = BatchTuner(**kwargs)
+    for n in (10, 25, 50):
+        cu = None if cu_overhead is None else cu_overhead + cu_per_url * n
+        tuner.record(n, overhead + per_url * n, cu)
+    return tuner
+
+
+class TestChoose(unittest.TestCase):
+    """run 기록으로 전체 소요 시간이 가장 짧은 배치 크기 선택"""
+
+    def test_keeps_size_without_history(self):
+        tuner = BatchTuner(batch_size=25)
+        self.assertEqual(tuner.choose(200, concurrency=5), 25)
+
+    def test_spreads_urls_across_concurrent_runs(self):
+        """URL당 시간이 크면 동시 run 슬롯을 모두 쓰는 크기"""
+        tuner = _tuner_with_runs(overhead=30, per_url=2)
+        # 200건 / 5 run → 40건씩 1라운드
+        self.assertEqual(tuner.choose(200, concurrency=5), 40)
+
+    def test_large_overhead_prefers_fewer_rounds(self):
+        """한 라운드에 담을 수 없으면 최대 크기로 라운드 수 최소화"""
+        tuner = _tuner_with_runs(overhead=120, per_url=0.5, max_size=100)
+        self.assertEqual(tuner.choose(1000, concurrency=2), 100)
+
+    def test_cost_ceiling_raises_minimum_size(self):
+        """URL당 compute unit 상한을 넘는 작은 배치는 제외"""
+        tuner = _tuner_with_runs(
+            overhead=30, per_url=2, cu_overhead=0.2, cu_per_url=0.002,
+            max_compute_units_per_url=0.006,
+        )
+        # 0.2/n + 0.002 ≤ 0.006 → n ≥ 50
+        self.assertEqual(tuner.choose(200, concurrency=5), 50)
+
+    def test_clamped_to_bounds(self):
+        tuner = _tuner_with_runs(overhead=30, per_url=2, min_size=5, max_size=100)
+        self.assertEqual(tuner.choose(6, concurrency=5), 5)
+
+
+class TestPersistence(unittest.TestCase):
+    """상태 파일 저장/로드"""
+
+    def test_save_and_load_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tuner.json"
+            tuner = _tuner_with_runs(overhead=30, per_url=2, path=path)
+            tuner.choose(200, concurrency=5)
+            tuner.save()
+
+            loaded = BatchTuner.load(path)
+
+            self.assertEqual(loaded.batch_size, 40)
+            self.assertEqual(loaded.choose(200, concurrency=5), 40)
+
+    def test_corrupt_file_uses_default(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "tuner.json"
+            path.write_text("{not json", encoding="utf-8")
+
+            loaded = BatchTuner.load(path, batch_size=25)
+
+            self.assertEqual(loaded.batch_size, 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+"""checkpoint 테스트"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from checkpoint import (
+    CheckpointJournal,
+    STAGE_COLLECTED,
+    STAGE_INSIGHT_WRITTEN,
+    STAGE_STORED,
+)
+
+ENTRIES = [{"post_key": "ABC", "post_url": "https://www.instagram.com/p/ABC/", "views": 10}]
+
+
+class TestCheckpointJournal(unittest.TestCase):
+    """청크 단계 기록/재개"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "journal.jsonl"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_reopen_returns_unfinished_chunks_with_entries(self):
+        journal = CheckpointJournal.open(self.path)
+        done_id, open_id = journal.new_chunk_id(), journal.new_chunk_id()
+        journal.record(done_id, STAGE_COLLECTED, ENTRIES)
+        journal.record(done_id, STAGE_INSIGHT_WRITTEN)
+        journal.record(done_id, STAGE_STORED)
+        journal.record(open_id, STAGE_COLLECTED, ENTRIES)
+        journal.record(open_id, STAGE_INSIGHT_WRITTEN)
+
+        pending = CheckpointJournal.open(self.path).pending()
+
+        self.assertEqual(pending, [(open_id, ENTRIES, {STAGE_COLLECTED, STAGE_INSIGHT_WRITTEN})])
+
+    def test_torn_last_line_is_ignored(self):
+        journal = CheckpointJournal.open(self.path)
+        chunk_id = journal.new_chunk_id()
+        journal.record(chunk_id, STAGE_COLLECTED, ENTRIES)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write('{"chunk": "' + chunk_id + '", "stage": "insi')  # 기록 중 중단
+
+        pending = CheckpointJournal.open(self.path).pending()
+
+        self.assertEqual(pending, [(chunk_id, ENTRIES, {STAGE_COLLECTED})])
+
+    def test_clear_removes_file(self):
+        journal = CheckpointJournal.open(self.path)
+        journal.record(journal.new_chunk_id(), STAGE_COLLECTED, ENTRIES)
+
+        journal.clear()
+
+        self.assertFalse(self.path.exists())
+        self.assertEqual(CheckpointJournal.open(self.path).pending(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
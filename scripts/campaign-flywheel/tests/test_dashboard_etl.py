@@ -13,7 +13,9 @@ from dashboard_etl import (
     parse_date,
     parse_dashboard_row,
     parse_all_dashboard_rows,
+    parse_dashboard_columns,
     detect_newly_completed,
+    DASHBOARD_COLUMNS,
 )
 
 
@@ -29,6 +31,11 @@ def test_parse_money_jpy():
     assert parse_money("¥460,000") == 460000.0
 
 
+def test_parse_money_unformatted_number():
+    assert parse_money(17878863) == 17878863.0
+    assert parse_money(2.5) == 2.5
+
+
 def test_parse_money_empty():
     assert parse_money("") == 0.0
     assert parse_money(None) == 0.0
@@ -43,6 +50,11 @@ def test_parse_date_korean_format():
     assert parse_date("2026. 3. 6") == "2026-03-06"
 
 
+def test_parse_date_serial_number():
+    assert parse_date(46034) == "2026-01-12"
+    assert parse_date(46034.75) == "2026-01-12"  # 시각 포함 일련번호
+
+
 def test_parse_date_empty():
     assert parse_date("") is None
     assert parse_date(None) is None
@@ -106,6 +118,53 @@ def test_parse_dashboard_row_skips_empty_code():
     assert parse_dashboard_row(row) is None
 
 
+def test_parse_all_dashboard_rows_matches_row_parser():
+    rows = [
+        ["header"] * 22,
+        SAMPLE_ROW,
+        SAMPLE_ROW[:13],                          # 금액 칼럼 없는 짧은 행
+        [],                                       # 빈 행
+        ["", "", "CODE-2", "", "브랜드", "진행 중"],  # 최소 행
+        ["", "", "", "", "브랜드"],                  # campaign_code 없음 → 제외
+        list(SAMPLE_ROW[:15]) + [" ₩ 1,000 ", "abc", "$2.5", "", "", "", ""],
+    ]
+    expected = [r for r in map(parse_dashboard_row, rows[1:]) if r is not None]
+
+    assert parse_all_dashboard_rows(rows) == expected
+    assert len(expected) == 4
+    assert expected[-1]["contract_amount_krw"] == 1000.0
+    assert expected[-1]["contract_amount_jpy"] == 0.0
+    assert expected[-1]["contract_amount_usd"] == 2.5
+
+
+def test_parse_dashboard_columns_unformatted_values():
+    """read_columns 응답 (칼럼별, 숫자 금액/일련번호 날짜, 끝 빈 셀 생략)"""
+    columns = {col: ["header"] for col in DASHBOARD_COLUMNS}
+    for col in DASHBOARD_COLUMNS:
+        columns[col].append(SAMPLE_ROW[col])
+    columns[15][1] = 17878863
+    columns[16][1] = ""
+    columns[19][1] = 7000000
+    columns[20][1] = 460000
+    columns[21][1] = 6514483
+    columns[11][1] = 46034
+    columns[12][1] = 46053
+    # 두 번째 행: campaign_code 만 있고 나머지 칼럼은 잘림 → 제외
+    columns[2].append("CODE-ONLY")
+
+    records = parse_dashboard_columns(columns)
+
+    assert records == [parse_dashboard_row(SAMPLE_ROW)]
+
+
+def test_parse_dashboard_columns_integer_text_cells():
+    columns = {2: ["h", 2026], 4: ["h", "브랜드"], 15: ["h", 1000.0]}
+    record = parse_dashboard_columns(columns)[0]
+    assert record["campaign_code"] == "2026"
+    assert record["contract_amount_krw"] == 1000.0
+    assert record["start_date"] is None
+
+
 # ---------------------------------------------------------------------------
 # detect_newly_completed
 # ---------------------------------------------------------------------------
@@ -0,0 +1,84 @@
+"""fake_apify_server + ApifyProvider 통합 테스트 (실제 apify-client 사용)"""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from apify_collector import ApifyProvider, collect_ig_metrics
+from fake_apify_server import FakeApifyServer, _fake_item
+from identity import canonical_post_key
+
+
+def _entries(n: int) -> list[dict]:
+    return [{"post_url": f"https://www.instagram.com/reel/FAKE{i:03d}/"} for i in range(n)]
+
+
+class TestFakeApifyServer(unittest.TestCase):
+    """apify-client 가 fake 서버로 run 시작/대기/데이터셋 조회"""
+
+    def test_collects_through_fake_server(self):
+        entries = _entries(6)
+        with FakeApifyServer(run_latency=0.05, per_url_latency=0) as server:
+            provider = ApifyProvider(parallel=True, api_token="fake", api_url=server.url)
+            collect_ig_metrics(entries, batch_size=3, max_concurrent_runs=2, provider=provider)
+
+            self.assertEqual(server.runs_started, 2)
+
+        self.assertTrue(all(e["collection_status"] == "collected" for e in entries))
+        expected = _fake_item(entries[0]["post_url"])
+        self.assertEqual(entries[0]["views"], expected["videoPlayCount"])
+        self.assertEqual(entries[0]["likes"], expected["likesCount"])
+
+    def test_failing_runs_are_marked_failed(self):
+        entries = _entries(2)
+        with FakeApifyServer(run_latency=0, per_url_latency=0, failure_rate=1.0) as server:
+            provider = ApifyProvider(parallel=True, api_token="fake", api_url=server.url)
+            collect_ig_metrics(entries, batch_size=2, retries=1, backoff_seconds=0, provider=provider)
+
+            # 2회 시도 + 1건씩 분할 2회
+            self.assertEqual(server.runs_started, 4)
+
+        self.assertTrue(all(e["collection_status"] == "failed" for e in entries))
+        self.assertTrue(all(e["views"] is None for e in entries))
+
+    def test_compute_units_reported(self):
+        with FakeApifyServer(
+            run_latency=0, per_url_latency=0,
+            compute_units_per_run=0.01, compute_units_per_url=0.002,
+        ) as server:
+            provider = ApifyProvider(parallel=True, api_token="fake", api_url=server.url)
+            metrics, compute_units = provider.fetch_batch(
+                [e["post_url"] for e in _entries(5)]
+            )
+
+        self.assertEqual(len(metrics), 5)
+        self.assertAlmostEqual(compute_units, 0.02)
+
+
+class TestCustomProvider(unittest.TestCase):
+    """MetricsProvider 프로토콜을 따르는 임의 공급자 사용"""
+
+    def test_collect_with_stub_provider(self):
+        class StubProvider:
+            def __init__(self):
+                self.batches = []
+
+            def fetch_batch(self, urls):
+                self.batches.append(urls)
+                return {canonical_post_key(u): {"views": 1, "likes": 2, "shares": 3, "comments": 4}
+                        for u in urls[:-1]}, None
+
+        provider = StubProvider()
+        entries = collect_ig_metrics(_entries(3), batch_size=3, provider=provider)
+
+        self.assertEqual(len(provider.batches), 1)
+        self.assertEqual([e["collection_status"] for e in entries], ["collected", "collected", "missing"])
+        self.assertEqual(entries[0]["comments"], 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
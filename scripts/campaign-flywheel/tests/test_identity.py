@@ -0,0 +1,71 @@
+"""identity 테스트"""
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from identity import canonical_post_key, normalize_creator_key
+
+
+class TestCanonicalPostKey(unittest.TestCase):
+    """같은 포스트의 URL 변형이 하나의 키로 묶이는지 확인"""
+
+    def test_post_variants_share_shortcode(self):
+        variants = [
+            "https://www.instagram.com/reel/C1a2B3c4D5e/",
+            "https://www.instagram.com/reel/C1a2B3c4D5e/?igsh=MXh5cHl6",
+            "https://instagram.com/p/C1a2B3c4D5e",
+            "https://www.instagram.com/reels/C1a2B3c4D5e/",
+            "http://www.instagram.com/tv/C1a2B3c4D5e/",
+            "https://www.instagram.com/some.creator/reel/C1a2B3c4D5e/",
+            "https://WWW.INSTAGRAM.COM/REEL/C1a2B3c4D5e/",
+        ]
+        self.assertEqual({canonical_post_key(u) for u in variants}, {"C1a2B3c4D5e"})
+
+    def test_shortcode_case_is_preserved(self):
+        """shortcode 는 대소문자를 구분하므로 다른 포스트로 취급"""
+        self.assertNotEqual(
+            canonical_post_key("https://www.instagram.com/p/AbC123/"),
+            canonical_post_key("https://www.instagram.com/p/abc123/"),
+        )
+
+    def test_story_key(self):
+        self.assertEqual(
+            canonical_post_key("https://www.instagram.com/stories/Some.User/3312345678901234567/?hl=ko"),
+            "stories/some.user/3312345678901234567",
+        )
+        self.assertEqual(
+            canonical_post_key("https://www.instagram.com/stories/some.user/"),
+            "stories/some.user",
+        )
+
+    def test_fallback_normalizes_url(self):
+        self.assertEqual(
+            canonical_post_key("https://www.instagram.com/Explore/"),
+            "https://www.instagram.com/explore",
+        )
+
+
+
+class TestNormalizeCreatorKey(unittest.TestCase):
+    """같은 크리에이터의 핸들 표기 차이가 하나의 키로 묶이는지 확인"""
+
+    def test_handle_variants_share_key(self):
+        variants = ["creator.one", "@creator.one", " Creator.One ", "@CREATOR.ONE\n"]
+        self.assertEqual({normalize_creator_key(h, "다른 이름") for h in variants}, {"creator.one"})
+
+    def test_falls_back_to_creator_name(self):
+        self.assertEqual(normalize_creator_key(None, " 크리에이터A "), "크리에이터a")
+        self.assertEqual(normalize_creator_key("  ", "Name"), "name")
+
+    def test_empty_returns_none(self):
+        self.assertIsNone(normalize_creator_key(None, None))
+        self.assertIsNone(normalize_creator_key("", " "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,15 @@ from unittest.mock import MagicMock, call
 # campaign-flywheel 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from insight_writer import format_insight_row, write_to_insight_tab, write_to_supabase
+from insight_writer import (
+    format_insight_row,
+    write_to_insight_tab,
+    write_to_supabase,
+    write_recollected_to_supabase,
+    write_snapshots,
+    write_financials_to_supabase,
+    financial_record_hash,
+)
 
 
 class TestFormatInsightRow(unittest.TestCase):
@@ -97,30 +105,270 @@ class TestWriteToSupabaseUpserts(unittest.TestCase):
         ]
 
         # Supabase 클라이언트 mock 체인: client.table(...).upsert(...).execute()
-        mock_execute = MagicMock()
-        mock_execute.count = 1
+        tables = {"campaign_posts": MagicMock(), "creator_first_seen": MagicMock()}
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = tables.__getitem__
 
-        mock_upsert = MagicMock()
-        mock_upsert.execute.return_value = mock_execute
+        result = write_to_supabase(mock_supabase, entries)
 
-        mock_table = MagicMock()
-        mock_table.upsert.return_value = mock_upsert
+        # upsert가 on_conflict="post_key"(정규 포스트 키)로 호출됐는지 확인
+        posts_upsert = tables["campaign_posts"].upsert
+        posts_upsert.assert_called_once()
+        self.assertEqual(posts_upsert.call_args.kwargs.get("on_conflict"), "post_key")
+        record = posts_upsert.call_args.args[0][0]
+        self.assertEqual(record["post_key"], "R001")
+        self.assertEqual(record["creator_key"], "creator1_ig")
+        # execute 호출 확인
+        posts_upsert.return_value.execute.assert_called_once()
+        # 크리에이터 최초 수집 시각은 이미 있으면 무시
+        first_seen_upsert = tables["creator_first_seen"].upsert
+        first_seen_upsert.assert_called_once_with(
+            [{
+                "creator_key": "creator1_ig",
+                "first_seen_at": "2026-03-30T00:00:00Z",
+                "ig_handle": "creator1_ig",
+                "creator_name": "크리에이터1",
+            }],
+            on_conflict="creator_key",
+            ignore_duplicates=True,
+        )
+        # 반환값: 1
+        self.assertEqual(result, 1)
 
+    def test_first_seen_keeps_earliest_per_creator(self):
+        """같은 배치의 같은 크리에이터는 가장 이른 수집 시각 한 행, 미수집 포스트는 제외"""
+        entries = [
+            {"ig_handle": "@Creator1", "post_url": "https://www.instagram.com/p/A/",
+             "collected_at": "2026-03-31T00:00:00Z"},
+            {"ig_handle": "creator1", "post_url": "https://www.instagram.com/p/B/",
+             "collected_at": "2026-03-30T00:00:00Z"},
+            {"creator_name": "이름만", "post_url": "https://www.instagram.com/p/C/",
+             "collected_at": None},
+        ]
         mock_supabase = MagicMock()
-        mock_supabase.table.return_value = mock_table
 
-        result = write_to_supabase(mock_supabase, entries)
+        write_to_supabase(mock_supabase, entries)
+
+        rows = mock_supabase.table.return_value.upsert.call_args.args[0]
+        self.assertEqual(
+            [(r["creator_key"], r["first_seen_at"]) for r in rows],
+            [("creator1", "2026-03-30T00:00:00Z")],
+        )
+
+
+class TestWriteRecollectedToSupabase(unittest.TestCase):
+    """재수집 결과가 지표와 스케줄 칼럼을 함께 upsert 하는지 확인"""
+
+    def test_write_recollected_includes_schedule(self):
+        entries = [{
+            "brand_name": "브랜드X",
+            "post_url": "https://www.instagram.com/reel/R001/",
+            "views": 30000,
+            "collected_at": "2026-04-02T00:00:00Z",
+            "recollect_stage": 2,
+            "next_recollect_at": "2026-04-07T00:00:00+00:00",
+        }]
+        mock_supabase = MagicMock()
+
+        result = write_recollected_to_supabase(mock_supabase, entries)
 
-        # table("campaign_posts") 호출 확인
         mock_supabase.table.assert_called_with("campaign_posts")
-        # upsert가 on_conflict="post_url"로 호출됐는지 확인
-        call_kwargs = mock_table.upsert.call_args
-        self.assertEqual(call_kwargs.kwargs.get("on_conflict"), "post_url")
-        # execute 호출 확인
-        mock_upsert.execute.assert_called_once()
-        # 반환값: 1
+        records = mock_supabase.table.return_value.upsert.call_args.args[0]
+        self.assertEqual(records[0]["views"], 30000)
+        self.assertEqual(records[0]["recollect_stage"], 2)
+        self.assertEqual(records[0]["next_recollect_at"], "2026-04-07T00:00:00+00:00")
         self.assertEqual(result, 1)
 
+    def test_successful_recollection_updates_status(self):
+        """재수집 성공 시 collection_status 와 last_recollect_status 모두 collected"""
+        entries = [{
+            "post_url": "https://www.instagram.com/reel/R006/",
+            "collected_at": "2026-04-02T00:00:00Z",
+            "collection_status": "collected",
+        }]
+        mock_supabase = MagicMock()
+
+        write_recollected_to_supabase(mock_supabase, entries)
+
+        records = mock_supabase.table.return_value.upsert.call_args.args[0]
+        self.assertEqual(records[0]["collection_status"], "collected")
+        self.assertEqual(records[0]["last_recollect_status"], "collected")
+
+    def test_recollection_keeps_first_collected_at(self):
+        """재수집 시각은 last_collected_at 에만 기록, collected_at 은 최초 수집 시각 유지"""
+        entries = [
+            {
+                "post_url": "https://www.instagram.com/reel/R001/",
+                "first_collected_at": "2026-03-30T00:00:00Z",
+                "collected_at": "2026-04-02T00:00:00Z",
+            },
+            {
+                # 최초 수집 실패 후 재수집으로 처음 수집된 포스트
+                "post_url": "https://www.instagram.com/reel/R003/",
+                "first_collected_at": None,
+                "collected_at": "2026-04-02T00:00:00Z",
+            },
+        ]
+        tables = {"campaign_posts": MagicMock(), "creator_first_seen": MagicMock()}
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = tables.__getitem__
+
+        write_recollected_to_supabase(mock_supabase, entries)
+
+        records = tables["campaign_posts"].upsert.call_args.args[0]
+        self.assertEqual(
+            [(r["collected_at"], r["last_collected_at"]) for r in records],
+            [
+                ("2026-03-30T00:00:00Z", "2026-04-02T00:00:00Z"),
+                ("2026-04-02T00:00:00Z", "2026-04-02T00:00:00Z"),
+            ],
+        )
+
+    def test_recollection_records_creator_first_seen(self):
+        """재수집으로 처음 수집된 크리에이터도 creator_first_seen 에 추가 (실패 엔트리 제외)"""
+        entries = [
+            {"ig_handle": "late_creator", "post_url": "https://www.instagram.com/reel/R004/",
+             "first_collected_at": None, "collected_at": "2026-04-02T00:00:00Z"},
+            {"ig_handle": "still_failing", "post_url": "https://www.instagram.com/reel/R005/",
+             "collection_status": "failed"},
+        ]
+        tables = {"campaign_posts": MagicMock(), "creator_first_seen": MagicMock()}
+        mock_supabase = MagicMock()
+        mock_supabase.table.side_effect = tables.__getitem__
+
+        write_recollected_to_supabase(mock_supabase, entries)
+
+        first_seen_upsert = tables["creator_first_seen"].upsert
+        first_seen_upsert.assert_called_once()
+        rows = first_seen_upsert.call_args.args[0]
+        self.assertEqual(
+            [(r["creator_key"], r["first_seen_at"]) for r in rows],
+            [("late_creator", "2026-04-02T00:00:00Z")],
+        )
+        self.assertTrue(first_seen_upsert.call_args.kwargs["ignore_duplicates"])
+
+    def test_failed_recollection_keeps_existing_metrics(self):
+        """수집 실패 엔트리는 지표 칼럼 없이 상태/스케줄만 upsert"""
+        entries = [{
+            "brand_name": "브랜드X",
+            "post_url": "https://www.instagram.com/reel/R002/",
+            "views": None,
+            "collection_status": "failed",
+            "recollect_stage": 1,
+            "next_recollect_at": "2026-04-02T12:00:00+00:00",
+        }]
+        mock_supabase = MagicMock()
+
+        result = write_recollected_to_supabase(mock_supabase, entries)
+
+        records = mock_supabase.table.return_value.upsert.call_args.args[0]
+        self.assertNotIn("views", records[0])
+        self.assertNotIn("collected_at", records[0])
+        self.assertNotIn("last_collected_at", records[0])
+        # 이전 수집 상태는 유지, 이번 시도 결과만 별도 칼럼에 기록
+        self.assertNotIn("collection_status", records[0])
+        self.assertEqual(records[0]["last_recollect_status"], "failed")
+        self.assertEqual(records[0]["next_recollect_at"], "2026-04-02T12:00:00+00:00")
+        self.assertEqual(result, 1)
+
+
+class TestWriteSnapshots(unittest.TestCase):
+    """수집 성공 엔트리만 스냅샷 테이블에 insert"""
+
+    def test_write_snapshots_skips_uncollected(self):
+        entries = [
+            {"post_url": "u1", "views": 10, "likes": 1, "shares": 0, "comments": 0,
+             "collected_at": "2026-04-02T00:00:00Z"},
+            {"post_url": "u2", "views": 0, "likes": 0, "shares": 0, "comments": 0},
+        ]
+        mock_supabase = MagicMock()
+
+        result = write_snapshots(mock_supabase, entries)
+
+        mock_supabase.table.assert_called_with("campaign_post_snapshots")
+        records = mock_supabase.table.return_value.insert.call_args.args[0]
+        self.assertEqual([r["post_url"] for r in records], ["u1"])
+        # 직전 지표가 없으면 수집값 자체가 delta
+        self.assertEqual(records[0]["views_delta"], 10)
+        self.assertEqual(result, 1)
+
+    def test_write_snapshots_only_changed_with_deltas(self):
+        entries = [
+            {"post_url": "u1", "views": 150, "likes": 12, "shares": 1, "comments": 3,
+             "collected_at": "2026-04-05T00:00:00Z"},
+            {"post_url": "u2", "views": 40, "likes": 2, "shares": 0, "comments": 0,
+             "collected_at": "2026-04-05T00:00:00Z"},
+        ]
+        previous = {
+            "u1": {"views": 100, "likes": 10, "shares": 1, "comments": None},
+            "u2": {"views": 40, "likes": 2, "shares": 0, "comments": 0},
+        }
+        mock_supabase = MagicMock()
+
+        result = write_snapshots(mock_supabase, entries, previous=previous)
+
+        records = mock_supabase.table.return_value.insert.call_args.args[0]
+        self.assertEqual(result, 1)
+        self.assertEqual(records[0]["post_url"], "u1")
+        self.assertEqual(records[0]["views"], 150)
+        self.assertEqual(records[0]["views_delta"], 50)
+        self.assertEqual(records[0]["likes_delta"], 2)
+        self.assertEqual(records[0]["shares_delta"], 0)
+        self.assertEqual(records[0]["comments_delta"], 3)
+
+    def test_write_snapshots_nothing_changed(self):
+        entries = [{"post_url": "u1", "views": 5, "collected_at": "2026-04-05T00:00:00Z"}]
+        mock_supabase = MagicMock()
+
+        result = write_snapshots(mock_supabase, entries, previous={"u1": {"views": 5}})
+
+        mock_supabase.table.assert_not_called()
+        self.assertEqual(result, 0)
+
+
+class TestWriteFinancialsToSupabase(unittest.TestCase):
+    """내용 해시가 바뀐 재무 레코드만 upsert"""
+
+    def _client(self, stored: list[dict]) -> MagicMock:
+        client = MagicMock()
+        select = client.table.return_value.select.return_value
+        select.order.return_value.range.return_value.execute.return_value = MagicMock(data=stored)
+        return client
+
+    def test_upserts_only_new_and_changed(self):
+        same = {"campaign_code": "A", "brand_name": "a", "cost_krw": 1.0}
+        changed = {"campaign_code": "B", "brand_name": "b", "cost_krw": 2.0}
+        new = {"campaign_code": "C", "brand_name": "c", "cost_krw": 3.0}
+        client = self._client([
+            {"campaign_code": "A", "content_hash": financial_record_hash(same)},
+            {"campaign_code": "B", "content_hash": financial_record_hash({**changed, "cost_krw": 9.0})},
+        ])
+
+        counts = write_financials_to_supabase(client, [same, changed, new])
+
+        self.assertEqual(counts, {"inserted": 1, "updated": 1, "unchanged": 1})
+        upsert = client.table.return_value.upsert
+        upsert.assert_called_once()
+        rows = upsert.call_args.args[0]
+        self.assertEqual([r["campaign_code"] for r in rows], ["B", "C"])
+        self.assertEqual(rows[0]["content_hash"], financial_record_hash(changed))
+        self.assertEqual(upsert.call_args.kwargs["on_conflict"], "campaign_code")
+
+    def test_nothing_changed_skips_upsert(self):
+        record = {"campaign_code": "A", "brand_name": "a"}
+        client = self._client([{"campaign_code": "A", "content_hash": financial_record_hash(record)}])
+
+        counts = write_financials_to_supabase(client, [record])
+
+        self.assertEqual(counts, {"inserted": 0, "updated": 0, "unchanged": 1})
+        client.table.return_value.upsert.assert_not_called()
+
+    def test_hash_ignores_key_order(self):
+        a = {"campaign_code": "A", "cost_krw": 1.0, "start_date": "2026-01-01"}
+        b = {"start_date": "2026-01-01", "cost_krw": 1.0, "campaign_code": "A"}
+        self.assertEqual(financial_record_hash(a), financial_record_hash(b))
+        self.assertNotEqual(financial_record_hash(a), financial_record_hash({**a, "cost_krw": 2.0}))
+
 
 if __name__ == "__main__":
     unittest.main()
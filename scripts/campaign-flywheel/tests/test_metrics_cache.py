@@ -0,0 +1,55 @@
+"""metrics_cache 테스트"""
+from __future__ import annotations
+
+import sys
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from metrics_cache import MetricsCache
+
+
+NOW = datetime(2026, 3, 31, 12, 0, tzinfo=timezone.utc)
+METRICS = {"views": 100, "likes": 10, "shares": 1, "comments": 2}
+
+
+class TestMetricsCacheFreshness(unittest.TestCase):
+    """max_age 기준 신선도 판단"""
+
+    def setUp(self):
+        self.cache = MetricsCache(":memory:")
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_fresh_entry_returned(self):
+        collected_at = (NOW - timedelta(hours=1)).isoformat()
+        self.cache.put_many([("key_a", METRICS, collected_at)])
+
+        fresh = self.cache.get_fresh(["key_a"], timedelta(hours=24), now=NOW)
+
+        self.assertEqual(fresh, {"key_a": (METRICS, collected_at)})
+
+    def test_stale_and_missing_entries_excluded(self):
+        stale_at = (NOW - timedelta(hours=30)).isoformat()
+        self.cache.put_many([("key_a", METRICS, stale_at)])
+
+        fresh = self.cache.get_fresh(["key_a", "key_b"], timedelta(hours=24), now=NOW)
+
+        self.assertEqual(fresh, {})
+
+    def test_put_overwrites(self):
+        self.cache.put_many([("key_a", METRICS, (NOW - timedelta(hours=30)).isoformat())])
+        newer = {**METRICS, "views": 500}
+        self.cache.put_many([("key_a", newer, NOW.isoformat())])
+
+        fresh = self.cache.get_fresh(["key_a"], timedelta(hours=24), now=NOW)
+
+        self.assertEqual(fresh["key_a"][0]["views"], 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""pipeline 테스트"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from pipeline import Phase, PipelineError, map_isolated, run_pipeline
+
+
+class TestRunPipeline(unittest.TestCase):
+    """의존 그래프 실행"""
+
+    def test_passes_dependency_results_in_order(self):
+        results, timings = run_pipeline([
+            Phase("a", lambda: 1),
+            Phase("b", lambda: 2),
+            Phase("c", lambda a, b: (a, b), depends_on=("a", "b")),
+        ])
+
+        self.assertEqual(results, {"a": 1, "b": 2, "c": (1, 2)})
+        self.assertEqual(set(timings), {"a", "b", "c"})
+
+    def test_independent_phases_run_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def phase():
+            barrier.wait()  # 두 단계가 동시에 실행되지 않으면 타임아웃
+            return True
+
+        start = time.monotonic()
+        results, _ = run_pipeline([Phase("a", phase), Phase("b", phase)])
+
+        self.assertEqual(results, {"a": True, "b": True})
+        self.assertLess(time.monotonic() - start, 5)
+
+    def test_dependent_phase_waits(self):
+        order = []
+
+        def slow():
+            time.sleep(0.05)
+            order.append("slow")
+
+        run_pipeline([
+            Phase("slow", slow),
+            Phase("after", lambda _: order.append("after"), depends_on=("slow",)),
+        ])
+
+        self.assertEqual(order, ["slow", "after"])
+
+    def test_failure_skips_dependents_only(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        with self.assertRaises(PipelineError) as ctx:
+            run_pipeline([
+                Phase("bad", boom),
+                Phase("child", lambda _: "x", depends_on=("bad",)),
+                Phase("grandchild", lambda _: "y", depends_on=("child",)),
+                Phase("other", lambda: "ok"),
+            ])
+
+        err = ctx.exception
+        self.assertEqual(list(err.errors), ["bad"])
+        self.assertEqual(sorted(err.skipped), ["child", "grandchild"])
+        self.assertEqual(err.results, {"other": "ok"})
+
+    def test_invalid_graph_rejected(self):
+        with self.assertRaises(ValueError):
+            run_pipeline([Phase("a", lambda _: 1, depends_on=("missing",))])
+        with self.assertRaises(ValueError):
+            run_pipeline([
+                Phase("a", lambda _: 1, depends_on=("b",)),
+                Phase("b", lambda _: 1, depends_on=("a",)),
+            ])
+
+
+class TestMapIsolated(unittest.TestCase):
+    """순서 유지 + 항목별 실패 격리 + 동시 실행 수 제한"""
+
+    def test_results_in_input_order_with_errors_isolated(self):
+        def work(n):
+            time.sleep(0.01 * (5 - n))  # 뒤 항목이 먼저 끝남
+            if n == 2:
+                raise ValueError("bad")
+            return n * 10
+
+        out = list(map_isolated(work, range(5), max_workers=5))
+
+        self.assertEqual([item for item, _, _ in out], [0, 1, 2, 3, 4])
+        self.assertEqual([r for _, r, _ in out], [0, 10, None, 30, 40])
+        self.assertIsInstance(out[2][2], ValueError)
+        self.assertTrue(all(e is None for i, _, e in out if i != 2))
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        active = 0
+        peak = 0
+
+        def work(_):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+
+        list(map_isolated(work, range(12), max_workers=3))
+
+        self.assertLessEqual(peak, 3)
+        self.assertGreater(peak, 1)
+
+    def test_empty_items(self):
+        self.assertEqual(list(map_isolated(lambda x: x, [], max_workers=4)), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+"""post_index 테스트"""
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from post_index import PostKeyIndex, load_post_key_index
+
+NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+def _paged_client(pages: list[list[dict]]) -> MagicMock:
+    """gt().order().limit().execute().data 가 pages 를 순서대로 반환하는 supabase mock"""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.gt.return_value.order.return_value.limit.return_value.execute.side_effect = [
+        MagicMock(data=p) for p in pages
+    ]
+    return client
+
+
+class TestPostKeyIndex(unittest.TestCase):
+    """정렬 해시 배열 멤버십"""
+
+    def test_contains_after_add_and_compact(self):
+        index = PostKeyIndex()
+        index.add_many(f"KEY{i:05d}" for i in range(10_000))
+
+        self.assertIn("KEY00042", index)
+        self.assertNotIn("KEY99999", index)
+        self.assertEqual(len(index), 10_000)
+        # 중복 추가는 무시
+        index.add_many(["KEY00042", "NEW"])
+        self.assertEqual(len(index), 10_001)
+        self.assertIn("NEW", index)
+
+    def test_save_and_load_roundtrip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.bin"
+            index = PostKeyIndex(last_seq=42, built_at=NOW.isoformat())
+            index.add_many(["A", "B", "C"])
+            index.save(path)
+
+            loaded = PostKeyIndex.load(path)
+
+        self.assertEqual(loaded.last_seq, 42)
+        self.assertEqual(len(loaded), 3)
+        self.assertIn("B", loaded)
+        self.assertNotIn("D", loaded)
+
+    def test_corrupt_file_returns_none(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.bin"
+            path.write_bytes(b"not json\n")
+            self.assertIsNone(PostKeyIndex.load(path))
+
+
+class TestLoadPostKeyIndex(unittest.TestCase):
+    """seq keyset 페이지네이션 + 증분 갱신"""
+
+    def test_full_build_pages_by_seq(self):
+        client = _paged_client([
+            [{"seq": 1, "post_key": "A"}, {"seq": 2, "post_key": "B"}],
+            [{"seq": 5, "post_key": "C"}],
+        ])
+
+        index = load_post_key_index(client, None, page_size=2, now=NOW)
+
+        query = client.table.return_value.select.return_value
+        self.assertEqual([c.args for c in query.gt.call_args_list], [("seq", 0), ("seq", 2)])
+        self.assertEqual(index.last_seq, 5)
+        self.assertIn("C", index)
+
+    def test_incremental_refresh_from_cache(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.bin"
+            cached = PostKeyIndex(last_seq=10, built_at=(NOW - timedelta(days=1)).isoformat())
+            cached.add_many(["OLD"])
+            cached.save(path)
+            client = _paged_client([[{"seq": 11, "post_key": "NEW"}]])
+
+            index = load_post_key_index(client, path, now=NOW)
+
+            query = client.table.return_value.select.return_value
+            query.gt.assert_called_once_with("seq", 10)
+            self.assertIn("OLD", index)
+            self.assertIn("NEW", index)
+            self.assertEqual(PostKeyIndex.load(path).last_seq, 11)
+
+    def test_stale_cache_is_rebuilt(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "index.bin"
+            cached = PostKeyIndex(last_seq=10, built_at=(NOW - timedelta(days=8)).isoformat())
+            cached.add_many(["DELETED"])
+            cached.save(path)
+            client = _paged_client([[{"seq": 3, "post_key": "KEPT"}]])
+
+            index = load_post_key_index(client, path, full_refresh_after=timedelta(days=7), now=NOW)
+
+        client.table.return_value.select.return_value.gt.assert_called_once_with("seq", 0)
+        self.assertNotIn("DELETED", index)
+        self.assertIn("KEPT", index)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+"""rate_limiter 테스트"""
+from __future__ import annotations
+
+import sys
+import os
+import unittest
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """sleep 하면 시간이 흐르는 가짜 시계"""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """분당 쿼터 준수 확인"""
+
+    def test_burst_is_not_throttled(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst=5, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            bucket.acquire()
+        self.assertEqual(clock.sleeps, [])
+
+    def test_throttles_after_burst(self):
+        """burst 소진 후에는 분당 rate 간격(60/분 → 1초)으로 대기"""
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst=2, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            bucket.acquire()
+        self.assertEqual(len(clock.sleeps), 3)
+        self.assertAlmostEqual(clock.now, 3.0)
+
+    def test_sustained_rate_matches_quota(self):
+        """120건 요청 시 분당 60건 쿼터면 약 1분 이상 소요"""
+        clock = FakeClock()
+        bucket = TokenBucket(60, burst=10, clock=clock, sleep=clock.sleep)
+        for _ in range(120):
+            bucket.acquire()
+        self.assertGreaterEqual(clock.now, (120 - 10) / 1.0 - 1e-6)
+
+    def test_invalid_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""recollector 테스트"""
+from __future__ import annotations
+
+import sys
+import os
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from recollector import apply_schedule, defer_failed, fetch_due_posts, schedule_after_refresh
+
+
+BUCKETS = (1, 3, 7, 14, 30)
+CREATED = datetime(2026, 3, 1, 10, 0, tzinfo=timezone.utc)
+
+
+class TestScheduleAfterRefresh(unittest.TestCase):
+    """경과일 구간별 다음 재수집 시각 계산"""
+
+    def test_day_one_refresh_schedules_day_three(self):
+        stage, next_at = schedule_after_refresh(CREATED, CREATED + timedelta(days=1, hours=2), BUCKETS)
+        self.assertEqual(stage, 1)
+        self.assertEqual(next_at, CREATED + timedelta(days=3))
+
+    def test_overdue_post_skips_passed_buckets(self):
+        """10일째 처음 재수집하면 1/3/7일 구간은 건너뛰고 14일 구간 예약"""
+        stage, next_at = schedule_after_refresh(CREATED, CREATED + timedelta(days=10), BUCKETS)
+        self.assertEqual(stage, 3)
+        self.assertEqual(next_at, CREATED + timedelta(days=14))
+
+    def test_last_bucket_ends_schedule(self):
+        stage, next_at = schedule_after_refresh(CREATED, CREATED + timedelta(days=31), BUCKETS)
+        self.assertEqual(stage, 5)
+        self.assertIsNone(next_at)
+
+
+class TestApplySchedule(unittest.TestCase):
+    """재수집 성공 엔트리만 스케줄 갱신"""
+
+    def test_apply_schedule_skips_failed_entries(self):
+        now = CREATED + timedelta(days=3, hours=1)
+        entries = [
+            {"post_url": "a", "created_at": "2026-03-01T10:00:00Z", "collected_at": now.isoformat()},
+            {"post_url": "b", "created_at": "2026-03-01T10:00:00+00:00"},
+        ]
+
+        refreshed = apply_schedule(entries, now, BUCKETS)
+
+        self.assertEqual([e["post_url"] for e in refreshed], ["a"])
+        self.assertEqual(refreshed[0]["recollect_stage"], 2)
+        self.assertEqual(refreshed[0]["next_recollect_at"], (CREATED + timedelta(days=7)).isoformat())
+
+
+class TestDeferFailed(unittest.TestCase):
+    """재수집 실패 포스트는 구간 유지, 재시도 시각만 뒤로"""
+
+    def test_defer_failed_entries(self):
+        now = CREATED + timedelta(days=3, hours=1)
+        entries = [
+            {"post_url": "a", "recollect_stage": 1, "collected_at": now.isoformat()},
+            {"post_url": "b", "recollect_stage": 1, "collection_status": "failed"},
+        ]
+
+        deferred = defer_failed(entries, now, timedelta(hours=12))
+
+        self.assertEqual([e["post_url"] for e in deferred], ["b"])
+        self.assertEqual(deferred[0]["recollect_stage"], 1)
+        self.assertEqual(deferred[0]["next_recollect_at"], (now + timedelta(hours=12)).isoformat())
+
+
+class TestFetchDuePosts(unittest.TestCase):
+    """예정 시각이 지난 포스트를 밀린 순으로 제한 조회"""
+
+    def test_fetch_due_posts_query(self):
+        now = datetime(2026, 3, 31, tzinfo=timezone.utc)
+        mock_supabase = MagicMock()
+        query = mock_supabase.table.return_value.select.return_value
+        query.lte.return_value.order.return_value.limit.return_value.execute.return_value.data = [
+            {"post_url": "a"}
+        ]
+
+        posts = fetch_due_posts(mock_supabase, now, 50)
+
+        mock_supabase.table.assert_called_with("campaign_posts")
+        query.lte.assert_called_with("next_recollect_at", now.isoformat())
+        query.lte.return_value.order.assert_called_with("next_recollect_at")
+        query.lte.return_value.order.return_value.limit.assert_called_with(50)
+        self.assertEqual(posts, [{"post_url": "a"}])
+
+
+if __name__ == "__main__":
+    unittest.main()
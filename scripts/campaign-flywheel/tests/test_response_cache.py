@@ -0,0 +1,92 @@
+"""response_cache 테스트"""
+from __future__ import annotations
+
+import sys
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from response_cache import MISS, ResponseCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    """히트/미스, TTL, LRU 제거 확인"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(":memory:", max_bytes=10_000, ttl_seconds=60, clock=self.clock)
+
+    def tearDown(self):
+        self.cache.close()
+
+    def test_round_trip_and_counters(self):
+        self.assertIs(self.cache.get("k"), MISS)
+        self.cache.put("k", [["a", "b"], []])
+        self.assertEqual(self.cache.get("k"), [["a", "b"], []])
+
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["entries"], 1)
+
+    def test_empty_value_is_a_hit(self):
+        self.cache.put("empty", [])
+        self.assertEqual(self.cache.get("empty"), [])
+
+    def test_ttl_expiry(self):
+        self.cache.put("k", [1])
+        self.clock.now += 61
+        self.assertIs(self.cache.get("k"), MISS)
+        self.assertEqual(self.cache.stats()["entries"], 0)
+
+    def test_per_call_max_age(self):
+        self.cache.put("k", [1])
+        self.clock.now += 30
+        self.assertIs(self.cache.get("k", max_age=10), MISS)
+
+    def test_lru_eviction(self):
+        """크기 상한 초과 시 가장 오래 조회되지 않은 항목부터 제거"""
+        import random
+
+        rng = random.Random(0)
+        # 압축되지 않는 페이로드로 항목당 ~4KB
+        payload = lambda: "".join(rng.choice("abcdefghijklmnop0123456789") for _ in range(6000))
+        self.cache.put("a", payload())
+        self.clock.now += 1
+        self.cache.put("b", payload())
+        self.clock.now += 1
+        self.cache.get("a")  # a 를 최근 조회로 갱신
+        self.clock.now += 1
+        self.cache.put("c", payload())
+
+        self.assertIsNot(self.cache.get("a"), MISS)
+        self.assertIs(self.cache.get("b"), MISS)
+        self.assertIsNot(self.cache.get("c"), MISS)
+        self.assertLessEqual(self.cache.stats()["bytes"], 10_000)
+
+    def test_persists_to_disk(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "cache" / "sheets.sqlite3"
+            cache = ResponseCache(path, max_bytes=10_000, ttl_seconds=60)
+            cache.put("k", {"x": 1})
+            cache.close()
+
+            reopened = ResponseCache(path, max_bytes=10_000, ttl_seconds=60)
+            self.assertEqual(reopened.get("k"), {"x": 1})
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,11 +4,20 @@ from __future__ import annotations
 import sys
 import os
 import unittest
+from unittest.mock import MagicMock, patch
 
 # campaign-flywheel 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from review_generator import calculate_campaign_kpis, build_completion_review_prompt, build_periodic_review_prompt
+from review_generator import (
+    calculate_campaign_kpis,
+    build_completion_review_prompt,
+    build_periodic_review_prompt,
+    fetch_posts_by_campaign,
+    fetch_periodic_summary,
+    generate_review,
+    KPI_POST_COLUMNS,
+)
 
 
 class TestCalculateCampaignKpis(unittest.TestCase):
@@ -92,6 +101,16 @@ class TestCalculateCampaignKpis(unittest.TestCase):
         kpis = calculate_campaign_kpis(self.posts, self.financials)
         self.assertEqual(kpis["creator_count"], 2)
 
+    def test_handle_variants_grouped_as_one_creator(self):
+        """@ 접두/대소문자만 다른 핸들은 같은 크리에이터로 집계"""
+        posts = self.posts + [
+            {"ig_handle": "@Creator_A", "creator_name": "크리에이터A",
+             "views": 1000, "likes": 10, "shares": 0, "comments": 0},
+        ]
+        kpis = calculate_campaign_kpis(posts, self.financials)
+        self.assertEqual(kpis["creator_count"], 2)
+        self.assertEqual(kpis["top_creators"][0]["views"], 101000)
+
 
 class TestCalculateCampaignKpisZeroViews(unittest.TestCase):
     """0 뷰 → cpv=0, avg_engagement_rate=0 (ZeroDivisionError 없음)"""
@@ -235,5 +254,81 @@ class TestBuildPeriodicReviewPrompt(unittest.TestCase):
         self.assertIn("액션아이템", prompt)
 
 
+class TestFetchPostsByCampaign(unittest.TestCase):
+    """완료 캠페인 포스트 일괄 조회"""
+
+    def test_single_in_query_paged_and_grouped(self):
+        client = MagicMock()
+        query = client.table.return_value.select.return_value.in_.return_value.order.return_value
+        query.range.return_value.execute.side_effect = [
+            MagicMock(data=[
+                {"id": "1", "campaign_code": "A", "views": 10},
+                {"id": "2", "campaign_code": "B", "views": 20},
+            ]),
+            MagicMock(data=[{"id": "3", "campaign_code": "A", "views": 30}]),
+        ]
+
+        result = fetch_posts_by_campaign(client, ["A", "B", "C"], page_size=2)
+
+        client.table.return_value.select.assert_called_with(KPI_POST_COLUMNS)
+        in_calls = client.table.return_value.select.return_value.in_.call_args_list
+        self.assertEqual([c.args for c in in_calls], [("campaign_code", ["A", "B", "C"])] * 2)
+        self.assertEqual([c.args for c in query.range.call_args_list], [(0, 1), (2, 3)])
+        self.assertEqual([p["id"] for p in result["A"]], ["1", "3"])
+        self.assertEqual([p["id"] for p in result["B"]], ["2"])
+        self.assertEqual(result["C"], [])
+
+
+class TestFetchPeriodicSummary(unittest.TestCase):
+    """정기 리뷰 요약 RPC"""
+
+    def test_calls_rpc_once_and_builds_summary(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.return_value = MagicMock(data={
+            "total_campaigns": 5,
+            "active_campaigns": 2,
+            "total_contract_krw": 1000000,
+            "total_margin_krw": 300000,
+            "prev_period": {"total_campaigns": 3, "total_contract_krw": 500000, "total_margin_krw": 100000},
+            "creator_pool_stats": {"total": 10, "new": 4, "returning": 6},
+            "brand_stats": {"total": 4, "new": 1, "returning": 3},
+        })
+
+        summary = fetch_periodic_summary(
+            client, "2026-10-04", "2026-10-18", "2026-09-20", {"운영 중", "섭외 중"}
+        )
+
+        client.rpc.assert_called_once_with("campaign_periodic_summary", {
+            "p_period_start": "2026-10-04",
+            "p_prev_period_start": "2026-09-20",
+            "p_active_statuses": ["섭외 중", "운영 중"],
+        })
+        self.assertEqual(summary["period_start"], "2026-10-04")
+        self.assertEqual(summary["period_end"], "2026-10-18")
+        self.assertEqual(summary["total_campaigns"], 5)
+        self.assertEqual(summary["creator_pool_stats"]["returning"], 6)
+        # 프롬프트 빌더가 그대로 사용할 수 있어야 함
+        self.assertIn("2026-10-04", build_periodic_review_prompt(summary))
+
+
+class TestGenerateReview(unittest.TestCase):
+    """Claude 호출 전 레이트 리미터 토큰 확보"""
+
+    def test_acquires_rate_limiter_before_request(self):
+        calls = []
+        client = MagicMock()
+        client.messages.create.side_effect = lambda **kw: (
+            calls.append("create") or MagicMock(content=[MagicMock(text="리뷰")])
+        )
+        limiter = MagicMock()
+        limiter.acquire.side_effect = lambda: calls.append("acquire")
+
+        with patch("review_generator._get_anthropic_client", return_value=client):
+            text = generate_review("프롬프트", rate_limiter=limiter)
+
+        self.assertEqual(text, "리뷰")
+        self.assertEqual(calls, ["acquire", "create"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,81 @@
+"""scan_manifest 테스트"""
+from __future__ import annotations
+
+import sys
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from scan_manifest import ScanManifest
+
+
+SHEET = {"id": "sheet_1", "name": "시트", "modifiedTime": "2026-03-27T01:00:00.000Z", "version": "12"}
+URL = "https://www.instagram.com/reel/MANIFEST1/"
+
+
+class TestScanManifestIsUnchanged(unittest.TestCase):
+    """modifiedTime/version 및 URL 반영 여부로 스킵 판단"""
+
+    def test_unknown_sheet_is_changed(self):
+        manifest = ScanManifest()
+        self.assertFalse(manifest.is_unchanged(SHEET, set()))
+
+    def test_same_modified_time_is_unchanged(self):
+        manifest = ScanManifest()
+        manifest.update(SHEET, [URL])
+        self.assertTrue(manifest.is_unchanged(SHEET, {URL}))
+
+    def test_new_modified_time_is_changed(self):
+        manifest = ScanManifest()
+        manifest.update(SHEET, [URL])
+        touched = {**SHEET, "modifiedTime": "2026-03-31T09:00:00.000Z", "version": "13"}
+        self.assertFalse(manifest.is_unchanged(touched, {URL}))
+
+    def test_uncollected_url_forces_rescan(self):
+        """지난 스캔 URL이 아직 수집되지 않았으면 다시 읽어야 함"""
+        manifest = ScanManifest()
+        manifest.update(SHEET, [URL])
+        self.assertFalse(manifest.is_unchanged(SHEET, set()))
+
+    def test_missing_modified_time_is_never_skipped(self):
+        manifest = ScanManifest()
+        sheet = {"id": "sheet_2", "name": "시트"}
+        manifest.update(sheet, [])
+        self.assertFalse(manifest.is_unchanged(sheet, set()))
+
+
+class TestScanManifestPersistence(unittest.TestCase):
+    """파일 저장/로드 왕복"""
+
+    def test_save_and_load_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "state" / "scan_manifest.json"
+            manifest = ScanManifest.load(path)
+            self.assertEqual(len(manifest), 0)
+
+            manifest.update(SHEET, [URL, URL])
+            manifest.save()
+
+            loaded = ScanManifest.load(path)
+            self.assertEqual(len(loaded), 1)
+            self.assertTrue(loaded.is_unchanged(SHEET, {URL}))
+
+    def test_corrupt_file_loads_empty(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "scan_manifest.json"
+            path.write_text("{not json", encoding="utf-8")
+            self.assertEqual(len(ScanManifest.load(path)), 0)
+
+    def test_prune_removes_deleted_sheets(self):
+        manifest = ScanManifest()
+        manifest.update(SHEET, [])
+        manifest.prune([])
+        self.assertEqual(len(manifest), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
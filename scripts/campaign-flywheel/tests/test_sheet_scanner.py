@@ -9,7 +9,13 @@ from unittest.mock import MagicMock, patch
 # campaign-flywheel 디렉토리를 sys.path에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from sheet_scanner import extract_ig_urls_from_rows, scan_all_sheets, _extract_brand_from_filename
+from sheet_scanner import (
+    extract_ig_urls_from_rows,
+    iter_new_entries,
+    scan_all_sheets,
+    _extract_brand_from_filename,
+)
+from scan_manifest import ScanManifest
 
 
 # 실제 PM 시트 헤더 샘플
@@ -106,6 +112,32 @@ class TestExtractCreatorInfoFromAdjacentColumns(unittest.TestCase):
         self.assertEqual(result["creator_name"], "佐藤 さくら")
 
 
+class TestExtractCreatorInfoUsesOnlyLeftCells(unittest.TestCase):
+    """URL 오른쪽 셀은 크리에이터 정보로 쓰지 않고, 같은 행의 뒤 URL은 앞 셀을 누적 사용"""
+
+    def test_extract_creator_info_uses_only_left_cells(self):
+        rows = [
+            ["https://www.instagram.com/reel/FIRST001/", "@late_handle", "늦은이름",
+             "https://www.instagram.com/p/SECOND01/"],
+        ]
+        results = extract_ig_urls_from_rows(rows, "브랜드", "sheet_id_005")
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]["ig_handle"], "")
+        self.assertEqual(results[0]["creator_name"], "")
+        # 두 번째 URL 기준 왼쪽 첫 IG 셀은 첫 번째 URL 셀 (기존 동작 유지)
+        self.assertEqual(results[1]["ig_handle"], "https://www.instagram.com/reel/FIRST001/")
+        self.assertEqual(results[1]["creator_name"], "늦은이름")
+
+    def test_extract_creator_info_skips_file_names_and_numbers(self):
+        rows = [
+            ["사진.jpg", "12,000", "홍길동", "https://www.instagram.com/reel/NAME0001/"],
+        ]
+        results = extract_ig_urls_from_rows(rows, "브랜드", "sheet_id_006")
+
+        self.assertEqual(results[0]["creator_name"], "홍길동")
+
+
 class TestScanAllSheetsDeduplicates(unittest.TestCase):
     """동일 시트 내 중복 URL은 1건만 수집하는지 확인"""
 
@@ -117,11 +149,11 @@ class TestScanAllSheetsDeduplicates(unittest.TestCase):
         mock_client.get_sheet_tabs.return_value = ["Sheet1"]
         # 같은 URL이 두 행에 존재
         duplicate_url = "https://www.instagram.com/reel/DUP001xyz/"
-        mock_client.read_tab.return_value = [
+        mock_client.read_tabs.return_value = [[
             ["이름", "ID", "링크"],
             ["크리에이터A", "@creator_a", duplicate_url],
             ["크리에이터A", "@creator_a", duplicate_url],
-        ]
+        ]]
 
         results = scan_all_sheets(mock_client, set())
 
@@ -130,8 +162,31 @@ class TestScanAllSheetsDeduplicates(unittest.TestCase):
         self.assertEqual(urls.count(duplicate_url), 1)
 
 
+class TestScanAllSheetsDedupsUrlVariants(unittest.TestCase):
+    """같은 포스트의 URL 변형은 시트가 달라도 1건만 추출"""
+
+    def test_url_variants_across_sheets(self):
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": "sheet_1", "name": "[KOREANERS] 온리프 진행"},
+            {"id": "sheet_2", "name": "[KOREANERS] 감자밭 진행"},
+        ]
+        mock_client.get_sheet_tabs.return_value = ["Sheet1"]
+        mock_client.read_tabs.side_effect = [
+            [[["ID", "링크"], ["@a", "https://www.instagram.com/reel/VAR001/?igsh=xyz"]]],
+            [[["ID", "링크"], ["@a", "https://instagram.com/reels/VAR001"],
+              ["@a", "https://www.instagram.com/p/VAR001/"]]],
+        ]
+
+        results = scan_all_sheets(mock_client, set())
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["post_key"], "VAR001")
+        self.assertEqual(results[0]["source_sheet_id"], "sheet_1")
+
+
 class TestScanAllSheetsSkipsExistingUrls(unittest.TestCase):
-    """existing_urls에 이미 있는 URL은 건너뛰는지 확인"""
+    """existing_keys에 이미 있는 포스트는 URL 형태가 달라도 건너뛰는지 확인"""
 
     def test_scan_all_sheets_skips_existing_urls(self):
         mock_client = MagicMock()
@@ -139,17 +194,186 @@ class TestScanAllSheetsSkipsExistingUrls(unittest.TestCase):
             {"id": "sheet_exist", "name": "[KOREANERS] 온리프 진행"}
         ]
         mock_client.get_sheet_tabs.return_value = ["Sheet1"]
-        existing_url = "https://www.instagram.com/reel/EXISTING001/"
-        mock_client.read_tab.return_value = [
+        mock_client.read_tabs.return_value = [[
             ["이름", "ID", "링크"],
-            ["기존크리에이터", "@existing_creator", existing_url],
-        ]
+            ["기존크리에이터", "@existing_creator", "https://www.instagram.com/p/EXISTING001/?igsh=abc"],
+        ]]
 
-        results = scan_all_sheets(mock_client, {existing_url})
+        results = scan_all_sheets(mock_client, {"EXISTING001"})
 
         # 이미 존재하는 URL이므로 결과 없음
         self.assertEqual(results, [])
 
 
+class TestScanAllSheetsBatchReadsTabs(unittest.TestCase):
+    """시트당 탭 목록 1회 + batchGet 1회로 모든 탭을 읽는지 확인"""
+
+    def test_scan_all_sheets_batch_reads_tabs(self):
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": "sheet_multi", "name": "[KOREANERS] 트리밍버드 인플루언서 리스트"}
+        ]
+        mock_client.get_sheet_tabs.return_value = ["1차", "2차"]
+        mock_client.read_tabs.return_value = [
+            [["ID", "링크"], ["@first", "https://www.instagram.com/reel/TAB001/"]],
+            [["ID", "링크"], ["@second", "https://www.instagram.com/p/TAB002/"]],
+        ]
+
+        results = scan_all_sheets(mock_client, set())
+
+        mock_client.read_tabs.assert_called_once_with(
+            "sheet_multi", ["'1차'!A:Z", "'2차'!A:Z"]
+        )
+        mock_client.read_tab.assert_not_called()
+        self.assertEqual(
+            [r["post_url"] for r in results],
+            [
+                "https://www.instagram.com/reel/TAB001/",
+                "https://www.instagram.com/p/TAB002/",
+            ],
+        )
+
+    def test_scan_all_sheets_falls_back_to_per_tab_reads(self):
+        """batchGet 실패 시 탭별 read_tab 으로 폴백하고 실패 탭만 건너뛰는지 확인"""
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": "sheet_fallback", "name": "[KOREANERS] 온리프 진행"}
+        ]
+        mock_client.get_sheet_tabs.return_value = ["정상", "오류"]
+        mock_client.read_tabs.side_effect = Exception("batchGet 실패")
+        mock_client.read_tab.side_effect = [
+            [["ID", "링크"], ["@ok", "https://www.instagram.com/reel/FALLBACK1/"]],
+            Exception("탭 읽기 실패"),
+        ]
+
+        results = scan_all_sheets(mock_client, set())
+
+        self.assertEqual(mock_client.read_tab.call_count, 2)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]["ig_handle"], "@ok")
+
+
+class TestScanAllSheetsSkipsUnchangedSheets(unittest.TestCase):
+    """매니페스트 기준 변경 없는 시트는 읽지 않는지 확인"""
+
+    def test_scan_all_sheets_skips_unchanged_sheets(self):
+        url_b = "https://www.instagram.com/reel/TOUCHED01/"
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": "closed", "name": "[KOREANERS] 감자밭 진행", "modifiedTime": "2026-01-01T00:00:00Z"},
+            {"id": "active", "name": "[KOREANERS] 온리프 진행", "modifiedTime": "2026-03-31T00:00:00Z"},
+        ]
+        mock_client.get_sheet_tabs.return_value = ["Sheet1"]
+        mock_client.read_tabs.return_value = [[["ID", "링크"], ["@b", url_b]]]
+
+        manifest = ScanManifest()
+        manifest.update({"id": "closed", "modifiedTime": "2026-01-01T00:00:00Z"}, ["UNCHANGED1"])
+
+        results = scan_all_sheets(mock_client, {"UNCHANGED1"}, manifest=manifest)
+
+        mock_client.read_tabs.assert_called_once_with("active", ["'Sheet1'!A:Z"])
+        self.assertEqual([r["post_url"] for r in results], [url_b])
+        self.assertTrue(
+            manifest.is_unchanged(
+                {"id": "active", "modifiedTime": "2026-03-31T00:00:00Z"},
+                {"UNCHANGED1", "TOUCHED01"},
+            )
+        )
+
+    def test_partially_read_sheet_is_not_recorded(self):
+        """탭 읽기에 실패한 시트는 매니페스트에 기록하지 않음"""
+        mock_client = MagicMock()
+        sheet = {"id": "flaky", "name": "[KOREANERS] 온리프 진행", "modifiedTime": "2026-03-31T00:00:00Z"}
+        mock_client.list_drive_sheets.return_value = [sheet]
+        mock_client.get_sheet_tabs.return_value = ["Sheet1"]
+        mock_client.read_tabs.side_effect = Exception("batchGet 실패")
+        mock_client.read_tab.side_effect = Exception("탭 읽기 실패")
+
+        manifest = ScanManifest()
+        scan_all_sheets(mock_client, set(), manifest=manifest)
+
+        self.assertFalse(manifest.is_unchanged(sheet, set()))
+
+
+class TestScanAllSheetsConcurrentMatchesSerial(unittest.TestCase):
+    """동시 스캔 결과가 직렬 스캔과 같은 순서/중복 제거 결과인지 확인"""
+
+    def _make_client(self):
+        import time
+
+        shared_url = "https://www.instagram.com/reel/SHARED001/"
+        sheet_rows = {
+            f"sheet_{i}": [
+                ["ID", "링크"],
+                [f"@creator_{i}", f"https://www.instagram.com/reel/OWN{i:03d}/"],
+                ["@shared", shared_url],
+            ]
+            for i in range(8)
+        }
+
+        def read_tabs(sheet_id, ranges):
+            # 앞쪽 시트가 늦게 끝나도록 지연 — 완료 순서와 무관하게 병합되어야 함
+            time.sleep(0.002 * (8 - int(sheet_id.split("_")[1])))
+            return [sheet_rows[sheet_id]]
+
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": sheet_id, "name": f"[KOREANERS] 브랜드{sheet_id} 진행"}
+            for sheet_id in sheet_rows
+        ]
+        mock_client.get_sheet_tabs.return_value = ["Sheet1"]
+        mock_client.read_tabs.side_effect = read_tabs
+        return mock_client
+
+    def test_concurrent_scan_matches_serial(self):
+        serial = scan_all_sheets(self._make_client(), set(), workers=1)
+        concurrent = scan_all_sheets(self._make_client(), set(), workers=4)
+
+        self.assertEqual(concurrent, serial)
+        # 공유 URL은 첫 번째 시트 소속으로 1건만
+        shared = [r for r in concurrent if r["ig_handle"] == "@shared"]
+        self.assertEqual(len(shared), 1)
+        self.assertEqual(shared[0]["source_sheet_id"], "sheet_0")
+
+
+class TestIterNewEntriesStreamsPerSheet(unittest.TestCase):
+    """첫 시트 엔트리를 나머지 시트를 읽기 전에 내보내는지 확인"""
+
+    def _make_client(self, n_sheets):
+        mock_client = MagicMock()
+        mock_client.list_drive_sheets.return_value = [
+            {"id": f"sheet_{i}", "name": "[KOREANERS] 감자밭 진행"} for i in range(n_sheets)
+        ]
+        mock_client.get_sheet_tabs.return_value = ["Sheet1"]
+        mock_client.read_tabs.side_effect = lambda sheet_id, ranges: [
+            [["ID", "링크"], ["@c", f"https://www.instagram.com/reel/{sheet_id}/"]]
+        ]
+        return mock_client
+
+    def test_iter_new_entries_is_lazy(self):
+        mock_client = self._make_client(3)
+
+        entries = iter_new_entries(mock_client, set())
+        first = next(entries)
+
+        self.assertEqual(first["source_sheet_id"], "sheet_0")
+        self.assertEqual(mock_client.read_tabs.call_count, 1)
+        self.assertEqual(len(list(entries)), 2)
+        self.assertEqual(mock_client.read_tabs.call_count, 3)
+
+    def test_iter_new_entries_bounds_read_ahead(self):
+        """동시 스캔 시 미리 읽는 시트 수가 workers * 2 로 제한되는지 확인"""
+        import time
+
+        mock_client = self._make_client(20)
+
+        entries = iter_new_entries(mock_client, set(), workers=2)
+        next(entries)
+        time.sleep(0.05)
+
+        self.assertLessEqual(mock_client.read_tabs.call_count, 2 * 2 + 1)
+        entries.close()
+
+
 if __name__ == "__main__":
     unittest.main()
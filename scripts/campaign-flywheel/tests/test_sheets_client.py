@@ -20,6 +20,59 @@ def _make_client(mock_sheets=None, mock_drive=None):
         return SheetsClient(), mock_sheets, mock_drive
 
 
+class TestSharedServiceFactory(unittest.TestCase):
+    """인증 정보/서비스 객체 재사용 테스트"""
+
+    def setUp(self):
+        import threading
+        import sheets_client
+
+        sheets_client._credentials_cache.clear()
+        sheets_client._thread_state = threading.local()
+
+    def test_credentials_loaded_once(self):
+        """서비스 계정 JSON은 프로세스당 한 번만 읽음"""
+        import sheets_client
+
+        with patch.dict(os.environ, {"GOOGLE_SERVICE_ACCOUNT_JSON": "/tmp/sa.json"}), \
+             patch.object(
+                 sheets_client.service_account.Credentials, "from_service_account_file"
+             ) as load:
+            first = sheets_client._get_credentials()
+            second = sheets_client._get_credentials()
+
+        load.assert_called_once_with("/tmp/sa.json", scopes=sheets_client.SCOPES)
+        self.assertIs(first, second)
+
+    def test_services_built_once_per_thread_with_static_discovery(self):
+        import threading
+        import sheets_client
+
+        with patch.object(sheets_client, "_get_authorized_http", return_value="http"), \
+             patch.object(sheets_client, "build", side_effect=lambda *a, **k: object()) as build:
+            main_first = sheets_client.build_sheets_service()
+            main_second = sheets_client.build_sheets_service()
+
+            other: list = []
+            t = threading.Thread(target=lambda: other.append(sheets_client.build_sheets_service()))
+            t.start()
+            t.join()
+
+        self.assertIs(main_first, main_second)
+        self.assertIsNot(main_first, other[0])
+        self.assertEqual(build.call_count, 2)
+        build.assert_called_with(
+            "sheets", "v4", http="http", static_discovery=True, cache_discovery=False
+        )
+
+    def test_missing_env_raises(self):
+        import sheets_client
+
+        with patch.dict(os.environ, {}, clear=True):
+            with self.assertRaises(EnvironmentError):
+                sheets_client._get_credentials()
+
+
 class TestReadTab(unittest.TestCase):
     """read_tab 메서드 테스트"""
 
@@ -69,6 +122,177 @@ class TestReadTab(unittest.TestCase):
         )
 
 
+class TestReadTabs(unittest.TestCase):
+    """read_tabs 메서드 테스트"""
+
+    def test_read_tabs_returns_rows_per_range(self):
+        """batchGet 응답을 ranges 순서대로 반환하는지 확인"""
+        mock_sheets = MagicMock()
+        mock_sheets.spreadsheets().values().batchGet().execute.return_value = {
+            "valueRanges": [
+                {"range": "'A'!A1:Z2", "values": [["a1"], ["a2"]]},
+                {"range": "'B'!A1:Z1"},
+            ]
+        }
+
+        client, _, _ = _make_client(mock_sheets=mock_sheets)
+        tabs = client.read_tabs("spreadsheet_id_123", ["'A'!A:Z", "'B'!A:Z"])
+
+        self.assertEqual(tabs, [[["a1"], ["a2"]], []])
+
+    def test_read_tabs_calls_batch_get_once(self):
+        """모든 범위를 batchGet 한 번으로 요청하는지 확인"""
+        mock_sheets = MagicMock()
+        mock_sheets.spreadsheets().values().batchGet().execute.return_value = {
+            "valueRanges": []
+        }
+
+        client, mock_sheets, _ = _make_client(mock_sheets=mock_sheets)
+        tabs = client.read_tabs("my_spreadsheet", ["'A'!A:Z", "'B'!A:Z"])
+
+        mock_sheets.spreadsheets().values().batchGet.assert_called_with(
+            spreadsheetId="my_spreadsheet",
+            ranges=["'A'!A:Z", "'B'!A:Z"],
+            valueRenderOption="FORMATTED_VALUE",
+        )
+        self.assertEqual(tabs, [[], []])
+
+    def test_read_tabs_empty_ranges(self):
+        """빈 ranges면 API 호출 없이 빈 리스트 반환"""
+        client, mock_sheets, _ = _make_client()
+        self.assertEqual(client.read_tabs("my_spreadsheet", []), [])
+        mock_sheets.spreadsheets().values().batchGet.assert_not_called()
+
+
+class TestReadColumns(unittest.TestCase):
+    """read_columns 메서드 테스트"""
+
+    def test_read_columns_groups_consecutive_ranges(self):
+        """연속 칼럼을 한 범위로 묶어 COLUMNS/UNFORMATTED 로 요청하는지 확인"""
+        mock_sheets = MagicMock()
+        mock_sheets.spreadsheets().values().batchGet().execute.return_value = {
+            "valueRanges": [
+                {"values": [["code", "A1"], ["company"]]},
+                {"values": [["krw", 1000]]},
+            ]
+        }
+
+        client, mock_sheets, _ = _make_client(mock_sheets=mock_sheets)
+        columns = client.read_columns("master", "Dashboard", [3, 2, 4, 27])
+
+        mock_sheets.spreadsheets().values().batchGet.assert_called_with(
+            spreadsheetId="master",
+            ranges=["'Dashboard'!C:E", "'Dashboard'!AB:AB"],
+            majorDimension="COLUMNS",
+            valueRenderOption="UNFORMATTED_VALUE",
+            dateTimeRenderOption="SERIAL_NUMBER",
+        )
+        self.assertEqual(columns, {
+            2: ["code", "A1"],
+            3: ["company"],
+            4: [],  # 빈 칼럼은 응답에서 생략됨
+            27: ["krw", 1000],
+        })
+
+    def test_read_columns_empty(self):
+        client, mock_sheets, _ = _make_client()
+        self.assertEqual(client.read_columns("master", "Dashboard", []), {})
+        mock_sheets.spreadsheets().values().batchGet.assert_not_called()
+
+
+class TestReadRateLimiting(unittest.TestCase):
+    """읽기 요청 쿼터/재시도 처리 테스트"""
+
+    def test_read_requests_acquire_rate_limiter(self):
+        """Sheets 읽기 요청마다 토큰을 확보하는지 확인"""
+        mock_sheets = MagicMock()
+        mock_sheets.spreadsheets().values().get().execute.return_value = {}
+        mock_sheets.spreadsheets().get().execute.return_value = {}
+        limiter = MagicMock()
+
+        with patch("sheets_client.build_sheets_service", return_value=mock_sheets), \
+             patch("sheets_client.build_drive_service", return_value=MagicMock()):
+            from sheets_client import SheetsClient
+            client = SheetsClient(rate_limiter=limiter)
+
+        client.read_tab("my_spreadsheet", "A:Z")
+        client.get_sheet_tabs("my_spreadsheet")
+
+        self.assertEqual(limiter.acquire.call_count, 2)
+
+    def test_read_requests_retry_with_backoff(self):
+        """429/5xx 재시도를 위해 num_retries 를 지정하는지 확인"""
+        from config import SHEETS_MAX_RETRIES
+
+        mock_sheets = MagicMock()
+        mock_sheets.spreadsheets().values().get().execute.return_value = {}
+
+        client, mock_sheets, _ = _make_client(mock_sheets=mock_sheets)
+        client.read_tab("my_spreadsheet", "A:Z")
+
+        mock_sheets.spreadsheets().values().get().execute.assert_called_with(
+            num_retries=SHEETS_MAX_RETRIES
+        )
+
+
+class TestResponseCaching(unittest.TestCase):
+    """Drive version 기반 응답 캐시 테스트"""
+
+    def _make_cached_client(self):
+        from response_cache import ResponseCache
+
+        mock_sheets = MagicMock()
+        mock_drive = MagicMock()
+        mock_drive.files().list().execute.return_value = {
+            "files": [{"id": "sheet_1", "name": "시트", "version": "7"}],
+        }
+        cache = ResponseCache(":memory:", max_bytes=1_000_000, ttl_seconds=3600)
+        with patch("sheets_client.build_sheets_service", return_value=mock_sheets), \
+             patch("sheets_client.build_drive_service", return_value=mock_drive):
+            from sheets_client import SheetsClient
+            client = SheetsClient(cache=cache)
+        return client, mock_sheets, mock_drive
+
+    def test_read_tabs_served_from_cache_for_same_version(self):
+        client, mock_sheets, _ = self._make_cached_client()
+        batch_get = mock_sheets.spreadsheets().values().batchGet
+        batch_get().execute.return_value = {"valueRanges": [{"values": [["a"]]}]}
+        batch_get.reset_mock()
+
+        client.list_drive_sheets("folder")
+        first = client.read_tabs("sheet_1", ["'A'!A:Z"])
+        second = client.read_tabs("sheet_1", ["'A'!A:Z"])
+
+        self.assertEqual(first, second)
+        self.assertEqual(batch_get.call_count, 1)
+        self.assertEqual(client.cache_stats()["hits"], 1)
+
+    def test_new_version_invalidates(self):
+        client, mock_sheets, mock_drive = self._make_cached_client()
+        mock_sheets.spreadsheets().values().get().execute.return_value = {"values": [["a"]]}
+        get = mock_sheets.spreadsheets().values().get
+        get.reset_mock()
+
+        client.list_drive_sheets("folder")
+        client.read_tab("sheet_1", "A:Z")
+        client._remember_versions([{"id": "sheet_1", "version": "8"}])
+        client.read_tab("sheet_1", "A:Z")
+
+        self.assertEqual(get.call_count, 2)
+
+    def test_unlisted_sheet_is_not_cached(self):
+        """Drive version 을 모르는 시트는 캐시하지 않음"""
+        client, mock_sheets, _ = self._make_cached_client()
+        mock_sheets.spreadsheets().values().get().execute.return_value = {"values": []}
+        get = mock_sheets.spreadsheets().values().get
+        get.reset_mock()
+
+        client.read_tab("master_sheet", "Dashboard")
+        client.read_tab("master_sheet", "Dashboard")
+
+        self.assertEqual(get.call_count, 2)
+
+
 class TestAppendRows(unittest.TestCase):
     """append_rows 메서드 테스트"""
 
@@ -164,6 +388,18 @@ class TestListDriveSheets(unittest.TestCase):
         self.assertTrue(call_kwargs.get("supportsAllDrives"))
         self.assertTrue(call_kwargs.get("includeItemsFromAllDrives"))
 
+    def test_list_drive_sheets_requests_modified_time(self):
+        """증분 스캔용 modifiedTime/version 필드를 요청하는지 확인"""
+        mock_drive = MagicMock()
+        mock_drive.files().list().execute.return_value = {"files": []}
+
+        client, _, mock_drive = _make_client(mock_drive=mock_drive)
+        client.list_drive_sheets("folder_id_abc")
+
+        fields = mock_drive.files().list.call_args[1]["fields"]
+        self.assertIn("modifiedTime", fields)
+        self.assertIn("version", fields)
+
 
 if __name__ == "__main__":
     unittest.main()
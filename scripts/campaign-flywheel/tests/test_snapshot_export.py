@@ -0,0 +1,63 @@
+"""snapshot_export 테스트"""
+from __future__ import annotations
+
+import csv
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# campaign-flywheel 디렉토리를 sys.path에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import snapshot_export
+from snapshot_export import iter_snapshots, write_columnar
+
+
+def _paged_client(pages: list[list[dict]]) -> MagicMock:
+    """range().execute().data 가 pages 를 순서대로 반환하는 supabase mock"""
+    client = MagicMock()
+    query = client.table.return_value.select.return_value
+    query.gte.return_value = query
+    query.order.return_value = query
+    query.range.return_value.execute.side_effect = [MagicMock(data=p) for p in pages]
+    return client
+
+
+class TestIterSnapshots(unittest.TestCase):
+    """페이지가 가득 차 있는 동안 다음 페이지를 조회"""
+
+    def test_paginates_until_short_page(self):
+        client = _paged_client([[{"post_url": "a"}, {"post_url": "b"}], [{"post_url": "c"}]])
+
+        rows = list(iter_snapshots(client, since="2026-10-01", page_size=2))
+
+        self.assertEqual([r["post_url"] for r in rows], ["a", "b", "c"])
+        query = client.table.return_value.select.return_value
+        query.gte.assert_called_with("collected_at", "2026-10-01")
+        self.assertEqual(
+            [c.args for c in query.range.call_args_list], [(0, 1), (2, 3)]
+        )
+
+
+class TestWriteColumnar(unittest.TestCase):
+    """pyarrow 미설치 시 CSV로 폴백"""
+
+    def test_csv_fallback(self):
+        rows = [{"post_url": "a", "collected_at": "2026-10-01T00:00:00Z", "views": 10,
+                 "views_delta": 10}]
+        with tempfile.TemporaryDirectory() as tmp, \
+                patch.object(snapshot_export, "PARQUET_AVAILABLE", False):
+            path = write_columnar(rows, Path(tmp) / "out.parquet")
+
+            self.assertEqual(path.suffix, ".csv")
+            with open(path, encoding="utf-8") as f:
+                written = list(csv.DictReader(f))
+        self.assertEqual(written[0]["post_url"], "a")
+        self.assertEqual(written[0]["views_delta"], "10")
+
+
+if __name__ == "__main__":
+    unittest.main()
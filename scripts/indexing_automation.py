@@ -78,7 +78,11 @@ class IndexingAutomation:
                 self.credentials_file,
                 scopes=SCOPES
             )
-            self.service = build('indexing', 'v3', credentials=credentials)
+            # 패키지 내장 discovery 문서 사용 — 네트워크/파일 캐시 조회 생략
+            self.service = build(
+                'indexing', 'v3', credentials=credentials,
+                static_discovery=True, cache_discovery=False,
+            )
             logger.info("✅ Google Indexing API 인증 성공")
         except Exception as e:
             logger.error(f"❌ 인증 실패: {e}")
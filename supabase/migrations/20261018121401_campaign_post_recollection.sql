@@ -0,0 +1,81 @@
+-- ============================================
+-- Campaign Post Re-collection Schedule + Snapshots
+-- Date: 2026-10-18
+-- ============================================
+-- 포스트 지표를 게시 후 1/3/7/14/30일 시점에 다시 수집하기 위한 스케줄 칼럼과
+-- 수집 시점별 지표 스냅샷 테이블
+
+-- 1. campaign_posts 재수집 스케줄
+--    recollect_stage: 완료한 재수집 구간 수 (0 = 최초 수집만 완료)
+--    next_recollect_at: 다음 재수집 예정 시각 (NULL = 스케줄 종료)
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS recollect_stage SMALLINT NOT NULL DEFAULT 0;
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS next_recollect_at TIMESTAMPTZ DEFAULT (NOW() + INTERVAL '1 day');
+
+-- 기존 포스트: 이미 지난 구간은 완료 처리하고 현재 경과일 다음 구간부터 스케줄
+--   마지막 구간(30일)을 지난 포스트는 스케줄 종료 (과거 이력 전체가 한꺼번에
+--   밀려 신규 포스트의 1/3/7일 재수집을 막지 않도록)
+--   규칙은 recollector.schedule_after_refresh(), 구간은 config.RECOLLECT_AGE_BUCKETS_DAYS 와 동일
+WITH buckets AS (
+  SELECT ARRAY[1, 3, 7, 14, 30] AS days
+),
+schedule AS (
+  SELECT
+    p.id,
+    b.days,
+    (
+      SELECT COUNT(*)::SMALLINT
+      FROM unnest(b.days) AS d
+      WHERE p.created_at <= NOW() - make_interval(days => d)
+    ) AS stage
+  FROM campaign_posts p
+  CROSS JOIN buckets b
+  WHERE p.recollect_stage = 0 AND p.next_recollect_at IS NOT NULL
+)
+UPDATE campaign_posts p
+SET
+  recollect_stage = s.stage,
+  next_recollect_at = CASE
+    WHEN s.stage >= array_length(s.days, 1) THEN NULL
+    ELSE p.created_at + make_interval(days => s.days[s.stage + 1])
+  END
+FROM schedule s
+WHERE p.id = s.id;
+
+CREATE INDEX IF NOT EXISTS idx_campaign_posts_next_recollect_at
+  ON campaign_posts(next_recollect_at)
+  WHERE next_recollect_at IS NOT NULL;
+
+-- 2. campaign_post_snapshots 테이블 (수집 시점별 지표, append-only)
+CREATE TABLE IF NOT EXISTS campaign_post_snapshots (
+  id UUID DEFAULT gen_random_uuid() PRIMARY KEY,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+  post_url TEXT NOT NULL,
+  views INTEGER,
+  likes INTEGER,
+  shares INTEGER,
+  comments INTEGER,
+  collected_at TIMESTAMPTZ NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_campaign_post_snapshots_post_url_collected_at
+  ON campaign_post_snapshots(post_url, collected_at);
+
+-- campaign_post_snapshots RLS
+ALTER TABLE campaign_post_snapshots ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "public_read_campaign_post_snapshots" ON campaign_post_snapshots;
+CREATE POLICY "public_read_campaign_post_snapshots" ON campaign_post_snapshots
+  FOR SELECT USING (true);
+
+DROP POLICY IF EXISTS "service_write_campaign_post_snapshots" ON campaign_post_snapshots;
+CREATE POLICY "service_write_campaign_post_snapshots" ON campaign_post_snapshots
+  FOR ALL USING (true);
+
+-- 3. campaign_posts 마지막 수집 시각
+--    collected_at 은 최초 수집 시각을 유지하고 (기간별 활동 집계 기준),
+--    재수집 시각은 last_collected_at 에 기록
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS last_collected_at TIMESTAMPTZ;
+
+UPDATE campaign_posts
+SET last_collected_at = collected_at
+WHERE last_collected_at IS NULL;
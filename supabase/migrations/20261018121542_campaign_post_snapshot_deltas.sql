@@ -0,0 +1,16 @@
+-- ============================================
+-- Campaign Post Snapshots: metric deltas
+-- Date: 2026-10-18
+-- ============================================
+-- 스냅샷은 지표가 바뀐 수집 시점에만 추가하고, 직전 스냅샷 대비 증감을 함께 저장
+-- (증가율 계산 시 이전 행을 조인하지 않도록)
+-- 최초 스냅샷의 delta 는 수집값 자체
+
+ALTER TABLE campaign_post_snapshots ADD COLUMN IF NOT EXISTS views_delta INTEGER;
+ALTER TABLE campaign_post_snapshots ADD COLUMN IF NOT EXISTS likes_delta INTEGER;
+ALTER TABLE campaign_post_snapshots ADD COLUMN IF NOT EXISTS shares_delta INTEGER;
+ALTER TABLE campaign_post_snapshots ADD COLUMN IF NOT EXISTS comments_delta INTEGER;
+
+-- 기간별 내보내기/집계용
+CREATE INDEX IF NOT EXISTS idx_campaign_post_snapshots_collected_at
+  ON campaign_post_snapshots(collected_at);
@@ -0,0 +1,41 @@
+-- ============================================
+-- Campaign Posts: collection status
+-- Date: 2026-10-18
+-- ============================================
+-- 수집 실패/누락 포스트를 0 지표 대신 상태값으로 구분
+--   collected: 지표 수집 성공
+--   failed:    Apify run 이 재시도/분할 후에도 실패
+--   missing:   run 은 성공했으나 결과에 URL 없음 (삭제/비공개 등)
+-- 수집하지 못한 포스트의 지표는 NULL (집계 시 0 으로 취급)
+
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS collection_status TEXT;
+
+-- 기존 행: 수집 시각이 있으면 수집 성공, 없으면 실패한 수집이 0 으로 기록된 행이므로
+-- 실패로 표시하고 가짜 0 지표를 NULL 로 되돌림
+UPDATE campaign_posts
+SET collection_status = 'collected'
+WHERE collection_status IS NULL AND collected_at IS NOT NULL;
+
+UPDATE campaign_posts
+SET collection_status = 'failed', views = NULL, likes = NULL, shares = NULL, comments = NULL
+WHERE collection_status IS NULL AND collected_at IS NULL;
+
+ALTER TABLE campaign_posts
+  DROP CONSTRAINT IF EXISTS campaign_posts_collection_status_check;
+ALTER TABLE campaign_posts
+  ADD CONSTRAINT campaign_posts_collection_status_check
+  CHECK (collection_status IN ('collected', 'failed', 'missing'));
+
+-- 마지막 재수집 시도 결과 (재수집 실패 시 collection_status·지표는 이전 수집 결과 유지)
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS last_recollect_status TEXT
+  CHECK (last_recollect_status IN ('collected', 'failed', 'missing'));
+
+-- 지표 NULL 허용 (실패 포스트를 실제 0 과 구분)
+ALTER TABLE campaign_posts ALTER COLUMN views DROP DEFAULT;
+ALTER TABLE campaign_posts ALTER COLUMN likes DROP DEFAULT;
+ALTER TABLE campaign_posts ALTER COLUMN shares DROP DEFAULT;
+ALTER TABLE campaign_posts ALTER COLUMN comments DROP DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_campaign_posts_collection_failed
+  ON campaign_posts(collection_status)
+  WHERE collection_status <> 'collected';
@@ -0,0 +1,59 @@
+-- ============================================
+-- Campaign Posts: canonical post key
+-- Date: 2026-10-18
+-- ============================================
+-- 같은 포스트의 URL 변형(/reel/ · /reels/ · /p/ · /tv/, ?igsh= 쿼리, 끝 슬래시,
+-- 사용자명 접두 경로)을 하나의 키로 묶어 upsert 기준으로 사용
+--   포스트/릴스/IGTV: shortcode (대소문자 구분)
+--   스토리: stories/{사용자명 소문자}[/{스토리 ID}]
+--   그 외: 끝 슬래시 제거 + 소문자 URL
+-- 규칙은 scripts/campaign-flywheel/identity.py canonical_post_key() 와 동일
+
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS post_key TEXT;
+
+UPDATE campaign_posts
+SET post_key = COALESCE(
+  substring(post_url from '(?i)instagram\.com/(?:[\w.]+/)?(?:reels?|p|tv)/([\w-]+)'),
+  'stories/' || lower(substring(post_url from '(?i)instagram\.com/stories/([\w.]+)'))
+    || COALESCE('/' || substring(post_url from '(?i)instagram\.com/stories/[\w.]+/(\d+)'), ''),
+  lower(rtrim(post_url, '/'))
+)
+WHERE post_key IS NULL;
+
+-- 중복 포스트 정리: 가장 최근 수집된 행만 남기고, 스냅샷은 남는 행의 post_url 로 이동
+WITH ranked AS (
+  SELECT
+    post_url,
+    row_number() OVER w AS rn,
+    first_value(post_url) OVER w AS keep_url
+  FROM campaign_posts
+  WINDOW w AS (
+    PARTITION BY post_key
+    ORDER BY collected_at DESC NULLS LAST, created_at DESC, id DESC
+  )
+)
+UPDATE campaign_post_snapshots s
+SET post_url = r.keep_url
+FROM ranked r
+WHERE r.rn > 1 AND s.post_url = r.post_url;
+
+WITH ranked AS (
+  SELECT
+    id,
+    row_number() OVER (
+      PARTITION BY post_key
+      ORDER BY collected_at DESC NULLS LAST, created_at DESC, id DESC
+    ) AS rn
+  FROM campaign_posts
+)
+DELETE FROM campaign_posts p
+USING ranked r
+WHERE p.id = r.id AND r.rn > 1;
+
+ALTER TABLE campaign_posts ALTER COLUMN post_key SET NOT NULL;
+
+-- upsert(on_conflict=post_key) 기준
+ALTER TABLE campaign_posts
+  DROP CONSTRAINT IF EXISTS campaign_posts_post_key_key;
+ALTER TABLE campaign_posts
+  ADD CONSTRAINT campaign_posts_post_key_key UNIQUE (post_key);
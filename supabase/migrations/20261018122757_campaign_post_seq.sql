@@ -0,0 +1,12 @@
+-- ============================================
+-- Campaign Posts: monotonic sequence for incremental key loading
+-- Date: 2026-10-18
+-- ============================================
+-- 수집 파이프라인이 기존 포스트 키 인덱스를 로컬에 캐시하고
+-- "마지막으로 본 seq 이후" 행만 keyset 페이지네이션으로 가져오기 위한 증가 ID
+-- (id 는 UUID, created_at 은 일괄 upsert 시 같은 값이라 커서로 쓸 수 없음)
+-- 기존 행에도 값이 채워짐
+
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS seq BIGINT GENERATED ALWAYS AS IDENTITY;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_campaign_posts_seq ON campaign_posts(seq);
@@ -0,0 +1,9 @@
+-- ============================================
+-- Campaign Financials: content hash for change detection
+-- Date: 2026-10-18
+-- ============================================
+-- 재무 동기화가 Dashboard 전체 행을 매번 upsert 하지 않도록
+-- 마지막으로 기록한 레코드 내용의 SHA-256 을 저장 (insight_writer.financial_record_hash)
+-- 기존 행은 NULL 이므로 다음 동기화에서 한 번 갱신됨
+
+ALTER TABLE campaign_financials ADD COLUMN IF NOT EXISTS content_hash TEXT;
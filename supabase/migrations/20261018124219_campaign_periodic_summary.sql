@@ -0,0 +1,81 @@
+-- ============================================
+-- Campaign Periodic Review: summary RPC
+-- Date: 2026-10-18
+-- ============================================
+-- 정기 리뷰(run_review.py)가 campaign_financials / campaign_posts 전체 행을
+-- 내려받아 Python 에서 집계하던 것을 DB 안에서 계산해 요약 JSON 하나만 반환
+--
+-- 크리에이터 키: ig_handle, 없으면 creator_name (빈 문자열은 없는 것으로 취급)
+-- returning 크리에이터: 당기 이전(collected_at < 당기 시작)에 포스트가 있던 크리에이터
+-- new/returning 브랜드: 전기(당기 직전 같은 길이 기간) 재무 레코드 기준
+
+-- 과거 포스트 존재 확인(EXISTS)용 크리에이터 키 표현식 인덱스
+CREATE INDEX IF NOT EXISTS idx_campaign_posts_creator_key
+  ON campaign_posts ((COALESCE(NULLIF(ig_handle, ''), NULLIF(creator_name, ''))), collected_at);
+
+CREATE OR REPLACE FUNCTION campaign_periodic_summary(
+  p_period_start DATE,
+  p_prev_period_start DATE,
+  p_active_statuses TEXT[]
+) RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  WITH cur_fin AS (
+    SELECT status, brand_name, contract_amount_krw, margin_krw
+    FROM campaign_financials
+    WHERE start_date >= p_period_start
+  ),
+  prev_fin AS (
+    SELECT brand_name, contract_amount_krw, margin_krw
+    FROM campaign_financials
+    WHERE start_date >= p_prev_period_start
+      AND start_date < p_period_start
+  ),
+  cur_creators AS (
+    SELECT DISTINCT COALESCE(NULLIF(ig_handle, ''), NULLIF(creator_name, '')) AS creator
+    FROM campaign_posts
+    WHERE collected_at >= p_period_start
+      AND COALESCE(NULLIF(ig_handle, ''), NULLIF(creator_name, '')) IS NOT NULL
+  ),
+  returning_creators AS (
+    SELECT c.creator
+    FROM cur_creators c
+    WHERE EXISTS (
+      SELECT 1
+      FROM campaign_posts p
+      WHERE COALESCE(NULLIF(p.ig_handle, ''), NULLIF(p.creator_name, '')) = c.creator
+        AND p.collected_at < p_period_start
+    )
+  ),
+  cur_brands AS (
+    SELECT DISTINCT brand_name FROM cur_fin WHERE brand_name <> ''
+  ),
+  prev_brands AS (
+    SELECT DISTINCT brand_name FROM prev_fin WHERE brand_name <> ''
+  )
+  SELECT jsonb_build_object(
+    'total_campaigns', (SELECT COUNT(*) FROM cur_fin),
+    'active_campaigns', (SELECT COUNT(*) FROM cur_fin WHERE status = ANY (p_active_statuses)),
+    'total_contract_krw', (SELECT COALESCE(SUM(contract_amount_krw), 0) FROM cur_fin),
+    'total_margin_krw', (SELECT COALESCE(SUM(margin_krw), 0) FROM cur_fin),
+    'prev_period', jsonb_build_object(
+      'total_campaigns', (SELECT COUNT(*) FROM prev_fin),
+      'total_contract_krw', (SELECT COALESCE(SUM(contract_amount_krw), 0) FROM prev_fin),
+      'total_margin_krw', (SELECT COALESCE(SUM(margin_krw), 0) FROM prev_fin)
+    ),
+    'creator_pool_stats', jsonb_build_object(
+      'total', (SELECT COUNT(*) FROM cur_creators),
+      'new', (SELECT COUNT(*) FROM cur_creators) - (SELECT COUNT(*) FROM returning_creators),
+      'returning', (SELECT COUNT(*) FROM returning_creators)
+    ),
+    'brand_stats', jsonb_build_object(
+      'total', (SELECT COUNT(*) FROM cur_brands),
+      'new', (SELECT COUNT(*) FROM cur_brands WHERE brand_name NOT IN (SELECT brand_name FROM prev_brands)),
+      'returning', (SELECT COUNT(*) FROM cur_brands WHERE brand_name IN (SELECT brand_name FROM prev_brands))
+    )
+  );
+$$;
+
+COMMENT ON FUNCTION campaign_periodic_summary(DATE, DATE, TEXT[]) IS
+  '정기 리뷰 요약 (당기/전기 재무 합계, 활성 캠페인 수, 신규/재참여 크리에이터·브랜드 수)';
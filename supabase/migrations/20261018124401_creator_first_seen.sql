@@ -0,0 +1,123 @@
+-- ============================================
+-- Creator first-seen index
+-- Date: 2026-10-18
+-- ============================================
+-- 크리에이터별 최초 포스트 수집 시각을 별도 테이블로 유지해, 정기 리뷰의
+-- 신규/재참여 크리에이터 집계가 과거 campaign_posts 전체를 훑지 않고
+-- creator_first_seen 키 조회로 끝나도록 함
+--
+-- creator_key: ig_handle(앞뒤 공백·@ 접두 제거, 소문자), 없으면 creator_name(앞뒤 공백 제거, 소문자)
+-- 규칙은 scripts/campaign-flywheel/identity.py normalize_creator_key() 와 동일
+-- first_seen_at: 수집된(collected_at IS NOT NULL) 포스트 중 가장 이른 collected_at
+--   collected_at 은 최초 수집 시각이며 재수집으로 바뀌지 않음 (재수집 시각은 last_collected_at)
+--   정기 리뷰 RPC 의 당기 크리에이터(collected_at 기준)와 같은 시각 기준
+-- 이후 행은 insight_writer.write_to_supabase() / write_recollected_to_supabase() 가
+-- 수집된 포스트를 기록할 때 같은 규칙으로 함께 추가 (이미 있는 키는 무시)
+
+-- 1. campaign_posts.creator_key
+ALTER TABLE campaign_posts ADD COLUMN IF NOT EXISTS creator_key TEXT;
+
+UPDATE campaign_posts
+SET creator_key = COALESCE(
+  NULLIF(lower(ltrim(btrim(ig_handle, E' \t\r\n'), '@')), ''),
+  NULLIF(lower(btrim(creator_name, E' \t\r\n')), '')
+)
+WHERE creator_key IS NULL;
+
+-- 기간 내 크리에이터 집계용 (이전 표현식 인덱스 대체)
+DROP INDEX IF EXISTS idx_campaign_posts_creator_key;
+CREATE INDEX IF NOT EXISTS idx_campaign_posts_collected_creator
+  ON campaign_posts(collected_at, creator_key);
+
+-- 2. creator_first_seen 테이블
+CREATE TABLE IF NOT EXISTS creator_first_seen (
+  creator_key TEXT PRIMARY KEY,
+  first_seen_at TIMESTAMPTZ NOT NULL,
+  ig_handle TEXT,
+  creator_name TEXT,
+  created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_creator_first_seen_first_seen_at
+  ON creator_first_seen(first_seen_at);
+
+-- 기존 포스트로 백필 (수집된 포스트만, 크리에이터별 가장 이른 collected_at)
+INSERT INTO creator_first_seen (creator_key, first_seen_at, ig_handle, creator_name)
+SELECT DISTINCT ON (creator_key)
+  creator_key, collected_at, ig_handle, creator_name
+FROM campaign_posts
+WHERE creator_key IS NOT NULL AND collected_at IS NOT NULL
+ORDER BY creator_key, collected_at
+ON CONFLICT (creator_key) DO NOTHING;
+
+-- creator_first_seen RLS
+ALTER TABLE creator_first_seen ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "public_read_creator_first_seen" ON creator_first_seen;
+CREATE POLICY "public_read_creator_first_seen" ON creator_first_seen
+  FOR SELECT USING (true);
+
+DROP POLICY IF EXISTS "service_write_creator_first_seen" ON creator_first_seen;
+CREATE POLICY "service_write_creator_first_seen" ON creator_first_seen
+  FOR ALL USING (true);
+
+-- 3. 정기 리뷰 요약 RPC: returning 크리에이터를 creator_first_seen 으로 판정
+CREATE OR REPLACE FUNCTION campaign_periodic_summary(
+  p_period_start DATE,
+  p_prev_period_start DATE,
+  p_active_statuses TEXT[]
+) RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+  WITH cur_fin AS (
+    SELECT status, brand_name, contract_amount_krw, margin_krw
+    FROM campaign_financials
+    WHERE start_date >= p_period_start
+  ),
+  prev_fin AS (
+    SELECT brand_name, contract_amount_krw, margin_krw
+    FROM campaign_financials
+    WHERE start_date >= p_prev_period_start
+      AND start_date < p_period_start
+  ),
+  cur_creators AS (
+    SELECT DISTINCT creator_key
+    FROM campaign_posts
+    WHERE collected_at >= p_period_start
+      AND creator_key IS NOT NULL
+  ),
+  returning_creators AS (
+    SELECT c.creator_key
+    FROM cur_creators c
+    JOIN creator_first_seen f USING (creator_key)
+    WHERE f.first_seen_at < p_period_start
+  ),
+  cur_brands AS (
+    SELECT DISTINCT brand_name FROM cur_fin WHERE brand_name <> ''
+  ),
+  prev_brands AS (
+    SELECT DISTINCT brand_name FROM prev_fin WHERE brand_name <> ''
+  )
+  SELECT jsonb_build_object(
+    'total_campaigns', (SELECT COUNT(*) FROM cur_fin),
+    'active_campaigns', (SELECT COUNT(*) FROM cur_fin WHERE status = ANY (p_active_statuses)),
+    'total_contract_krw', (SELECT COALESCE(SUM(contract_amount_krw), 0) FROM cur_fin),
+    'total_margin_krw', (SELECT COALESCE(SUM(margin_krw), 0) FROM cur_fin),
+    'prev_period', jsonb_build_object(
+      'total_campaigns', (SELECT COUNT(*) FROM prev_fin),
+      'total_contract_krw', (SELECT COALESCE(SUM(contract_amount_krw), 0) FROM prev_fin),
+      'total_margin_krw', (SELECT COALESCE(SUM(margin_krw), 0) FROM prev_fin)
+    ),
+    'creator_pool_stats', jsonb_build_object(
+      'total', (SELECT COUNT(*) FROM cur_creators),
+      'new', (SELECT COUNT(*) FROM cur_creators) - (SELECT COUNT(*) FROM returning_creators),
+      'returning', (SELECT COUNT(*) FROM returning_creators)
+    ),
+    'brand_stats', jsonb_build_object(
+      'total', (SELECT COUNT(*) FROM cur_brands),
+      'new', (SELECT COUNT(*) FROM cur_brands WHERE brand_name NOT IN (SELECT brand_name FROM prev_brands)),
+      'returning', (SELECT COUNT(*) FROM cur_brands WHERE brand_name IN (SELECT brand_name FROM prev_brands))
+    )
+  );
+$$;